@@ -0,0 +1,19 @@
+# =============================================================
+# 📦 src/__init__.py — Paquete del proyecto
+# -------------------------------------------------------------
+# Los módulos se importan entre sí como módulos de primer nivel
+# (`from utils import ...`), igual que desde los notebooks. Al importar
+# el paquete se añade su carpeta al sys.path, de modo que desde la raíz
+# del proyecto funcionan `python -m src ...` e `import src.cli` sin
+# tocar sys.path a mano.
+#
+# Ningún módulo importa matplotlib, seaborn, scipy.stats, janitor ni
+# IPython al cargarse: se importan dentro de las funciones que los usan.
+# =============================================================
+
+import sys
+from pathlib import Path
+
+_RUTA_SRC = str(Path(__file__).resolve().parent)
+if _RUTA_SRC not in sys.path:
+    sys.path.append(_RUTA_SRC)
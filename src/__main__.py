@@ -0,0 +1,7 @@
+# =============================================================
+# 📦 src/__main__.py — python -m src <comando>
+# =============================================================
+
+from .cli import main
+
+main()
@@ -0,0 +1,245 @@
+# =============================================================
+# ⏱️ src/benchmark.py — Benchmark por etapas del pipeline
+# -------------------------------------------------------------
+# Mide tiempo y memoria de cada etapa (carga, limpieza, feature
+# engineering, división y E/S de utils) sobre datos sintéticos de
+# distintos tamaños y compara contra una línea base guardada.
+#
+# Uso:
+#   python src/benchmark.py --filas 10000 1000000
+#   python src/benchmark.py --filas 10000 --guardar-baseline
+# =============================================================
+
+import argparse
+import gc
+import json
+import platform
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from utils import get_file_path, load_data, guardar_archivo
+from datos_sinteticos import escribir_prestamos_sinteticos
+from data_cleaning import (
+    limpiar_variables_basicas, eliminar_duplicados, imputar_nulos_categoricas,
+    imputar_nulos_numericas, detectar_atipicos_categoricos
+)
+from feature_engineering import (
+    categorias_poco_frecuentes, codificar_one_hot, codificar_ordinal, escalar_variables_numericas, marcar_impago
+)
+from modeling import matriz_caracteristicas, indices_division_escalonada
+
+TAMANOS_POR_DEFECTO = [10_000, 1_000_000, 10_000_000]
+ARCHIVO_BASELINE = "benchmark_baseline.json"
+
+
+# -------------------------------------------------------------
+# 🧩 Definición de etapas
+# -------------------------------------------------------------
+# Cada etapa recibe el estado acumulado (dict) y devuelve el nuevo
+# estado, de modo que las etapas se encadenan como en los notebooks.
+# -------------------------------------------------------------
+def _etapa_carga_csv(estado):
+    return {**estado, "df": load_data(estado["folder_key"], estado["archivo"])}
+
+
+def _etapa_limpieza_basica(estado):
+    return {**estado, "df": limpiar_variables_basicas(estado["df"])}
+
+
+def _etapa_duplicados(estado):
+    return {**estado, "df": eliminar_duplicados(estado["df"])}
+
+
+def _etapa_imputacion(estado):
+    df = estado["df"]
+    cat = imputar_nulos_categoricas(df.select_dtypes(exclude="number"))
+    num = imputar_nulos_numericas(df.select_dtypes(include="number"))
+    return {**estado, "cat": cat, "num": num}
+
+
+def _etapa_atipicos_categoricos(estado):
+    return {**estado, "atipicos": detectar_atipicos_categoricos(estado["cat"])}
+
+
+def _etapa_codificacion(estado):
+    cat = estado["cat"].copy()
+    # Mismos criterios que el notebook 04 (crear_variable_objetivo y
+    # agrupar_categorias), sin sus tablas ni gráficos
+    cat["target"] = marcar_impago(cat.pop("estado"))
+    raras = categorias_poco_frecuentes(cat["empleo"], criterio=0.5)
+    cat["empleo"] = cat["empleo"].where(~cat["empleo"].isin(raras), "OTROS")
+    cat = codificar_one_hot(cat, ["empleo", "ingresos_verificados", "vivienda", "finalidad"])
+    cat = codificar_ordinal(cat, ["rating"], [list("ABCDEFG")])
+    return {**estado, "cat": cat}
+
+
+def _etapa_escalado(estado):
+    variables = ["antiguedad_empleo", "ingresos", "dti", "porc_tarjetas_75p",
+                 "porc_uso_revolving", "num_cuotas", "imp_cuota", "principal"]
+    num = escalar_variables_numericas(estado["num"], variables)
+    return {**estado, "df_modelo": pd.concat([estado["cat"], num], axis=1)}
+
+
+def _etapa_division(estado):
+    X, y, _ = matriz_caracteristicas(estado["df_modelo"], "target")
+    return {**estado, "X": X, "y": y, "indices": indices_division_escalonada(y)}
+
+
+def _etapa_guardado_pkl(estado):
+    guardar_archivo(estado["df_modelo"], "cache", estado["archivo_pkl"], format="pkl")
+    return estado
+
+
+def _etapa_carga_pkl(estado):
+    load_data("cache", estado["archivo_pkl"])
+    return estado
+
+
+ETAPAS = [
+    ("carga_csv", _etapa_carga_csv),
+    ("limpieza_basica", _etapa_limpieza_basica),
+    ("duplicados", _etapa_duplicados),
+    ("imputacion", _etapa_imputacion),
+    ("atipicos_categoricos", _etapa_atipicos_categoricos),
+    ("codificacion", _etapa_codificacion),
+    ("escalado", _etapa_escalado),
+    ("division", _etapa_division),
+    ("guardado_pkl", _etapa_guardado_pkl),
+    ("carga_pkl", _etapa_carga_pkl),
+]
+
+
+# -------------------------------------------------------------
+# 📏 Medición de una etapa
+# -------------------------------------------------------------
+# El tiempo se mide sin tracemalloc (que penaliza las asignaciones)
+# y la memoria pico en una ejecución aparte con tracemalloc activo.
+# -------------------------------------------------------------
+def _medir_etapa(funcion, estado, repeticiones):
+    tiempos = []
+    for _ in range(repeticiones):
+        gc.collect()
+        inicio = time.perf_counter()
+        resultado = funcion(estado)
+        tiempos.append(time.perf_counter() - inicio)
+
+    gc.collect()
+    tracemalloc.start()
+    funcion(estado)
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return resultado, {"tiempo_s": min(tiempos), "memoria_pico_mb": pico / 1024 ** 2}
+
+
+# =============================================================
+# 🚀 Función: ejecutar_benchmark
+# -------------------------------------------------------------
+# ➤ Genera (o reutiliza) un CSV sintético por tamaño
+# ➤ Ejecuta todas las etapas encadenadas y mide cada una
+# ➤ Devuelve un DataFrame con una fila por (tamaño, etapa)
+# =============================================================
+def ejecutar_benchmark(tamanos: list = None, repeticiones: int = 1, etapas: list = None) -> pd.DataFrame:
+    """
+    Ejecuta el benchmark por etapas sobre datos sintéticos.
+
+    Args:
+        tamanos (list): Números de filas a evaluar (por defecto 10k, 1M y 10M).
+        repeticiones (int): Repeticiones de tiempo por etapa (se toma el mínimo).
+        etapas (list, opcional): Subconjunto de nombres de etapa a medir.
+
+    Returns:
+        pd.DataFrame: Resultados con columnas n_filas, etapa, tiempo_s, memoria_pico_mb.
+    """
+    tamanos = tamanos or TAMANOS_POR_DEFECTO
+    resultados = []
+
+    for n_filas in tamanos:
+        archivo = f"prestamos_sinteticos_{n_filas}.csv"
+        if not get_file_path("raw", archivo).exists():
+            escribir_prestamos_sinteticos(n_filas, folder_key="raw", filename=archivo)
+
+        estado = {"folder_key": "raw", "archivo": archivo, "archivo_pkl": f"benchmark_{n_filas}.pkl"}
+        print(f"\n⏱️ Benchmark con {n_filas:,} filas")
+        for nombre, funcion in ETAPAS:
+            if etapas and nombre not in etapas:
+                estado = funcion(estado)
+                continue
+            estado, metricas = _medir_etapa(funcion, estado, repeticiones)
+            resultados.append({"n_filas": n_filas, "etapa": nombre, **metricas})
+            print(f"   ➤ {nombre:<22} {metricas['tiempo_s']:>9.3f} s {metricas['memoria_pico_mb']:>10.1f} MB")
+
+    return pd.DataFrame(resultados)
+
+
+# =============================================================
+# 💾 Línea base: guardar y comparar
+# =============================================================
+def guardar_baseline(resultados: pd.DataFrame, ruta: Path = None):
+    """
+    Guarda los resultados como línea base en outputs/metrics/benchmark_baseline.json.
+    """
+    ruta = ruta or get_file_path("metrics", ARCHIVO_BASELINE)
+    ruta.parent.mkdir(parents=True, exist_ok=True)
+    contenido = {
+        "plataforma": platform.platform(),
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "numpy": np.__version__,
+        "resultados": resultados.to_dict(orient="records"),
+    }
+    ruta.write_text(json.dumps(contenido, indent=2))
+    print(f"✅ Línea base guardada en: {ruta}")
+
+
+def comparar_con_baseline(resultados: pd.DataFrame, ruta: Path = None, tolerancia: float = 1.2) -> pd.DataFrame:
+    """
+    Compara los resultados con la línea base y marca regresiones.
+
+    Args:
+        resultados (pd.DataFrame): Salida de ejecutar_benchmark().
+        ruta (Path, opcional): Archivo de línea base.
+        tolerancia (float): Ratio actual/base a partir del cual se marca regresión.
+
+    Returns:
+        pd.DataFrame: Resultados con ratios de tiempo y memoria frente a la base.
+    """
+    ruta = ruta or get_file_path("metrics", ARCHIVO_BASELINE)
+    if not ruta.exists():
+        print(f"⚠️ No existe línea base en {ruta}. Ejecuta con --guardar-baseline.")
+        return resultados
+
+    base = pd.DataFrame(json.loads(ruta.read_text())["resultados"])
+    comparacion = resultados.merge(base, on=["n_filas", "etapa"], how="left", suffixes=("", "_base"))
+    comparacion["ratio_tiempo"] = comparacion["tiempo_s"] / comparacion["tiempo_s_base"]
+    comparacion["ratio_memoria"] = comparacion["memoria_pico_mb"] / comparacion["memoria_pico_mb_base"]
+    comparacion["regresion"] = (comparacion["ratio_tiempo"] > tolerancia) | (comparacion["ratio_memoria"] > tolerancia)
+
+    print("\n📊 Comparación con la línea base:")
+    print(comparacion[["n_filas", "etapa", "tiempo_s", "ratio_tiempo",
+                       "memoria_pico_mb", "ratio_memoria", "regresion"]].round(3).to_string(index=False))
+    if comparacion["regresion"].any():
+        print(f"\n⚠️ Regresiones detectadas (> x{tolerancia}).")
+    else:
+        print("\n✅ Sin regresiones respecto a la línea base.")
+    return comparacion
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark por etapas del pipeline de préstamos.")
+    parser.add_argument("--filas", type=int, nargs="+", default=TAMANOS_POR_DEFECTO)
+    parser.add_argument("--repeticiones", type=int, default=1)
+    parser.add_argument("--etapas", nargs="+", default=None)
+    parser.add_argument("--guardar-baseline", action="store_true")
+    parser.add_argument("--tolerancia", type=float, default=1.2)
+    args = parser.parse_args()
+
+    resultados = ejecutar_benchmark(args.filas, args.repeticiones, args.etapas)
+    if args.guardar_baseline:
+        guardar_baseline(resultados)
+    else:
+        comparar_con_baseline(resultados, tolerancia=args.tolerancia)
@@ -0,0 +1,182 @@
+# =============================================================
+# ⏱️ src/benchmark_importacion.py — Arranque en frío de los comandos
+# -------------------------------------------------------------
+# Mide cuánto tarda un intérprete nuevo en importar los módulos de
+# cada comando de cli.py (MODULOS_COMANDO), restando el arranque del
+# propio Python, y qué dependencias pesadas arrastra. Cada medición es
+# un subproceso limpio: nada queda en caché de sys.modules.
+#
+# Uso (desde la raíz del proyecto):
+#   python src/benchmark_importacion.py
+#   python src/benchmark_importacion.py --repeticiones 10 --guardar-baseline
+#   python src/benchmark_importacion.py --detalle   → top por -X importtime
+# =============================================================
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+from cli import MODULOS_COMANDO
+from utils import get_file_path, get_project_root
+
+ARCHIVO_BASELINE = "benchmark_importacion_baseline.json"
+
+# Dependencias que un worker de scoring no debería cargar
+MODULOS_PESADOS = ("matplotlib", "seaborn", "scipy.stats", "janitor", "IPython", "polars")
+
+_SCRIPT_MEDICION = """
+import importlib, json, sys, time
+inicio = time.perf_counter()
+import src
+for modulo in {modulos!r}:
+    importlib.import_module(modulo)
+print(json.dumps({{
+    "tiempo_s": time.perf_counter() - inicio,
+    "n_modulos": len(sys.modules),
+    "pesados": [m for m in {pesados!r} if m in sys.modules],
+}}))
+"""
+
+
+def _ejecutar(script: str, importtime: bool = False) -> subprocess.CompletedProcess:
+    comando = [sys.executable, *(["-X", "importtime"] if importtime else []), "-c", script]
+    return subprocess.run(comando, cwd=get_project_root(), capture_output=True, text=True, check=True)
+
+
+# -------------------------------------------------------------
+# 🔍 Desglose de -X importtime
+# -------------------------------------------------------------
+# Suma el tiempo propio (self) de cada módulo por paquete de primer
+# nivel: muestra qué librerías pesan en el arranque de un comando.
+# -------------------------------------------------------------
+def desglose_importtime(comando: str, top: int = 15) -> pd.DataFrame:
+    """
+    Tiempo de importación por paquete de primer nivel para un comando.
+
+    Args:
+        comando (str): Clave de MODULOS_COMANDO.
+        top (int): Número de paquetes a devolver.
+
+    Returns:
+        pd.DataFrame: paquete, tiempo_ms (suma de tiempos propios), n_modulos.
+    """
+    script = _SCRIPT_MEDICION.format(modulos=MODULOS_COMANDO[comando], pesados=MODULOS_PESADOS)
+    filas = []
+    for linea in _ejecutar(script, importtime=True).stderr.splitlines():
+        if not linea.startswith("import time:") or "self [us]" in linea:
+            continue
+        propio, _, nombre = linea.removeprefix("import time:").split("|")
+        filas.append({"paquete": nombre.strip().split(".")[0], "tiempo_ms": int(propio) / 1000})
+
+    return (
+        pd.DataFrame(filas)
+        .groupby("paquete")
+        .agg(tiempo_ms=("tiempo_ms", "sum"), n_modulos=("tiempo_ms", "size"))
+        .sort_values("tiempo_ms", ascending=False)
+        .head(top)
+        .reset_index()
+    )
+
+
+# =============================================================
+# 🚀 Función: medir_arranque
+# -------------------------------------------------------------
+# ➤ Una fila por comando: tiempo de importación (mínimo de N
+#   intérpretes nuevos), módulos cargados y dependencias pesadas
+# =============================================================
+def medir_arranque(comandos: list = None, repeticiones: int = 5) -> pd.DataFrame:
+    """
+    Mide el arranque en frío de cada comando en subprocesos limpios.
+
+    Args:
+        comandos (list, opcional): Comandos a medir (por defecto, todos).
+        repeticiones (int): Intérpretes por comando (se toma el mínimo).
+
+    Returns:
+        pd.DataFrame: comando, tiempo_importacion_s, n_modulos, pesados.
+    """
+    resultados = []
+    for comando in comandos or list(MODULOS_COMANDO):
+        script = _SCRIPT_MEDICION.format(modulos=MODULOS_COMANDO[comando], pesados=MODULOS_PESADOS)
+        mediciones = [json.loads(_ejecutar(script).stdout.strip().splitlines()[-1]) for _ in range(repeticiones)]
+        mejor = min(mediciones, key=lambda m: m["tiempo_s"])
+        resultados.append({
+            "comando": comando,
+            "tiempo_importacion_s": mejor["tiempo_s"],
+            "n_modulos": mejor["n_modulos"],
+            "pesados": ", ".join(mejor["pesados"]) or "-",
+        })
+        print(f"   ➤ {comando:<10} {mejor['tiempo_s']:>7.3f} s {mejor['n_modulos']:>6} módulos  "
+              f"pesados: {resultados[-1]['pesados']}")
+    return pd.DataFrame(resultados)
+
+
+# =============================================================
+# 💾 Línea base: guardar y comparar
+# =============================================================
+def guardar_baseline(resultados: pd.DataFrame, ruta: Path = None):
+    """
+    Guarda los resultados como línea base en outputs/metrics/.
+    """
+    ruta = ruta or get_file_path("metrics", ARCHIVO_BASELINE)
+    ruta.parent.mkdir(parents=True, exist_ok=True)
+    contenido = {
+        "plataforma": platform.platform(),
+        "python": platform.python_version(),
+        "resultados": resultados.to_dict(orient="records"),
+    }
+    ruta.write_text(json.dumps(contenido, indent=2))
+    print(f"✅ Línea base guardada en: {ruta}")
+
+
+def comparar_con_baseline(resultados: pd.DataFrame, ruta: Path = None, tolerancia: float = 1.2) -> pd.DataFrame:
+    """
+    Compara el arranque con la línea base y marca regresiones
+    (tiempo por encima de la tolerancia o nuevas dependencias pesadas).
+    """
+    ruta = ruta or get_file_path("metrics", ARCHIVO_BASELINE)
+    if not ruta.exists():
+        print(f"⚠️ No existe línea base en {ruta}. Ejecuta con --guardar-baseline.")
+        return resultados
+
+    base = pd.DataFrame(json.loads(ruta.read_text())["resultados"])
+    comparacion = resultados.merge(base, on="comando", how="left", suffixes=("", "_base"))
+    comparacion["ratio_tiempo"] = comparacion["tiempo_importacion_s"] / comparacion["tiempo_importacion_s_base"]
+    comparacion["regresion"] = (comparacion["ratio_tiempo"] > tolerancia) | (
+        comparacion["pesados"] != comparacion["pesados_base"]
+    )
+
+    print("\n📊 Comparación con la línea base:")
+    print(comparacion[["comando", "tiempo_importacion_s", "ratio_tiempo", "pesados", "regresion"]]
+          .round(3).to_string(index=False))
+    if comparacion["regresion"].any():
+        print(f"\n⚠️ Regresiones detectadas (> x{tolerancia} o nuevas dependencias pesadas).")
+    else:
+        print("\n✅ Sin regresiones respecto a la línea base.")
+    return comparacion
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Arranque en frío de los comandos de cli.py.")
+    parser.add_argument("--comandos", nargs="+", choices=list(MODULOS_COMANDO), default=None)
+    parser.add_argument("--repeticiones", type=int, default=5)
+    parser.add_argument("--detalle", action="store_true")
+    parser.add_argument("--guardar-baseline", action="store_true")
+    parser.add_argument("--tolerancia", type=float, default=1.2)
+    args = parser.parse_args()
+
+    print("\n⏱️ Arranque en frío por comando (importación de módulos):")
+    resultados = medir_arranque(args.comandos, args.repeticiones)
+    if args.detalle:
+        for comando in args.comandos or MODULOS_COMANDO:
+            print(f"\n🔍 Importación por paquete — {comando}:")
+            print(desglose_importtime(comando).round(1).to_string(index=False))
+    if args.guardar_baseline:
+        guardar_baseline(resultados)
+    else:
+        comparar_con_baseline(resultados, tolerancia=args.tolerancia)
@@ -0,0 +1,155 @@
+# =============================================================
+# 📦 src/cache.py — Caché de artefactos .pkl con validación
+# -------------------------------------------------------------
+# Cada artefacto de data/cache/ lleva al lado un `<archivo>.meta.json`
+# con:
+#   • huella de cada fuente (ruta, tamaño, mtime y, opcionalmente, SHA-256)
+#   • versión de la función que lo produjo
+#
+# Un .pkl solo se sirve si todas las huellas siguen coincidiendo
+# (eda.cargar_dataframes); si no, hay que regenerarlo desde el notebook
+# que lo produce. Si cambia el mtime pero se guardó el hash y el
+# contenido es el mismo, la entrada sigue viva.
+# =============================================================
+
+import hashlib
+import json
+from datetime import datetime
+from pathlib import Path
+
+from utils import get_file_path, guardar_archivo
+
+SUFIJO_META = ".meta.json"
+
+
+def _ruta_meta(ruta: Path) -> Path:
+    return ruta.with_name(ruta.name + SUFIJO_META)
+
+
+def _sha256(ruta: Path, tamano_bloque: int = 1 << 20) -> str:
+    h = hashlib.sha256()
+    with open(ruta, "rb") as f:
+        for bloque in iter(lambda: f.read(tamano_bloque), b""):
+            h.update(bloque)
+    return h.hexdigest()
+
+
+# =============================================================
+# 🔏 Función: huella_archivo
+# =============================================================
+def huella_archivo(ruta, con_hash: bool = False) -> dict:
+    """
+    Calcula la huella de un archivo fuente.
+
+    Args:
+        ruta (Path | str): Archivo fuente.
+        con_hash (bool): Si True, incluye el SHA-256 del contenido.
+
+    Returns:
+        dict: {'ruta', 'tamano', 'mtime_ns'[, 'sha256']}
+    """
+    ruta = Path(ruta).resolve()
+    info = ruta.stat()
+    huella = {"ruta": str(ruta), "tamano": info.st_size, "mtime_ns": info.st_mtime_ns}
+    if con_hash:
+        huella["sha256"] = _sha256(ruta)
+    return huella
+
+
+# =============================================================
+# 💾 Función: guardar_en_cache
+# -------------------------------------------------------------
+# ➤ Guarda el objeto en data/cache/ y escribe su .meta.json
+# =============================================================
+def guardar_en_cache(obj, filename: str, fuentes: list = (), version: str = None, con_hash: bool = False):
+    """
+    Guarda un artefacto en la caché junto con las huellas de sus fuentes.
+
+    Args:
+        obj: Objeto a guardar (DataFrame, modelo...).
+        filename (str): Nombre del archivo en data/cache (.pkl o .joblib).
+        fuentes (list): Rutas de los archivos de los que depende.
+        version (str, opcional): Versión de la función productora.
+        con_hash (bool): Si True, guarda también el SHA-256 de cada fuente.
+    """
+    formato = Path(filename).suffix.lstrip(".") or "pkl"
+    guardar_archivo(obj, "cache", filename, format=formato)
+
+    meta = {
+        "fecha": datetime.now().isoformat(timespec="seconds"),
+        "version": version,
+        "fuentes": [huella_archivo(f, con_hash) for f in fuentes],
+    }
+    _ruta_meta(get_file_path("cache", filename)).write_text(json.dumps(meta, indent=2))
+
+
+# =============================================================
+# 🔍 Función: fuentes_modificadas
+# -------------------------------------------------------------
+# ➤ Fuentes registradas en el .meta.json que ya no coinciden
+# ➤ Fuente borrada o huella distinta → modificada
+# =============================================================
+def fuentes_modificadas(filename: str):
+    """
+    Lista las fuentes de un artefacto de la caché que han cambiado desde que se guardó.
+
+    Args:
+        filename (str): Nombre del archivo en data/cache.
+
+    Returns:
+        list | None: Rutas (str) de las fuentes modificadas o borradas;
+        None si el artefacto o su .meta.json no existen.
+    """
+    ruta = get_file_path("cache", filename)
+    ruta_meta = _ruta_meta(ruta)
+    if not ruta.exists() or not ruta_meta.exists():
+        return None
+
+    modificadas = []
+    for huella in json.loads(ruta_meta.read_text()).get("fuentes", []):
+        fuente = Path(huella["ruta"])
+        if not fuente.exists():
+            modificadas.append(huella["ruta"])
+            continue
+        info = fuente.stat()
+        if info.st_size != huella["tamano"]:
+            modificadas.append(huella["ruta"])
+        elif info.st_mtime_ns != huella["mtime_ns"]:
+            # mtime distinto: solo se acepta si hay hash y el contenido no cambió
+            if "sha256" not in huella or _sha256(fuente) != huella["sha256"]:
+                modificadas.append(huella["ruta"])
+    return modificadas
+
+
+# =============================================================
+# ✅ Función: cache_vigente
+# -------------------------------------------------------------
+# ➤ Sin .meta.json (cachés antiguas) → no vigente
+# ➤ Fuente borrada, versión distinta o huella distinta → no vigente
+# =============================================================
+def cache_vigente(filename: str, fuentes: list = None, version: str = None) -> bool:
+    """
+    Indica si un artefacto de la caché sigue siendo válido.
+
+    Args:
+        filename (str): Nombre del archivo en data/cache.
+        fuentes (list, opcional): Fuentes esperadas; si se indican, deben
+            coincidir con las registradas.
+        version (str, opcional): Versión esperada de la función productora.
+
+    Returns:
+        bool: True si se puede servir la caché.
+    """
+    modificadas = fuentes_modificadas(filename)
+    if modificadas is None:
+        return False
+
+    meta = json.loads(_ruta_meta(get_file_path("cache", filename)).read_text())
+    if version is not None and meta.get("version") != version:
+        return False
+
+    registradas = meta.get("fuentes", [])
+    if fuentes is not None and {str(Path(f).resolve()) for f in fuentes} != {h["ruta"] for h in registradas}:
+        return False
+    return not modificadas
+
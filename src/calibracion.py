@@ -0,0 +1,136 @@
+# =============================================================
+# 📦 src/calibracion.py — Calibración de la PD con tabla precompilada
+# -------------------------------------------------------------
+# Las probabilidades de los modelos de boosting no están calibradas:
+# si entran tal cual en interés = tipo_base + coef_riesgo · PD, los
+# tipos quedan sesgados. Aquí se ajusta una calibración sobre el
+# conjunto de validación (dividir_dataset_escalonado):
+#   • "isotonica": regresión isotónica (monótona, no paramétrica)
+#   • "platt": logística sobre el logit de la PD
+# y se compila en una tabla monótona (x → PD calibrada). Aplicarla es
+# un único np.interp sobre el lote, en pricing.valorar_solicitudes,
+# en el simulador de cartera y en `python -m src puntuar`.
+# La tabla se guarda como componente 'calibracion' del registro.
+# =============================================================
+
+import numpy as np
+import pandas as pd
+
+METODOS = ("isotonica", "platt")
+
+
+def _logit(p):
+    p = np.clip(np.asarray(p, dtype=np.float64), 1e-12, 1 - 1e-12)
+    return np.log(p) - np.log1p(-p)
+
+
+# =============================================================
+# 🧮 Función: ajustar_calibracion
+# -------------------------------------------------------------
+# ➤ Isotónica: la tabla son los umbrales de IsotonicRegression
+#   (np.interp reproduce exactamente su predict con out_of_bounds="clip")
+# ➤ Platt: la sigmoide se tabula en una rejilla uniforme en logit
+# =============================================================
+def ajustar_calibracion(pd_bruta, y, metodo: str = "isotonica", n_puntos: int = 2001) -> dict:
+    """
+    Ajusta una calibración de la PD y la compila en una tabla de interpolación.
+
+    Args:
+        pd_bruta (array-like): PD del modelo (predict_proba) en validación.
+        y (array-like): Objetivo binario de validación.
+        metodo (str): 'isotonica' o 'platt'.
+        n_puntos (int): Puntos de la rejilla en modo 'platt'.
+
+    Returns:
+        dict: {'metodo', 'x', 'y'} con x creciente en [0, 1] e y monótona.
+    """
+    if metodo not in METODOS:
+        raise ValueError(f"❌ Método de calibración no soportado: '{metodo}'. Usa {METODOS}.")
+    pd_bruta = np.asarray(pd_bruta, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+
+    if metodo == "isotonica":
+        from sklearn.isotonic import IsotonicRegression
+
+        iso = IsotonicRegression(y_min=0.0, y_max=1.0, out_of_bounds="clip").fit(pd_bruta, y)
+        x_tabla, y_tabla = iso.X_thresholds_, iso.y_thresholds_
+    else:
+        from sklearn.linear_model import LogisticRegression
+
+        lr = LogisticRegression(C=1e6, max_iter=1000).fit(_logit(pd_bruta)[:, None], y)
+        a, b = float(lr.coef_[0, 0]), float(lr.intercept_[0])
+        # Rejilla uniforme en logit: resolución fina en las colas (PD ≈ 0 o 1)
+        x_tabla = np.r_[0.0, 1.0 / (1.0 + np.exp(-np.linspace(-12, 12, n_puntos - 2))), 1.0]
+        y_tabla = 1.0 / (1.0 + np.exp(-(a * _logit(x_tabla) + b)))
+
+    calibracion = {"metodo": metodo, "x": np.asarray(x_tabla), "y": np.asarray(y_tabla)}
+    antes, despues = informe_calibracion(pd_bruta, y), informe_calibracion(aplicar_calibracion(calibracion, pd_bruta), y)
+    print(f"✅ Calibración '{metodo}' ({len(x_tabla)} puntos): "
+          f"Brier {antes['brier']:.5f} → {despues['brier']:.5f}, "
+          f"ECE {antes['ece']:.4f} → {despues['ece']:.4f} (en validación)")
+    return calibracion
+
+
+def calibrar_modelo(modelo, X_val, y_val, metodo: str = "isotonica", **kwargs) -> dict:
+    """
+    Ajusta la calibración con el conjunto de validación de dividir_dataset_escalonado.
+
+    Args:
+        modelo: Estimador con predict_proba ya entrenado en train.
+        X_val, y_val: Validación (no usada en entrenamiento).
+        metodo (str): 'isotonica' o 'platt'.
+        **kwargs: Parámetros adicionales de ajustar_calibracion().
+
+    Returns:
+        dict: Tabla de calibración.
+    """
+    return ajustar_calibracion(modelo.predict_proba(X_val)[:, 1], y_val, metodo, **kwargs)
+
+
+# =============================================================
+# ⚡ Función: aplicar_calibracion
+# =============================================================
+def aplicar_calibracion(calibracion: dict, pd_bruta) -> np.ndarray:
+    """
+    PD calibrada: un único np.interp sobre la tabla (None = sin calibrar).
+    """
+    if calibracion is None:
+        return np.asarray(pd_bruta, dtype=np.float64)
+    return np.interp(pd_bruta, calibracion["x"], calibracion["y"])
+
+
+# =============================================================
+# 📊 Función: informe_calibracion
+# -------------------------------------------------------------
+# ➤ Brier, ECE (error de calibración esperado) y tabla de fiabilidad
+#   por tramos de PD (cuantiles)
+# =============================================================
+def informe_calibracion(pd_impago, y, n_tramos: int = 10, tabla: bool = False):
+    """
+    Mide la calibración de una PD frente al impago observado.
+
+    Args:
+        pd_impago (array-like): PD (bruta o calibrada).
+        y (array-like): Objetivo binario.
+        n_tramos (int): Tramos de PD por cuantiles.
+        tabla (bool): Si True, devuelve también la tabla de fiabilidad.
+
+    Returns:
+        dict: brier y ece (y 'tabla' con pd_media y tasa_impago por tramo).
+    """
+    pd_impago = np.asarray(pd_impago, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    cortes = np.unique(np.quantile(pd_impago, np.linspace(0, 1, n_tramos + 1)[1:-1]))
+    tramo = np.searchsorted(cortes, pd_impago, side="right")
+
+    n = np.bincount(tramo)
+    pd_media = np.bincount(tramo, weights=pd_impago) / np.maximum(n, 1)
+    tasa = np.bincount(tramo, weights=y) / np.maximum(n, 1)
+
+    resultado = {
+        "brier": float(np.mean((pd_impago - y) ** 2)),
+        "ece": float(np.sum(n * np.abs(pd_media - tasa)) / len(y)),
+    }
+    if tabla:
+        resultado["tabla"] = pd.DataFrame({"n": n, "pd_media": pd_media, "tasa_impago": tasa})[n > 0]
+    return resultado
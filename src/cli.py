@@ -0,0 +1,148 @@
+# =============================================================
+# 📦 src/cli.py — Punto de entrada de línea de comandos
+# -------------------------------------------------------------
+# Uso (desde la raíz del proyecto):
+#   python -m src pipeline [--archivo prestamos.csv] [--limpiar] [--profile]
+#   python -m src puntuar --modelo modelo_ligero --entrada solicitudes.csv
+#                         [--salida ...] [--motivos 3] [--profile]
+#   python main.py [--profile]   → equivale a `pipeline`
+#
+# Este módulo solo importa argparse al cargarse: cada comando importa
+# sus módulos al ejecutarse, así `puntuar` no carga gráficos ni
+# limpieza. MODULOS_COMANDO refleja esas importaciones y lo usa
+# benchmark_importacion.py para medir el arranque en frío.
+# =============================================================
+
+import argparse
+import sys
+
+MODULOS_COMANDO = {
+    "pipeline": ("utils", "perfilado", "data_loading", "data_cleaning"),
+    "puntuar": ("utils", "perfilado", "registro_modelos", "pricing"),
+}
+
+
+# =============================================================
+# 🚀 Comando: pipeline (fase 01 — carga de datos)
+# -------------------------------------------------------------
+# 1. Muestra las primeras líneas del archivo CSV sin cargarlo.
+# 2. Carga el archivo como DataFrame.
+# 3. Verifica la dimensionalidad del dataset.
+# 4. Genera una tabla descriptiva de las variables.
+# 5. Guarda el DataFrame en .pkl y .csv.
+# 6. (--limpiar) Limpia con el motor de config.yaml y guarda limpio.pkl.
+# =============================================================
+def comando_pipeline(args):
+    from utils import load_data, guardar_archivo, verificar_dimensionalidad
+    from data_loading import mostrar_primeras_lineas
+
+    # 📑 Paso 1: Mostrar primeras líneas sin cargar
+    mostrar_primeras_lineas("raw", args.archivo)
+    print("\n" + "-" * 100)
+
+    # 📂 Paso 2: Cargar archivo como DataFrame
+    print("\n📄 Cargando desde CSV original...")
+    df = load_data("raw", args.archivo)
+    print("\n✅ Vista previa del DataFrame:\n", df.head())
+    print("-" * 100)
+
+    # 📊 Paso 3: Verificar dimensionalidad
+    verificar_dimensionalidad(df)
+    print("-" * 100)
+
+    # 📋 Paso 4: Resumen de estructura del DataFrame
+    print("\n📋 Estructura del DataFrame:")
+    df.info()
+    print("-" * 100)
+
+    # 💾 Paso 5: Guardar como .pkl y .csv
+    guardar_archivo(df, "cache", "trabajo.pkl", format="pkl")
+    guardar_archivo(df, "processed", "trabajo.csv", format="csv")
+
+    # 🧹 Paso 6: Limpieza (opcional)
+    if args.limpiar:
+        from data_cleaning import limpiar_prestamos
+
+        limpio, _ = limpiar_prestamos(df, motor=args.motor)
+        guardar_archivo(limpio, "cache", "limpio.pkl", format="pkl")
+
+
+# =============================================================
+# 🧾 Comando: puntuar
+# -------------------------------------------------------------
+# ➤ Carga el modelo del registro (mmap) y puntúa un lote de solicitudes
+# ➤ Añade PD, interés, cuota y pérdida esperada (pricing.py); si la
+#   versión tiene componente 'calibracion', la PD sale calibrada
+# ➤ --motivos k: códigos de motivo por préstamo (explicaciones.py)
+# =============================================================
+def comando_puntuar(args):
+    from utils import load_data, guardar_archivo
+    from registro_modelos import cargar_modelo
+    from pricing import valorar_solicitudes
+
+    artefactos = cargar_modelo(args.modelo, args.version, componentes=("modelo", "calibracion"))
+    modelo = artefactos["modelo"]
+    solicitudes = load_data(args.carpeta, args.entrada)
+    resultado = valorar_solicitudes(modelo, solicitudes, calibracion=artefactos.get("calibracion"))
+
+    if args.motivos:
+        from explicaciones import codigos_motivo
+
+        motivos = codigos_motivo(modelo, solicitudes, k=args.motivos)
+        resultado = resultado.join(motivos.drop(columns="PD"))
+
+    salida = args.salida or f"{args.entrada.rsplit('.', 1)[0]}_puntuado.csv"
+    guardar_archivo(resultado, args.carpeta, salida, format="csv")
+    print(f"✅ {len(resultado):,} solicitudes puntuadas (PD media {resultado['PD'].mean():.2%}).")
+
+
+# -------------------------------------------------------------
+# 🧰 Parser
+# -------------------------------------------------------------
+def construir_parser() -> argparse.ArgumentParser:
+    """
+    Construye el parser con los subcomandos 'pipeline' y 'puntuar'.
+    """
+    comun = argparse.ArgumentParser(add_help=False)
+    comun.add_argument("--profile", action="store_true", help="Mide tiempo y memoria por etapa.")
+
+    parser = argparse.ArgumentParser(prog="python -m src", description="Pipeline de financiación a clientes.")
+    subparsers = parser.add_subparsers(dest="comando", required=True)
+
+    pipeline = subparsers.add_parser("pipeline", parents=[comun], help="Fase 01: carga y guardado de los datos crudos.")
+    pipeline.add_argument("--archivo", default="prestamos.csv", help="CSV en data/raw/.")
+    pipeline.add_argument("--limpiar", action="store_true", help="Limpia y guarda data/cache/limpio.pkl.")
+    pipeline.add_argument("--motor", choices=("pandas", "polars"), default=None,
+                          help="Motor de limpieza (por defecto, config.yaml).")
+    pipeline.set_defaults(funcion=comando_pipeline)
+
+    puntuar = subparsers.add_parser("puntuar", parents=[comun], help="Puntúa y precia un lote de solicitudes.")
+    puntuar.add_argument("--modelo", required=True, help="Nombre del modelo en el registro.")
+    puntuar.add_argument("--version", default=None, help="Versión (por defecto, la ACTUAL).")
+    puntuar.add_argument("--entrada", required=True, help="Archivo de solicitudes.")
+    puntuar.add_argument("--carpeta", default="processed", help="Carpeta de config.yaml de entrada y salida.")
+    puntuar.add_argument("--salida", default=None, help="Archivo de salida (CSV).")
+    puntuar.add_argument("--motivos", type=int, default=0, help="Códigos de motivo por préstamo (top-k).")
+    puntuar.set_defaults(funcion=comando_puntuar)
+    return parser
+
+
+def main(argv: list = None):
+    """
+    Ejecuta el comando indicado en `argv` (por defecto, sys.argv).
+    Sin subcomando se ejecuta 'pipeline' (compatibilidad con main.py).
+    """
+    argv = list(sys.argv[1:] if argv is None else argv)
+    if not argv or (argv[0] not in MODULOS_COMANDO and argv[0] not in ("-h", "--help")):
+        argv.insert(0, "pipeline")
+    args = construir_parser().parse_args(argv)
+
+    from perfilado import activar_perfilado, resumen_perfilado, guardar_traza
+
+    activar_perfilado(args.profile)
+    args.funcion(args)
+
+    # ⏱️ Resumen de perfilado (solo con --profile)
+    if args.profile:
+        resumen_perfilado()
+        guardar_traza()
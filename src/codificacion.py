@@ -0,0 +1,185 @@
+# =============================================================
+# 📦 src/codificacion.py — Codificación compacta de alta cardinalidad
+# -------------------------------------------------------------
+# Alternativas a agrupar en 'OTROS' o a One-Hot para variables como
+# `empleo` (miles de puestos distintos). Tres modos:
+#
+#   • "entero": código int32 por categoría (las más frecuentes), para
+#     el soporte categórico nativo de HistGradientBoosting. HGB admite
+#     como máximo max_bins (255) categorías: el resto comparte código.
+#   • "target": media del objetivo suavizada; en entrenamiento se
+#     calcula fuera de fold (K-fold) para no filtrar el target.
+#   • "hash": feature hashing a un ancho fijo de columnas.
+#
+# Cada codificador es un dict que se ajusta una vez y se persiste con
+# guardar_codificador() en outputs/models/.
+# =============================================================
+
+import numpy as np
+import pandas as pd
+from sklearn.model_selection import StratifiedKFold
+
+from utils import guardar_archivo, load_data
+
+MODOS = ("entero", "target", "hash")
+CODIGO_NULO = -1   # HGB trata los valores negativos como ausentes
+
+
+def _normalizar(serie: pd.Series, normalizar: bool) -> pd.Series:
+    serie = serie.astype("string")
+    return serie.str.strip().str.lower() if normalizar else serie
+
+
+# =============================================================
+# 🧩 Función: ajustar_codificador
+# -------------------------------------------------------------
+# ➤ Aprende la codificación sobre los datos de entrenamiento
+# ➤ Devuelve (codificador, valores codificados de entrenamiento)
+# ➤ En modo "target" los valores de entrenamiento son fuera de fold
+# =============================================================
+def ajustar_codificador(
+    serie: pd.Series,
+    modo: str = "entero",
+    y=None,
+    max_categorias: int = 253,
+    min_frecuencia: int = 1,
+    suavizado: float = 20.0,
+    n_splits: int = 5,
+    n_columnas_hash: int = 32,
+    normalizar: bool = True,
+    random_state: int = 42
+) -> tuple:
+    """
+    Ajusta un codificador para una variable categórica de alta cardinalidad.
+
+    Args:
+        serie (pd.Series): Variable categórica (p. ej. 'empleo').
+        modo (str): 'entero', 'target' o 'hash'.
+        y (array-like): Objetivo binario (obligatorio en modo 'target').
+        max_categorias (int): Categorías con código propio en modo 'entero'
+            (≤ 253 para HGB: más el código "resto" y el de nulos, 255 valores).
+        min_frecuencia (int): Apariciones mínimas para tener código propio
+            o media propia.
+        suavizado (float): Peso de la media global en modo 'target'.
+        n_splits (int): Folds para la codificación fuera de fold.
+        n_columnas_hash (int): Ancho fijo en modo 'hash'.
+        normalizar (bool): Quitar espacios y pasar a minúsculas antes de codificar.
+        random_state (int): Semilla de los folds.
+
+    Returns:
+        tuple: (codificador: dict, valores de entrenamiento: pd.DataFrame)
+    """
+    if modo not in MODOS:
+        raise ValueError(f"❌ Modo no soportado: '{modo}'. Usa {MODOS}.")
+
+    valores = _normalizar(serie, normalizar)
+    codificador = {"variable": serie.name, "modo": modo, "normalizar": normalizar}
+
+    if modo == "hash":
+        codificador["n_columnas"] = n_columnas_hash
+        return codificador, aplicar_codificador(codificador, serie)
+
+    frecuencias = valores.value_counts()
+    frecuencias = frecuencias[frecuencias >= min_frecuencia]
+
+    if modo == "entero":
+        codificador["categorias"] = list(frecuencias.index[:max_categorias])
+        print(f"✅ '{serie.name}': {len(codificador['categorias'])} categorías con código propio "
+              f"de {valores.nunique()} ({(valores.isin(codificador['categorias'])).mean():.1%} de las filas)")
+        return codificador, aplicar_codificador(codificador, serie)
+
+    # ---- modo "target" ----
+    if y is None:
+        raise ValueError("❌ El modo 'target' necesita la variable objetivo `y`.")
+    y = np.asarray(y, dtype=np.float64)
+    categorias = pd.Index(frecuencias.index)
+    codigos = categorias.get_indexer(valores.to_numpy(dtype=object, na_value=None))
+    k = len(categorias)
+    prior = y.mean()
+
+    # Estadísticos globales → codificación para datos nuevos
+    suma = np.bincount(codigos[codigos >= 0], weights=y[codigos >= 0], minlength=k)
+    cuenta = np.bincount(codigos[codigos >= 0], minlength=k)
+    codificador.update({
+        "categorias": list(categorias),
+        "medias": (suma + suavizado * prior) / (cuenta + suavizado),
+        "prior": prior,
+    })
+
+    # Fuera de fold: cada fila se codifica con los estadísticos del resto de folds
+    oof = np.full(len(y), prior)
+    folds = StratifiedKFold(n_splits=n_splits, shuffle=True, random_state=random_state)
+    for idx_ajuste, idx_fold in folds.split(np.zeros(len(y)), y):
+        c = codigos[idx_ajuste]
+        validos = c >= 0
+        suma_f = np.bincount(c[validos], weights=y[idx_ajuste][validos], minlength=k)
+        cuenta_f = np.bincount(c[validos], minlength=k)
+        medias_f = (suma_f + suavizado * prior) / (cuenta_f + suavizado)
+        c_fold = codigos[idx_fold]
+        oof[idx_fold] = np.where(c_fold >= 0, medias_f[np.maximum(c_fold, 0)], prior)
+
+    columna = f"{serie.name}_te"
+    return codificador, pd.DataFrame({columna: oof.astype(np.float32)}, index=serie.index)
+
+
+# =============================================================
+# 🔁 Función: aplicar_codificador
+# -------------------------------------------------------------
+# ➤ Codifica datos nuevos (validación, test, scoring)
+# ➤ Categorías no vistas: código "resto" / media global / su hash
+# =============================================================
+def aplicar_codificador(codificador: dict, serie: pd.Series) -> pd.DataFrame:
+    """
+    Aplica un codificador ajustado a una variable.
+
+    Args:
+        codificador (dict): Salida de ajustar_codificador() o cargar_codificador().
+        serie (pd.Series): Valores a codificar.
+
+    Returns:
+        pd.DataFrame: '<var>_cod' (int32), '<var>_te' (float32) o
+        '<var>_hash_<i>' (uint8, ancho fijo) según el modo.
+    """
+    variable, modo = codificador["variable"], codificador["modo"]
+    valores = _normalizar(serie, codificador["normalizar"])
+    nulos = valores.isna().to_numpy()
+
+    if modo == "hash":
+        n_columnas = codificador["n_columnas"]
+        cubeta = (pd.util.hash_array(valores.fillna("").to_numpy(dtype=object)) % n_columnas).astype(np.intp)
+        matriz = np.zeros((len(valores), n_columnas), dtype=np.uint8)
+        filas = np.flatnonzero(~nulos)
+        matriz[filas, cubeta[filas]] = 1
+        columnas = [f"{variable}_hash_{i}" for i in range(n_columnas)]
+        return pd.DataFrame(matriz, columns=columnas, index=serie.index)
+
+    categorias = pd.Index(codificador["categorias"])
+    codigos = categorias.get_indexer(valores.to_numpy(dtype=object, na_value=None))
+
+    if modo == "entero":
+        # No vistas → código "resto" (len(categorias)); nulos → ausente
+        codigos = np.where(codigos < 0, len(categorias), codigos)
+        codigos[nulos] = CODIGO_NULO
+        return pd.DataFrame({f"{variable}_cod": codigos.astype(np.int32)}, index=serie.index)
+
+    medias = np.asarray(codificador["medias"])
+    te = np.where(codigos >= 0, medias[np.maximum(codigos, 0)], codificador["prior"])
+    return pd.DataFrame({f"{variable}_te": te.astype(np.float32)}, index=serie.index)
+
+
+# =============================================================
+# 💾 Persistencia (outputs/models/)
+# =============================================================
+def guardar_codificador(codificador: dict, filename: str = None):
+    """
+    Guarda el codificador con joblib en outputs/models/.
+    """
+    filename = filename or f"codificador_{codificador['variable']}_{codificador['modo']}.joblib"
+    guardar_archivo(codificador, "models", filename, format="joblib")
+
+
+def cargar_codificador(filename: str) -> dict:
+    """
+    Carga un codificador guardado con guardar_codificador().
+    """
+    return load_data("models", filename)
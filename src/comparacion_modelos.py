@@ -0,0 +1,235 @@
+# =============================================================
+# 📦 src/comparacion_modelos.py — Comparación de modelos con CV
+# -------------------------------------------------------------
+# Compara regresión logística, XGBoost y HistGradientBoosting con
+# validación cruzada estratificada, en paralelo:
+#   • la matriz X se copia UNA vez a memoria compartida y cada
+#     proceso la lee sin copiarla (ni pickle por tarea)
+#   • cada tarea = (modelo, fold) en un pool de procesos
+#   • threadpoolctl limita los hilos BLAS/OpenMP de cada tarea para
+#     no sobresuscribir la CPU (procesos x hilos ≤ núcleos)
+#   • el escalado de la LR va dentro de un Pipeline: no hay copias
+#     X_train / X_train_scaled en el proceso principal
+# =============================================================
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import HistGradientBoostingClassifier
+from sklearn.linear_model import LogisticRegression
+from sklearn.metrics import roc_auc_score
+from sklearn.pipeline import make_pipeline
+from sklearn.preprocessing import StandardScaler
+from threadpoolctl import threadpool_limits
+
+from modeling import indices_kfold_estratificado
+
+
+# -------------------------------------------------------------
+# 🧱 Candidatos
+# -------------------------------------------------------------
+# Funciones de módulo (serializables) que crean cada estimador con
+# un número de hilos dado. XGBoost es opcional.
+# -------------------------------------------------------------
+def _crear_regresion_logistica(hilos):
+    return make_pipeline(StandardScaler(), LogisticRegression(max_iter=1000))
+
+
+def _crear_xgboost(hilos):
+    from xgboost import XGBClassifier
+    return XGBClassifier(eval_metric="auc", n_jobs=hilos, tree_method="hist")
+
+
+def _crear_hist_gradient_boosting(hilos):
+    return HistGradientBoostingClassifier(random_state=42)
+
+
+MODELOS_CANDIDATOS = {
+    "regresion_logistica": _crear_regresion_logistica,
+    "xgboost": _crear_xgboost,
+    "hist_gradient_boosting": _crear_hist_gradient_boosting,
+}
+
+
+# -------------------------------------------------------------
+# 👷 Trabajador
+# -------------------------------------------------------------
+# El inicializador se ejecuta una vez por proceso: se adjunta a la
+# memoria compartida y deja X como vista numpy (sin copia).
+# -------------------------------------------------------------
+_DATOS = {}
+
+
+def _iniciar_trabajador(nombre_shm, forma, dtype, y):
+    # Los trabajadores comparten el resource_tracker del proceso principal,
+    # que es quien libera el segmento (unlink) al terminar
+    shm = shared_memory.SharedMemory(name=nombre_shm)
+    _DATOS["shm"] = shm
+    _DATOS["X"] = np.ndarray(forma, dtype=dtype, buffer=shm.buf)
+    _DATOS["y"] = y
+
+
+def _evaluar_fold(args):
+    nombre, crear, fold, idx_train, idx_test, hilos = args
+    X, y = _DATOS["X"], _DATOS["y"]
+
+    with threadpool_limits(limits=hilos):
+        modelo = crear(hilos)
+        inicio = time.perf_counter()
+        modelo.fit(X[idx_train], y[idx_train])
+        tiempo_fit = time.perf_counter() - inicio
+
+        inicio = time.perf_counter()
+        pred = modelo.predict_proba(X[idx_test])[:, 1]
+        tiempo_predict = time.perf_counter() - inicio
+
+    return {
+        "modelo": nombre,
+        "fold": fold,
+        "auc": roc_auc_score(y[idx_test], pred),
+        "tiempo_fit_s": tiempo_fit,
+        "tiempo_predict_s": tiempo_predict,
+    }
+
+
+# =============================================================
+# 🏁 Función: comparar_modelos_cv
+# -------------------------------------------------------------
+# ➤ Todas las tareas (modelo x fold) en paralelo
+# ➤ Resumen: AUC media/desviación y tiempos medios por modelo
+# =============================================================
+def comparar_modelos_cv(
+    X,
+    y,
+    modelos: dict = None,
+    n_splits: int = 5,
+    n_procesos: int = None,
+    hilos_por_modelo: int = None,
+    dtype=None,
+    random_state: int = 42
+) -> tuple:
+    """
+    Compara modelos con validación cruzada estratificada en procesos paralelos.
+
+    Args:
+        X (pd.DataFrame | np.ndarray): Matriz de variables codificadas (df_modelo sin target).
+        y (array-like): Variable objetivo binaria.
+        modelos (dict, opcional): {nombre: función(hilos) -> estimador}; por
+            defecto MODELOS_CANDIDATOS (XGBoost se omite si no está instalado).
+        n_splits (int): Número de folds.
+        n_procesos (int, opcional): Procesos del pool (por defecto, núcleos).
+        hilos_por_modelo (int, opcional): Hilos BLAS/OpenMP por tarea (por defecto,
+            núcleos / procesos).
+        dtype (opcional): Tipo de la matriz compartida; por defecto se conserva
+            el de X (float32 se mantiene, enteros pasan a float64).
+        random_state (int): Semilla de los folds.
+
+    Returns:
+        tuple: (resumen por modelo, detalle por fold) como DataFrames.
+    """
+    modelos = dict(modelos or MODELOS_CANDIDATOS)
+    if modelos.get("xgboost") is _crear_xgboost:
+        try:
+            import xgboost  # noqa: F401
+        except ImportError:
+            print("⚠️ xgboost no está instalado: se omite de la comparación.")
+            modelos.pop("xgboost")
+
+    X = X.to_numpy() if isinstance(X, pd.DataFrame) else np.asarray(X)
+    if dtype is None:
+        dtype = X.dtype if np.issubdtype(X.dtype, np.floating) else np.float64
+    X = np.ascontiguousarray(X, dtype=dtype)
+    y = np.asarray(y)
+    folds = indices_kfold_estratificado(y, n_splits=n_splits, random_state=random_state)
+
+    n_nucleos = os.cpu_count() or 1
+    n_tareas = len(modelos) * n_splits
+    n_procesos = n_procesos or min(n_nucleos, n_tareas)
+    hilos_por_modelo = hilos_por_modelo or max(1, n_nucleos // n_procesos)
+
+    tareas = [
+        (nombre, crear, fold, idx_train, idx_test, hilos_por_modelo)
+        for nombre, crear in modelos.items()
+        for fold, (idx_train, idx_test) in enumerate(folds)
+    ]
+
+    print(f"🏁 Comparando {len(modelos)} modelos x {n_splits} folds "
+          f"({n_procesos} procesos x {hilos_por_modelo} hilos, X {X.dtype}: {X.nbytes / 1024 ** 2:.1f} MB)...")
+
+    shm = shared_memory.SharedMemory(create=True, size=X.nbytes)
+    try:
+        np.ndarray(X.shape, dtype=X.dtype, buffer=shm.buf)[:] = X
+        inicio = time.perf_counter()
+        with ProcessPoolExecutor(
+            max_workers=n_procesos,
+            initializer=_iniciar_trabajador,
+            initargs=(shm.name, X.shape, X.dtype, y),
+        ) as pool:
+            detalle = pd.DataFrame(list(pool.map(_evaluar_fold, tareas)))
+        tiempo_total = time.perf_counter() - inicio
+    finally:
+        shm.close()
+        shm.unlink()
+
+    resumen = (
+        detalle.groupby("modelo", sort=False)
+        .agg(
+            auc_media=("auc", "mean"),
+            auc_std=("auc", "std"),
+            tiempo_fit_medio_s=("tiempo_fit_s", "mean"),
+            tiempo_predict_medio_s=("tiempo_predict_s", "mean"),
+        )
+        .sort_values("auc_media", ascending=False)
+        .reset_index()
+    )
+
+    print(f"\n📊 Comparación de modelos ({n_splits} folds, {tiempo_total:.1f} s en total):")
+    print(resumen.round(4).to_string(index=False))
+    return resumen, detalle
+
+
+# =============================================================
+# 🎚️ Función: comparar_precision
+# -------------------------------------------------------------
+# ➤ Misma CV en float64 y en float32
+# ➤ Diferencia de AUC, memoria de X y tiempos por modelo
+# ➤ Nota: HGB convierte X a float64 solo al discretizar (binning);
+#   después entrena sobre los bins uint8
+# =============================================================
+def comparar_precision(X, y, modelos: dict = None, n_splits: int = 5, **kwargs) -> pd.DataFrame:
+    """
+    Compara AUC, memoria y tiempos de los modelos con X en float64 y en float32.
+
+    Args:
+        X (pd.DataFrame | np.ndarray): Matriz de variables.
+        y (array-like): Variable objetivo binaria.
+        modelos (dict, opcional): Candidatos (por defecto MODELOS_CANDIDATOS).
+        n_splits (int): Número de folds.
+        **kwargs: Parámetros adicionales de comparar_modelos_cv().
+
+    Returns:
+        pd.DataFrame: Una fila por modelo con AUC en ambas precisiones y su diferencia.
+    """
+    resultados = {}
+    for dtype in (np.float64, np.float32):
+        resumen, _ = comparar_modelos_cv(X, y, modelos=modelos, n_splits=n_splits, dtype=dtype, **kwargs)
+        resultados[np.dtype(dtype).name] = resumen.set_index("modelo")
+
+    r64, r32 = resultados["float64"], resultados["float32"]
+    comparacion = pd.DataFrame({
+        "auc_float64": r64["auc_media"],
+        "auc_float32": r32["auc_media"],
+        "dif_auc": r32["auc_media"] - r64["auc_media"],
+        "tiempo_fit_float64_s": r64["tiempo_fit_medio_s"],
+        "tiempo_fit_float32_s": r32["tiempo_fit_medio_s"],
+    }).reset_index()
+
+    n_celdas = np.shape(X)[0] * np.shape(X)[1]
+    print(f"\n🎚️ Memoria de X: {n_celdas * 8 / 1024 ** 2:.1f} MB (float64) → "
+          f"{n_celdas * 4 / 1024 ** 2:.1f} MB (float32)")
+    print(comparacion.round(5).to_string(index=False))
+    return comparacion
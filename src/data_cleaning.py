@@ -1,21 +1,28 @@
 
 import pandas as pd
-from janitor import clean_names
-from IPython.display import display
+from perfilado import perfilar_etapa
+from utils import load_config, load_data
+
+MOTORES_LIMPIEZA = ("pandas", "polars")
 
 # -------------------------------------------------------------
 # 🧹 Limpieza general de variables
 # -------------------------------------------------------------
 # ➤ Estándariza nombres, elimina columnas irrelevantes y transforma datos.
+# ➤ conservar_ids=True mantiene 'id_cliente' e 'id_prestamo' para poder
+#   guardar las variables finales en el feature store (feature_store.py).
 # -------------------------------------------------------------
-def limpiar_variables_basicas(df: pd.DataFrame) -> pd.DataFrame:
+@perfilar_etapa
+def limpiar_variables_basicas(df: pd.DataFrame, conservar_ids: bool = False) -> pd.DataFrame:
+    from janitor import clean_names
+
     df = df.copy()
 
     # 1️⃣ Estandarizar nombres
     df = clean_names(df)
 
     # 2️⃣ Eliminar columnas irrelevantes
-    columnas_eliminar = ['id_cliente', 'id_prestamo', 'descripcion']
+    columnas_eliminar = ['descripcion'] if conservar_ids else ['id_cliente', 'id_prestamo', 'descripcion']
     df = df.drop(columns=columnas_eliminar, errors='ignore')
 
     # 3️⃣ Convertir columnas con texto a numéricas (extraer dígitos)
@@ -43,6 +50,7 @@ def limpiar_variables_basicas(df: pd.DataFrame) -> pd.DataFrame:
 # -------------------------------------------------------------
 # ➤ Elimina duplicados del DataFrame y muestra estadísticas antes y después.
 # -------------------------------------------------------------
+@perfilar_etapa
 def eliminar_duplicados(df):
     """
     Elimina registros duplicados del DataFrame e imprime información resumen.
@@ -64,6 +72,7 @@ def eliminar_duplicados(df):
 #    una lógica definida (por ejemplo, 'OTROS' para 'empleo').
 # ➤ La imputación se realiza sobre el DataFrame `cat`.
 # =============================================================
+@perfilar_etapa
 def imputar_nulos_categoricas(cat: pd.DataFrame) -> pd.DataFrame:
     cat = cat.copy()
     if 'empleo' in cat.columns:
@@ -78,6 +87,7 @@ def imputar_nulos_categoricas(cat: pd.DataFrame) -> pd.DataFrame:
 #   de lógica de negocio y estadísticas básicas.
 # ➤ Cada variable tiene su propia estrategia definida.
 # =============================================================
+@perfilar_etapa
 def imputar_nulos_numericas(num: pd.DataFrame) -> pd.DataFrame:
     num = num.copy()
 
@@ -106,6 +116,7 @@ def imputar_nulos_numericas(num: pd.DataFrame) -> pd.DataFrame:
 # 📉 Detección y agrupación de categorías poco representadas
 # =============================================================
 
+@perfilar_etapa
 def detectar_atipicos_categoricos(df_cat: pd.DataFrame, umbral: float = 0.03) -> dict:
     """
     Devuelve un diccionario con categorías que tienen frecuencia relativa menor al umbral.
@@ -118,6 +129,7 @@ def detectar_atipicos_categoricos(df_cat: pd.DataFrame, umbral: float = 0.03) ->
             categorias_atipicas[col] = atipicos
     return categorias_atipicas
 
+@perfilar_etapa
 def agrupar_categorias_poco_frecuentes(df_cat: pd.DataFrame, categorias_a_agrup: dict, etiqueta: str = "OTROS") -> pd.DataFrame:
     """
     Agrupa categorías poco frecuentes en cada variable del DataFrame bajo una etiqueta común.
@@ -128,9 +140,73 @@ def agrupar_categorias_poco_frecuentes(df_cat: pd.DataFrame, categorias_a_agrup:
     return df_cat
 
 
+# =============================================================
+# 🚦 Limpieza completa con motor seleccionable
+# -------------------------------------------------------------
+# ➤ Encadena limpieza básica, duplicados, imputación y detección de
+#   categorías poco frecuentes, como en el notebook 02.
+# ➤ motor "pandas" (por defecto) o "polars" (limpieza_polars.py,
+#   multihilo y perezoso). Se elige en config.yaml → limpieza.motor.
+# ➤ Si Polars (o pyarrow, para volver a pandas) no está instalado se
+#   usa pandas con un aviso.
+# =============================================================
+def motor_limpieza() -> str:
+    """
+    Devuelve el motor de limpieza configurado en config.yaml (por defecto 'pandas').
+    """
+    return (load_config().get("limpieza") or {}).get("motor", "pandas")
+
+
+@perfilar_etapa
+def limpiar_prestamos(
+    origen,
+    folder_key: str = "raw",
+    motor: str = None,
+    conservar_ids: bool = False,
+    umbral_atipicos: float = 0.03
+) -> tuple:
+    """
+    Limpia los préstamos crudos con el motor indicado.
+
+    Args:
+        origen (str | pd.DataFrame): Archivo en `folder_key` (p. ej. 'prestamos.csv')
+            o DataFrame crudo.
+        folder_key (str): Carpeta de config.yaml si `origen` es un archivo.
+        motor (str, opcional): 'pandas' o 'polars' (por defecto, config.yaml).
+        conservar_ids (bool): Mantener 'id_cliente' e 'id_prestamo'.
+        umbral_atipicos (float): Frecuencia relativa mínima de una categoría.
+
+    Returns:
+        tuple: (pd.DataFrame limpio, dict de categorías poco frecuentes)
+    """
+    motor = motor or motor_limpieza()
+    if motor not in MOTORES_LIMPIEZA:
+        raise ValueError(f"❌ Motor de limpieza no soportado: '{motor}'. Usa {MOTORES_LIMPIEZA}.")
+
+    if motor == "polars":
+        try:
+            import polars  # noqa: F401
+            import pyarrow  # noqa: F401
+        except ImportError:
+            print("⚠️ polars/pyarrow no están instalados: se usa el motor pandas.")
+        else:
+            from limpieza_polars import limpiar_con_polars
+            return limpiar_con_polars(origen, folder_key, conservar_ids, umbral_atipicos)
+
+    df = load_data(folder_key, origen) if isinstance(origen, str) else origen
+    df = limpiar_variables_basicas(df, conservar_ids=conservar_ids)
+    df = eliminar_duplicados(df)
+
+    cat = imputar_nulos_categoricas(df.select_dtypes(exclude="number"))
+    num = imputar_nulos_numericas(df.select_dtypes(include="number"))
+    df = pd.concat([cat, num], axis=1)[df.columns]
+    return df, detectar_atipicos_categoricos(cat, umbral_atipicos)
+
+
 # =============================================================
 # 🔍 Análisis de valores atípicos en variables categóricas
 # =============================================================
+@perfilar_etapa
 def analizar_atipicos_categoricas(cat: pd.DataFrame, umbral_frecuencia: float = 0.03) -> None:
     """
     Analiza y muestra los valores atípicos en variables categóricas según un umbral de frecuencia relativa.
@@ -142,6 +218,8 @@ def analizar_atipicos_categoricas(cat: pd.DataFrame, umbral_frecuencia: float =
     umbral_frecuencia : float, opcional
         Umbral de frecuencia relativa para considerar una categoría como atípica (por defecto es 0.03).
     """
+    from IPython.display import display
+
     print(f"\n📊 Análisis de valores atípicos en variables categóricas (frecuencia < {umbral_frecuencia * 100:.0f}%):")
     print(f"Variables analizadas: {', '.join(cat.columns)}")
     print("-" * 100)
@@ -203,6 +281,7 @@ def analizar_atipicos_categoricas(cat: pd.DataFrame, umbral_frecuencia: float =
 # =============================================================
 # 🔍 Análisis de valores atípicos en variables numericas
 # =============================================================
+@perfilar_etapa
 def analizar_outliers_numericos(df: pd.DataFrame, num_desv_tip: int = 3) -> None:
     """
     Analiza y reporta los valores atípicos en variables numéricas del DataFrame.
@@ -6,8 +6,16 @@
 # =============================================================
 
 from pathlib import Path
+import csv
+import math
+import mmap
+import random
+from collections import Counter
+
+import numpy as np
 import pandas as pd
-from utils import get_file_path
+from utils import get_file_path, verificar_dimensionalidad
+from perfilado import perfilar_etapa
 
 # -------------------------------------------------------------
 # 📁 Mostrar primeras líneas de un archivo de texto plano
@@ -15,6 +23,7 @@ from utils import get_file_path
 # 📌 Aquí define qué hace la función:
 # Muestra por consola las primeras líneas del archivo como texto plano (formato CSV).
 # -------------------------------------------------------------
+@perfilar_etapa
 def mostrar_primeras_lineas(folder_key, filename, n=5, ancho_max=400):
     ruta = get_file_path(folder_key, filename)
     print(f"\n📑 Primeras {n} líneas de: {ruta}\n")
@@ -30,11 +39,137 @@ def mostrar_primeras_lineas(folder_key, filename, n=5, ancho_max=400):
         print(f"❌ Error al leer archivo: {e}")
 
 
+# -------------------------------------------------------------
+# 🔢 Contar filas sin parsear el archivo
+# -------------------------------------------------------------
+# 📌 Aquí define qué hace la función:
+# Cuenta saltos de línea sobre el archivo mapeado en memoria (mmap), por
+# bloques. No crea objetos por fila: en un CSV de varios GB tarda lo que
+# tarda el disco. Cuenta líneas físicas: si algún campo entrecomillado
+# contiene saltos de línea, el resultado es una cota superior.
+# -------------------------------------------------------------
+@perfilar_etapa
+def contar_filas(folder_key, filename, cabecera=True, tamano_bloque=1 << 24):
+    ruta = get_file_path(folder_key, filename)
+    if ruta.stat().st_size == 0:
+        return 0
+
+    n_lineas = 0
+    with ruta.open("rb") as archivo, mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        for inicio in range(0, len(mm), tamano_bloque):
+            n_lineas += mm[inicio:inicio + tamano_bloque].count(b"\n")
+        # Última línea sin salto de línea final
+        if mm[len(mm) - 1:] != b"\n":
+            n_lineas += 1
+
+    return n_lineas - int(cabecera)
+
 
+# -------------------------------------------------------------
+# 🎲 Muestreo de filas por reservorio
+# -------------------------------------------------------------
+# 📌 Aquí define qué hace la función:
+# Recorre el CSV con csv.reader (respeta comillas y saltos de línea
+# dentro de campos) y conserva una muestra uniforme de `n` filas con el
+# algoritmo L de reservorio: la memoria es O(n) sea cual sea el archivo.
+# Devuelve también el número exacto de registros leídos.
+# -------------------------------------------------------------
+@perfilar_etapa
+def muestrear_filas(folder_key, filename, n=10_000, semilla=42, encoding="utf-8"):
+    ruta = get_file_path(folder_key, filename)
+    rng = random.Random(semilla)
+    reservorio = []
+    n_registros = 0
+    siguiente = None  # Próxima fila que entra al reservorio (n <= 0: ninguna)
 
+    with ruta.open("r", encoding=encoding, newline="") as archivo:
+        lector = csv.reader(archivo)
+        columnas = next(lector, [])
+
+        for i, fila in enumerate(lector):
+            n_registros = i + 1
+            if i < n:
+                reservorio.append(fila)
+                if i == n - 1:
+                    w = math.exp(math.log(rng.random()) / n)
+                    siguiente = i + math.floor(math.log(rng.random()) / math.log(1 - w)) + 1
+            elif i == siguiente:
+                reservorio[rng.randrange(n)] = fila
+                w *= math.exp(math.log(rng.random()) / n)
+                siguiente = i + math.floor(math.log(rng.random()) / math.log(1 - w)) + 1
+
+    return columnas, reservorio, n_registros
+
+
+# -------------------------------------------------------------
+# 🧮 Estimar cardinalidad total desde la muestra (estimador GEE)
+# -------------------------------------------------------------
+# 📌 Aquí define qué hace la función:
+# D ≈ √(N/n)·f1 + Σ_{j≥2} f_j, siendo f_j el número de valores que
+# aparecen exactamente j veces en la muestra (Charikar et al., 2000).
+# Si todos los valores de la muestra son distintos (columna tipo clave),
+# GEE subestima mucho: se asume un valor distinto por registro no nulo.
+# -------------------------------------------------------------
+def estimar_cardinalidad(valores, n_total):
+    n_muestra = len(valores)
+    valores = [v for v in valores if v != ""]
+    if not valores:
+        return 0
+    frecuencias = Counter(Counter(valores).values())
+    if frecuencias.get(1, 0) == len(valores):
+        return int(round(n_total * len(valores) / n_muestra))
+    f1 = frecuencias.pop(1, 0)
+    estimacion = math.sqrt(n_total / len(valores)) * f1 + sum(frecuencias.values())
+    return int(min(round(estimacion), n_total))
+
+
+# =============================================================
+# 🔎 Función: perfilar_archivo_crudo
+# -------------------------------------------------------------
+# ➤ Una sola pasada por el archivo: el muestreo por reservorio devuelve
+#   también el número exacto de registros, sin DataFrame completo
+# ➤ Esquema, % de nulos y cardinalidad a partir de una muestra
+# ➤ Ratio de dimensionalidad con utils.verificar_dimensionalidad
+# =============================================================
+def perfilar_archivo_crudo(folder_key, filename, n_muestra=10_000, umbral=100, semilla=42) -> pd.DataFrame:
+    """
+    Perfila un CSV crudo sin cargarlo entero en memoria.
 
+    Args:
+        folder_key (str): Clave de carpeta en config.yaml (p. ej. 'raw').
+        filename (str): Nombre del archivo.
+        n_muestra (int): Tamaño de la muestra por reservorio.
+        umbral (int): Registros mínimos por variable para la dimensionalidad.
+        semilla (int): Semilla del muestreo.
 
+    Returns:
+        pd.DataFrame: Una fila por columna con tipo inferido, % de nulos,
+        cardinalidad en la muestra y cardinalidad estimada en el archivo.
+    """
+    columnas, filas, n_filas = muestrear_filas(folder_key, filename, n=n_muestra, semilla=semilla)
+    print(f"\n🔎 Perfil de {filename}: {n_filas:,} filas x {len(columnas)} columnas "
+          f"(muestra de {len(filas):,} filas)")
 
+    perfil = []
+    for j, columna in enumerate(columnas):
+        valores = [fila[j] if j < len(fila) else "" for fila in filas]
+        serie = pd.Series(valores, dtype=object).replace("", np.nan)
+        no_nulos = serie.dropna()
+        numericos = pd.to_numeric(no_nulos, errors="coerce")
 
+        if len(no_nulos) and numericos.notna().all():
+            tipo = "int" if (numericos % 1 == 0).all() else "float"
+        else:
+            tipo = "texto"
 
+        perfil.append({
+            "variable": columna,
+            "tipo_inferido": tipo,
+            "porc_nulos": round(serie.isna().mean() * 100, 2),
+            "cardinalidad_muestra": no_nulos.nunique(),
+            "cardinalidad_estimada": estimar_cardinalidad(valores, n_filas),
+            "ejemplo": no_nulos.iloc[0] if len(no_nulos) else None,
+        })
 
+    verificar_dimensionalidad((n_filas, len(columnas)), umbral=umbral)
+    return pd.DataFrame(perfil)
@@ -0,0 +1,245 @@
+# =============================================================
+# 📦 src/datos_sinteticos.py — Generador de préstamos sintéticos
+# -------------------------------------------------------------
+# Genera datos con la misma forma que data/raw/prestamos.csv
+# (mismas columnas, cardinalidades y tasas de nulos aproximadas)
+# para poder medir el rendimiento del pipeline sin los datos reales.
+# =============================================================
+
+import numpy as np
+import pandas as pd
+from utils import get_file_path
+
+# -------------------------------------------------------------
+# 📋 Columnas del archivo original (en el mismo orden)
+# -------------------------------------------------------------
+COLUMNAS_PRESTAMOS = [
+    "id_cliente", "empleo", "antigüedad_empleo", "ingresos", "ingresos_verificados",
+    "rating", "dti", "vivienda", "num_hipotecas", "num_lineas_credito",
+    "porc_tarjetas_75p", "porc_uso_revolving", "num_cancelaciones_12meses",
+    "num_derogatorios", "num_meses_desde_ult_retraso", "id_prestamo", "descripcion",
+    "finalidad", "principal", "tipo_interes", "num_cuotas", "imp_cuota",
+    "imp_amortizado", "estado", "imp_recuperado"
+]
+
+# -------------------------------------------------------------
+# 📊 Tasas de nulos observadas en prestamos.csv (200.000 filas)
+# -------------------------------------------------------------
+TASAS_NULOS = {
+    "empleo": 0.0735,
+    "antigüedad_empleo": 0.0644,
+    "dti": 0.0007,
+    "num_hipotecas": 0.0220,
+    "num_lineas_credito": 0.00002,
+    "porc_tarjetas_75p": 0.0332,
+    "porc_uso_revolving": 0.0008,
+    "num_cancelaciones_12meses": 0.00006,
+    "num_derogatorios": 0.00002,
+    "num_meses_desde_ult_retraso": 0.5131,
+    "descripcion": 0.9444,
+}
+
+_PUESTOS_BASE = [
+    "Teacher", "Manager", "Owner", "Registered Nurse", "Driver", "Supervisor", "Sales",
+    "Project Manager", "Office Manager", "General Manager", "Director", "Engineer",
+    "Truck Driver", "Nurse", "Operations Manager", "President", "Accountant", "Analyst",
+    "Technician", "Administrator", "Mechanic", "Attorney", "Police Officer", "Consultant",
+    "Electrician", "Executive Director", "Account Manager", "Software Engineer", "Clerk",
+    "Cashier", "Banker", "Pharmacist", "Paralegal", "Firefighter", "Machine Operator",
+    "Store Manager", "Server", "Chef", "Customer Service", "Branch Manager",
+    "Hvac Technician", "Subsea Technician", "Field Engineer", "Warehouse Associate",
+    "Physician", "Program Manager", "Social Worker", "Receptionist", "Carpenter",
+    "Controller", "Foreman", "Welder", "Plumber", "Loan Officer", "Dental Hygienist",
+    "Bus Driver", "Case Manager", "Assistant Manager", "Service Manager", "Professor",
+]
+_PREFIJOS_PUESTO = [
+    "", "Senior ", "Sr. ", "Lead ", "Assistant ", "Chief ", "Junior ", "Head ",
+    "Regional ", "Staff ", "Principal ", "Associate ", "Deputy ", "Area ",
+]
+_SUFIJOS_PUESTO = ["", " I", " II", " III", " Specialist", " Coordinator", " Lead", " Supervisor"]
+
+_ANTIGUEDAD = ["< 1 year", "1 year"] + [f"{i} years" for i in range(2, 10)] + ["10+ years"]
+_P_ANTIGUEDAD = [0.09, 0.07, 0.09, 0.08, 0.06, 0.06, 0.05, 0.04, 0.04, 0.04, 0.38]
+
+_VERIFICACION = ["Source Verified", "Not Verified", "Verified"]
+_P_VERIFICACION = [0.39, 0.33, 0.28]
+
+_RATINGS = np.array(list("ABCDEFG"))
+_P_RATINGS = [0.19, 0.29, 0.28, 0.14, 0.07, 0.02, 0.01]
+_TIPO_POR_RATING = np.array([7.0, 10.5, 14.0, 18.0, 21.5, 25.0, 28.0])
+
+_VIVIENDA = ["MORTGAGE", "RENT", "OWN", "ANY", "NONE", "OTHER"]
+_P_VIVIENDA = [0.49, 0.39, 0.1194, 0.0004, 0.0001, 0.0001]
+
+_FINALIDAD = [
+    "debt_consolidation", "credit_card", "home_improvement", "other", "major_purchase",
+    "medical", "small_business", "car", "moving", "vacation", "house", "wedding",
+    "renewable_energy", "educational",
+]
+_P_FINALIDAD = [0.565, 0.22, 0.065, 0.06, 0.022, 0.012, 0.011, 0.011, 0.007, 0.007,
+                0.006, 0.0035, 0.0007, 0.0038]
+
+_ESTADOS_PAGO = ["Current", "Fully Paid", "In Grace Period", "Late (16-30 days)",
+                 "Late (31-120 days)", "Does not meet the credit policy. Status:Fully Paid"]
+_P_ESTADOS_PAGO = [0.52, 0.455, 0.006, 0.003, 0.014, 0.002]
+_ESTADOS_IMPAGO = ["Charged Off", "Does not meet the credit policy. Status:Charged Off", "Default"]
+_P_ESTADOS_IMPAGO = [0.985, 0.013, 0.002]
+_PD_POR_RATING = np.array([0.05, 0.10, 0.16, 0.23, 0.30, 0.37, 0.42])
+
+
+# -------------------------------------------------------------
+# 👷 Vocabulario de profesiones de alta cardinalidad
+# -------------------------------------------------------------
+# Combina prefijos, puestos y sufijos (más variantes de mayúsculas y
+# espacios finales, como en el archivo real) para obtener decenas de
+# miles de categorías con una distribución de tipo Zipf.
+# -------------------------------------------------------------
+def _vocabulario_empleo(rng: np.random.Generator):
+    vocab = np.array([
+        f"{pre}{base}{suf}"
+        for base in _PUESTOS_BASE for pre in _PREFIJOS_PUESTO for suf in _SUFIJOS_PUESTO
+    ], dtype=object)
+    variantes = np.concatenate([vocab, np.char.lower(vocab.astype(str)).astype(object), vocab + " "])
+    rng.shuffle(variantes)
+
+    # Los puestos base sin modificar son los más frecuentes
+    variantes = np.concatenate([np.array(_PUESTOS_BASE, dtype=object), variantes])
+    rangos = np.arange(1, len(variantes) + 1)
+    pesos = 1.0 / rangos ** 1.05
+    return variantes, pesos / pesos.sum()
+
+
+def _con_nulos(valores: np.ndarray, tasa: float, rng: np.random.Generator) -> np.ndarray:
+    valores = valores.astype(object) if valores.dtype.kind in "OUS" else valores.astype(float)
+    valores[rng.random(len(valores)) < tasa] = None if valores.dtype == object else np.nan
+    return valores
+
+
+# =============================================================
+# 🧪 Función: generar_prestamos_sinteticos
+# -------------------------------------------------------------
+# ➤ Devuelve un DataFrame con la forma de prestamos.csv
+# ➤ Mantiene textos como en el original: 'antigüedad_empleo' ('10+ years')
+#   y 'num_cuotas' (' 36 months') para ejercitar la limpieza
+# ➤ El impago depende del rating para que el modelo tenga señal
+# =============================================================
+def generar_prestamos_sinteticos(n_filas: int, semilla: int = 42, id_inicial: int = 1_000_000) -> pd.DataFrame:
+    """
+    Genera un DataFrame sintético con las columnas y distribuciones de prestamos.csv.
+
+    Args:
+        n_filas (int): Número de préstamos a generar.
+        semilla (int): Semilla para reproducibilidad.
+        id_inicial (int): Primer id_cliente del rango (ids únicos y desordenados).
+
+    Returns:
+        pd.DataFrame: Préstamos sintéticos con las 25 columnas originales.
+    """
+    rng = np.random.default_rng(semilla)
+    vocab, p_vocab = _vocabulario_empleo(np.random.default_rng(0))
+
+    idx_rating = rng.choice(len(_RATINGS), size=n_filas, p=_P_RATINGS)
+    ingresos = np.round(rng.lognormal(mean=11.1, sigma=0.55, size=n_filas), -3)
+    principal = np.clip(np.round(rng.gamma(2.2, 7000, size=n_filas) / 25) * 25, 1000, 40000)
+    plazo = np.where(rng.random(n_filas) < 0.72, 36, 60)
+    tipo_interes = np.round(_TIPO_POR_RATING[idx_rating] + rng.normal(0, 1.2, n_filas), 2).clip(5.3, 31)
+    r_mensual = tipo_interes / 1200
+    imp_cuota = np.round(principal * r_mensual / (1 - (1 + r_mensual) ** -plazo), 2)
+
+    # Impago ligado al rating y al esfuerzo financiero
+    dti = np.round(rng.gamma(3.0, 6.3, n_filas), 2)
+    dti[rng.random(n_filas) < 0.0005] = -1
+    dti[rng.random(n_filas) < 0.0005] = 999
+    pd_real = np.clip(_PD_POR_RATING[idx_rating] * (1 + (dti.clip(0, 60) - 18) / 60), 0.01, 0.9)
+    impago = rng.random(n_filas) < pd_real
+    estado = np.where(
+        impago,
+        rng.choice(_ESTADOS_IMPAGO, size=n_filas, p=_P_ESTADOS_IMPAGO),
+        rng.choice(_ESTADOS_PAGO, size=n_filas, p=np.array(_P_ESTADOS_PAGO) / sum(_P_ESTADOS_PAGO)),
+    )
+    fraccion_amortizada = np.where(impago, rng.beta(1.5, 4, n_filas), rng.beta(2, 1.2, n_filas))
+    imp_recuperado = np.where(impago, np.round(principal * rng.beta(0.6, 8, n_filas), 2), 0.0)
+
+    # Texto libre con cardinalidad alta (solo ~5% de filas informadas)
+    descripcion = (
+        "Borrower added on " + pd.Series(rng.integers(1, 29, n_filas)).astype(str)
+        + "/" + pd.Series(rng.integers(1, 13, n_filas)).astype(str)
+        + "/14 > " + pd.Series(rng.choice(_FINALIDAD, size=n_filas)).str.replace("_", " ")
+        + " loan #" + pd.Series(rng.integers(0, 5000, n_filas)).astype(str)
+    ).to_numpy(dtype=object)
+
+    df = pd.DataFrame({
+        "id_cliente": id_inicial + rng.permutation(n_filas),
+        "empleo": _con_nulos(rng.choice(vocab, size=n_filas, p=p_vocab), TASAS_NULOS["empleo"], rng),
+        "antigüedad_empleo": _con_nulos(rng.choice(_ANTIGUEDAD, size=n_filas, p=_P_ANTIGUEDAD),
+                                        TASAS_NULOS["antigüedad_empleo"], rng),
+        "ingresos": ingresos,
+        "ingresos_verificados": rng.choice(_VERIFICACION, size=n_filas, p=_P_VERIFICACION),
+        "rating": _RATINGS[idx_rating],
+        "dti": _con_nulos(dti, TASAS_NULOS["dti"], rng),
+        "vivienda": rng.choice(_VIVIENDA, size=n_filas, p=_P_VIVIENDA),
+        "num_hipotecas": _con_nulos(rng.poisson(1.5, n_filas), TASAS_NULOS["num_hipotecas"], rng),
+        "num_lineas_credito": _con_nulos(rng.poisson(11.5, n_filas) + 1, TASAS_NULOS["num_lineas_credito"], rng),
+        "porc_tarjetas_75p": _con_nulos(np.round(rng.choice([0.0, 100.0, 50.0, 33.3, 66.7, 25.0, 75.0], n_filas,
+                                                            p=[0.35, 0.15, 0.15, 0.1, 0.1, 0.08, 0.07]), 1),
+                                        TASAS_NULOS["porc_tarjetas_75p"], rng),
+        "porc_uso_revolving": _con_nulos(np.round(rng.beta(2, 2.2, n_filas) * 100, 1),
+                                         TASAS_NULOS["porc_uso_revolving"], rng),
+        "num_cancelaciones_12meses": _con_nulos(rng.poisson(0.01, n_filas), TASAS_NULOS["num_cancelaciones_12meses"], rng),
+        "num_derogatorios": _con_nulos(rng.poisson(0.2, n_filas), TASAS_NULOS["num_derogatorios"], rng),
+        "num_meses_desde_ult_retraso": _con_nulos(rng.integers(0, 150, n_filas), TASAS_NULOS["num_meses_desde_ult_retraso"], rng),
+        "id_prestamo": np.full(n_filas, np.nan),
+        "descripcion": _con_nulos(descripcion, TASAS_NULOS["descripcion"], rng),
+        "finalidad": rng.choice(_FINALIDAD, size=n_filas, p=np.array(_P_FINALIDAD) / sum(_P_FINALIDAD)),
+        "principal": principal,
+        "tipo_interes": tipo_interes,
+        "num_cuotas": np.where(plazo == 36, " 36 months", " 60 months"),
+        "imp_cuota": imp_cuota,
+        "imp_amortizado": np.round(principal * fraccion_amortizada, 2),
+        "estado": estado,
+        "imp_recuperado": imp_recuperado,
+    })
+
+    return df[COLUMNAS_PRESTAMOS]
+
+
+# =============================================================
+# 💾 Función: escribir_prestamos_sinteticos
+# -------------------------------------------------------------
+# ➤ Escribe el CSV por bloques: 10M de filas sin tenerlas en memoria
+# ➤ Cada bloque usa su propia semilla derivada (reproducible)
+# =============================================================
+def escribir_prestamos_sinteticos(
+    n_filas: int,
+    folder_key: str = "raw",
+    filename: str = "prestamos_sinteticos.csv",
+    tamano_bloque: int = 500_000,
+    semilla: int = 42
+):
+    """
+    Genera y guarda un CSV sintético con la forma de prestamos.csv.
+
+    Args:
+        n_filas (int): Número total de filas.
+        folder_key (str): Clave de carpeta en config.yaml ('raw', 'cache'...).
+        filename (str): Nombre del archivo CSV.
+        tamano_bloque (int): Filas generadas y escritas por bloque.
+        semilla (int): Semilla base.
+
+    Returns:
+        Path: Ruta del archivo generado.
+    """
+    ruta = get_file_path(folder_key, filename)
+    ruta.parent.mkdir(parents=True, exist_ok=True)
+
+    semillas = np.random.SeedSequence(semilla).spawn((n_filas + tamano_bloque - 1) // tamano_bloque)
+    for i, inicio in enumerate(range(0, n_filas, tamano_bloque)):
+        bloque = generar_prestamos_sinteticos(
+            min(tamano_bloque, n_filas - inicio),
+            semilla=int(semillas[i].generate_state(1)[0]),
+            id_inicial=1_000_000 + inicio
+        )
+        bloque.to_csv(ruta, mode="w" if i == 0 else "a", header=(i == 0), index=False)
+
+    print(f"✅ {n_filas:,} préstamos sintéticos guardados en: {ruta}")
+    return ruta
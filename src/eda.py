@@ -1,21 +1,73 @@
 # eda.py
 
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
 import numpy as np
-from scipy.stats import gaussian_kde
+
+# matplotlib, seaborn y scipy se importan dentro de las funciones
+# gráficas: cargar datos con este módulo no arrastra la pila de gráficos
 
 
 
 # -----------------------------------------------------------------
 # 💾 Cargar Dataframes
 # -----------------------------------------------------------------
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from utils import load_data, get_file_path
+from cache import fuentes_modificadas
+
+def _origen_dataframe(nombre_archivo: str) -> tuple:
+    """
+    Devuelve (folder_key, filename) del DataFrame: Pickle en cache si está
+    vigente (ver cache.py), si no CSV procesado. Nunca reescribe la caché:
+    solo guardar_multiples_archivos (que conoce las fuentes raw) la registra.
+    Si cambiaron las fuentes previas (p. ej. el CSV raw), Pickle y CSV están
+    igual de desactualizados y se lanza un error.
+    """
+    ruta_pkl = get_file_path("cache", f"{nombre_archivo}.pkl")
+    ruta_csv = get_file_path("processed", f"{nombre_archivo}.csv")
+    desde_pickle = ("cache", f"{nombre_archivo}.pkl")
+    desde_csv = ("processed", f"{nombre_archivo}.csv")
+
+    if not ruta_pkl.exists():
+        return desde_csv
+    if not ruta_csv.exists():
+        print(f"⚠️ {nombre_archivo}.pkl sin validar: no existe el CSV procesado de origen.")
+        return desde_pickle
+
+    modificadas = fuentes_modificadas(f"{nombre_archivo}.pkl")
+    if modificadas is None:
+        # Pickle antiguo sin .meta.json: se usa mientras no sea más viejo que el CSV
+        if ruta_pkl.stat().st_mtime_ns >= ruta_csv.stat().st_mtime_ns:
+            print(f"⚠️ {nombre_archivo}.pkl sin metadatos de caché: se usa sin validar "
+                  f"(regenéralo con guardar_multiples_archivos).")
+            return desde_pickle
+        print(f"⚠️ {nombre_archivo}.pkl sin metadatos y más antiguo que el CSV: se lee el CSV "
+              f"(los tipos category/datetime se pierden).")
+        return desde_csv
+
+    if not modificadas:
+        return desde_pickle
+    if str(ruta_csv.resolve()) in modificadas:
+        print(f"⚠️ {nombre_archivo}.pkl obsoleto: el CSV procesado ha cambiado. Se lee el CSV "
+              f"(los tipos category/datetime se pierden) sin tocar la caché.")
+        return desde_csv
+
+    # Solo cambiaron fuentes previas (p. ej. el CSV raw): CSV y Pickle se
+    # generaron con los datos antiguos, ninguno de los dos es válido
+    raise ValueError(
+        f"❌ {nombre_archivo}.pkl y {nombre_archivo}.csv desactualizados: han cambiado "
+        f"{', '.join(Path(f).name for f in modificadas)}. Vuelve a ejecutar los notebooks "
+        f"que los generan (guardar_multiples_archivos)."
+    )
+
 
 def cargar_dataframes(nombre_archivo: str, alias: str):
     """
     Carga un DataFrame desde cache (Pickle) o procesado (CSV) y lo asigna a un alias.
+    Si el Pickle falta o está obsoleto respecto al CSV, se lee el CSV con un
+    aviso; la caché no se reescribe aquí (perdería los tipos del Pickle y las
+    huellas de las fuentes raw). Si cambiaron las fuentes raw, lanza ValueError.
     
     Parámetros:
     - nombre_archivo: nombre base del archivo sin extensión.
@@ -24,22 +76,48 @@ def cargar_dataframes(nombre_archivo: str, alias: str):
     Retorna:
     - pd.DataFrame
     """
-    ruta_pkl = get_file_path("cache", f"{nombre_archivo}.pkl")
-    ruta_csv = get_file_path("processed", f"{nombre_archivo}.csv")
+    folder_key, filename = _origen_dataframe(nombre_archivo)
+    origen = "Pickle" if folder_key == "cache" else "CSV procesado"
+    print(f"\n{'📦' if folder_key == 'cache' else '📄'} Cargando {alias} desde {origen}...")
+    return load_data(folder_key, filename)
+
+
+# -----------------------------------------------------------------
+# 💾 Cargar varios Dataframes en paralelo
+# -----------------------------------------------------------------
+# ➤ Las lecturas de pandas (pickle, CSV con el motor C / pyarrow)
+#   liberan el GIL, así que un pool de hilos las solapa: el tiempo
+#   total queda acotado por el archivo más grande, no por la suma.
+# -----------------------------------------------------------------
+def cargar_multiples_dataframes(archivos, max_workers: int = None) -> dict:
+    """
+    Carga varios DataFrames de forma concurrente.
+
+    Parámetros:
+    - archivos: dict {alias: nombre_archivo} o lista de nombres (alias = nombre).
+    - max_workers: hilos del pool (por defecto, uno por archivo).
+
+    Retorna:
+    - dict {alias: pd.DataFrame} en el mismo orden de entrada.
+    """
+    if not isinstance(archivos, dict):
+        archivos = {nombre: nombre for nombre in archivos}
+
+    with ThreadPoolExecutor(max_workers=max_workers or len(archivos)) as pool:
+        futuros = {
+            alias: pool.submit(cargar_dataframes, nombre_archivo, alias)
+            for alias, nombre_archivo in archivos.items()
+        }
+        return {alias: futuro.result() for alias, futuro in futuros.items()}
 
-    if ruta_pkl.exists():
-        print(f"\n📦 Cargando {alias} desde Pickle...")
-        return load_data("cache", f"{nombre_archivo}.pkl")
-    else:
-        print(f"\n📄 Cargando {alias} desde CSV procesado...")
-        return load_data("processed", f"{nombre_archivo}.csv")
-    
 
 
 # -----------------------------------------------------------------
 # 🎯 Distribución de la variable objetivo (estado)
 # -----------------------------------------------------------------
 def plot_cat_distribution(df, col, umbral=0.03):
+    import matplotlib.pyplot as plt
+
     freq = df[col].value_counts(normalize=True)
     top15 = freq.head(15)
     total_muestras = df.shape[0]
@@ -143,6 +221,9 @@ def analizar_numericas_univariado(df_num):
     -----------
     df_num : DataFrame que contiene solo variables numéricas
     """
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
     for col in df_num.columns:
         print(f"\n\n📌 Variable numérica: {col.upper()}")
         print(df_num[col].describe().round(2).to_string())
@@ -186,6 +267,9 @@ def plot_density_with_stats_matplotlib(data, col):
     data : DataFrame con la columna numérica
     col  : nombre de la columna a graficar
     """
+    import matplotlib.pyplot as plt
+    from scipy.stats import gaussian_kde
+
     data = data[col].dropna().astype(float)
     mean = data.mean()
     median = data.median()
@@ -231,6 +315,10 @@ def analizar_numericas_univariado(df_num):
     -----------
     df_num : DataFrame con columnas numéricas limpias
     """
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+    from IPython.display import display
+
     for col in df_num.columns:
         print(f"\n\n📌 Variable numérica: {col.upper()}")
         display(df_num[[col]].describe().T.round(2))
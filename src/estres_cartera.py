@@ -0,0 +1,164 @@
+# =============================================================
+# 📦 src/estres_cartera.py — Test de estrés de la cartera puntuada
+# -------------------------------------------------------------
+# Aplica escenarios de shock a toda la cartera de una vez:
+#   • multiplicadores de PD global y por segmento (rating_ord, finalidad...)
+#   • desplazamiento del tipo base
+#   • cambio de LGD
+# y recalcula interés, cuota y pérdida esperada de cada préstamo con
+# las fórmulas de pricing.py.
+#
+# El cálculo es una única operación vectorizada escenarios x préstamos
+# (por bloques de préstamos para acotar memoria) y la agregación por
+# (escenario, segmento) es un solo np.bincount sobre índice aplanado.
+# =============================================================
+
+import numpy as np
+import pandas as pd
+
+from pricing import calcular_cuota_mensual, parametros_pricing
+
+
+# -------------------------------------------------------------
+# 🧾 Escenarios
+# -------------------------------------------------------------
+# Cada escenario es un dict con (todas las claves opcionales):
+#   nombre, multiplicador_pd, multiplicadores_segmento
+#   ({columna: {valor: multiplicador}}), delta_tipo_base, lgd
+# -------------------------------------------------------------
+ESCENARIOS_EJEMPLO = [
+    {"nombre": "base"},
+    {"nombre": "adverso", "multiplicador_pd": 1.5, "delta_tipo_base": 0.01, "lgd": 0.55},
+    {"nombre": "severo", "multiplicador_pd": 2.0, "delta_tipo_base": 0.02, "lgd": 0.65,
+     "multiplicadores_segmento": {"finalidad": {"small_business": 1.5}}},
+]
+
+
+def _matriz_multiplicadores(escenarios: list, cartera: pd.DataFrame) -> np.ndarray:
+    # Multiplicador de PD de cada (escenario, préstamo) como producto de
+    # factores por columna: se construye por códigos de valor, no por fila
+    multiplicador = np.array([e.get("multiplicador_pd", 1.0) for e in escenarios])[:, None]
+    multiplicador = np.broadcast_to(multiplicador, (len(escenarios), len(cartera))).copy()
+
+    columnas = {c for e in escenarios for c in e.get("multiplicadores_segmento", {})}
+    for columna in columnas:
+        if columna not in cartera.columns:
+            raise ValueError(f"❌ La cartera no tiene la columna de segmento '{columna}'.")
+        codigos, valores = pd.factorize(cartera[columna], use_na_sentinel=False)
+        tabla = np.ones((len(escenarios), len(valores)))
+        for s, escenario in enumerate(escenarios):
+            for valor, factor in escenario.get("multiplicadores_segmento", {}).get(columna, {}).items():
+                tabla[s, valores == valor] = factor
+        multiplicador *= tabla[:, codigos]
+    return multiplicador
+
+
+# =============================================================
+# 🌪️ Función: estresar_cartera
+# -------------------------------------------------------------
+# ➤ PD estresada = min(PD · multiplicadores, 1)
+# ➤ Interés = (tipo_base + Δ) + coef_riesgo · PD estresada
+# ➤ Cuota (sistema francés) y pérdida esperada = PD · LGD · principal
+# ➤ Agregado por escenario y segmento
+# =============================================================
+def estresar_cartera(
+    cartera: pd.DataFrame,
+    escenarios: list = None,
+    segmentar_por: list = ("rating_ord",),
+    col_pd: str = "PD",
+    col_principal: str = "principal",
+    col_cuotas: str = "num_cuotas",
+    tamano_bloque: int = 200_000,
+    coef_riesgo: float = None
+) -> pd.DataFrame:
+    """
+    Recalcula interés, cuota y pérdida esperada de la cartera bajo varios escenarios.
+
+    Args:
+        cartera (pd.DataFrame): Préstamos puntuados (PD, principal, num_cuotas y
+            columnas de segmento).
+        escenarios (list): Lista de dicts de escenario (ver ESCENARIOS_EJEMPLO).
+        segmentar_por (list): Columnas de agregación (vacío = solo total).
+        col_pd, col_principal, col_cuotas (str): Nombres de columna.
+        tamano_bloque (int): Préstamos por bloque (memoria ≈ escenarios x bloque).
+        coef_riesgo (float, opcional): Margen por PD (por defecto, config.yaml).
+
+    Returns:
+        pd.DataFrame: Una fila por (escenario, segmento) con n_prestamos, exposicion,
+        pd_media, interes_medio (ponderado por principal), cuota_total y perdida_esperada.
+    """
+    escenarios = escenarios or ESCENARIOS_EJEMPLO
+    parametros = parametros_pricing()
+    coef_riesgo = parametros["coef_riesgo"] if coef_riesgo is None else coef_riesgo
+
+    nombres = [e.get("nombre", f"escenario_{s}") for s, e in enumerate(escenarios)]
+    tipo_base = np.array([parametros["tipo_base"] + e.get("delta_tipo_base", 0.0) for e in escenarios])[:, None]
+    lgd = np.array([e.get("lgd", parametros["lgd"]) for e in escenarios])[:, None]
+
+    segmentar_por = list(segmentar_por)
+    if segmentar_por:
+        grupos = cartera.groupby(segmentar_por, sort=True, dropna=False)
+        segmento = grupos.ngroup().to_numpy()
+        etiquetas = pd.DataFrame(list(grupos.groups.keys()), columns=segmentar_por)
+    else:
+        segmento = np.zeros(len(cartera), dtype=np.int64)
+        etiquetas = pd.DataFrame(index=[0])
+    n_segmentos = len(etiquetas)
+    n_escenarios = len(escenarios)
+
+    pd_base = cartera[col_pd].to_numpy(dtype=np.float64)
+    principal = cartera[col_principal].to_numpy(dtype=np.float64)
+    cuotas = cartera[col_cuotas].to_numpy(dtype=np.float64)
+
+    # Exposición y número de préstamos no dependen del escenario
+    conteo = np.bincount(segmento, minlength=n_segmentos).astype(np.float64)
+    exposicion = np.bincount(segmento, weights=principal, minlength=n_segmentos)
+
+    # Acumuladores (escenario x segmento), aplanados para bincount. Interés
+    # medio y pérdida se derivan de Σ PD·principal: tipo_base·E + coef·ΣPD·P
+    # y LGD·ΣPD·P, así que basta con tres sumas por bloque
+    tamano = n_escenarios * n_segmentos
+    suma_pd = np.zeros(tamano)
+    suma_pd_principal = np.zeros(tamano)
+    suma_cuota = np.zeros(tamano)
+
+    for inicio in range(0, len(cartera), tamano_bloque):
+        bloque = slice(inicio, min(inicio + tamano_bloque, len(cartera)))
+
+        pd_estres = np.minimum(pd_base[bloque] * _matriz_multiplicadores(escenarios, cartera.iloc[bloque]), 1.0)
+        cuota = calcular_cuota_mensual(principal[bloque], tipo_base + coef_riesgo * pd_estres, cuotas[bloque])
+
+        # Índice aplanado: escenario * n_segmentos + segmento
+        indice = (np.arange(n_escenarios)[:, None] * n_segmentos + segmento[bloque]).ravel()
+        suma_pd += np.bincount(indice, weights=pd_estres.ravel(), minlength=tamano)
+        suma_pd_principal += np.bincount(indice, weights=(pd_estres * principal[bloque]).ravel(), minlength=tamano)
+        suma_cuota += np.bincount(indice, weights=cuota.ravel(), minlength=tamano)
+
+    suma_pd_principal = suma_pd_principal.reshape(n_escenarios, n_segmentos)
+    resultado = pd.concat([etiquetas] * n_escenarios, ignore_index=True)
+    resultado.insert(0, "escenario", np.repeat(nombres, n_segmentos))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        resultado["n_prestamos"] = np.tile(conteo, n_escenarios).astype(np.int64)
+        resultado["exposicion"] = np.tile(exposicion, n_escenarios)
+        resultado["pd_media"] = suma_pd / np.tile(conteo, n_escenarios)
+        resultado["interes_medio"] = (tipo_base + coef_riesgo * suma_pd_principal / exposicion).ravel()
+        resultado["cuota_total"] = suma_cuota
+        resultado["perdida_esperada"] = (lgd * suma_pd_principal).ravel()
+    return resultado
+
+
+def resumen_escenarios(resultado: pd.DataFrame) -> pd.DataFrame:
+    """
+    Totales por escenario (suma de segmentos) y variación de la pérdida frente al primero.
+    """
+    total = resultado.groupby("escenario", sort=False).agg(
+        n_prestamos=("n_prestamos", "sum"),
+        exposicion=("exposicion", "sum"),
+        cuota_total=("cuota_total", "sum"),
+        perdida_esperada=("perdida_esperada", "sum"),
+    )
+    total["tasa_perdida"] = total["perdida_esperada"] / total["exposicion"]
+    total["var_perdida_vs_base"] = total["perdida_esperada"] / total["perdida_esperada"].iloc[0] - 1
+    print("\n🌪️ Test de estrés de la cartera:")
+    print(total.round(4).to_string())
+    return total.reset_index()
@@ -0,0 +1,166 @@
+# =============================================================
+# 📦 src/explicaciones.py — Códigos de motivo por préstamo
+# -------------------------------------------------------------
+# Explica cada PD individual (solicitudes denegadas o con interés
+# alto) con las k variables que más la empujan hacia arriba:
+#   • contribuciones por recorrido de árbol del modelo HGB
+#     (importancia_variables.contribuciones_arbol)
+#   • las dummies One-Hot se suman a su variable de origen con un
+#     único producto matricial; con el Pipeline del notebook 05 el
+#     origen sale de su OneHotEncoder ('cat__empleo_reducido_BASICO'
+#     → 'empleo_reducido', 'num__rating_ord' → 'rating_ord')
+#   • top-k por fila con np.argpartition, por bloques de filas
+#
+# base + suma de aportes = log-odds del modelo, así que la PD que se
+# devuelve es exactamente la de predict_proba.
+# =============================================================
+
+import numpy as np
+import pandas as pd
+from scipy.special import expit
+
+from importancia_variables import agrupar_columnas_one_hot, contribuciones_arbol
+
+
+# =============================================================
+# 🧩 Función: contribuciones_por_variable
+# -------------------------------------------------------------
+# ➤ Contribuciones (log-odds) por variable de origen
+# ➤ Matriz de agregación columnas x variables (0/1)
+# =============================================================
+def contribuciones_por_variable(modelo, X, variables_nominales: list = None) -> tuple:
+    """
+    Contribución de cada variable de origen a la predicción de cada fila.
+
+    Args:
+        modelo: HistGradientBoostingClassifier (o Pipeline que lo contenga).
+        X (pd.DataFrame | np.ndarray): Filas a explicar.
+        variables_nominales (list, opcional): Variables One-Hot a reagrupar
+            (solo sin Pipeline; con Pipeline se usa su codificador).
+
+    Returns:
+        tuple: (contribuciones n_filas x n_variables_origen, base en log-odds,
+        nombres de las variables de origen)
+    """
+    contribuciones, base, columnas = contribuciones_arbol(modelo, X)
+    grupos = agrupar_columnas_one_hot(columnas, variables_nominales, modelo=modelo)
+
+    agregacion = np.zeros((len(columnas), len(grupos)))
+    for j, posiciones in enumerate(grupos.values()):
+        agregacion[posiciones, j] = 1.0
+    return contribuciones @ agregacion, base, [str(g) for g in grupos]
+
+
+def _top_k(aportes: np.ndarray, k: int) -> np.ndarray:
+    # Índices de los k mayores aportes por fila, ordenados de mayor a menor
+    if k < aportes.shape[1]:
+        candidatos = np.argpartition(-aportes, k - 1, axis=1)[:, :k]
+    else:
+        candidatos = np.broadcast_to(np.arange(aportes.shape[1]), aportes.shape)
+    orden = np.argsort(-np.take_along_axis(aportes, candidatos, axis=1), axis=1, kind="stable")
+    return np.take_along_axis(candidatos, orden, axis=1)
+
+
+# =============================================================
+# 🏷️ Función: codigos_motivo
+# -------------------------------------------------------------
+# ➤ PD + top-k motivos (variable y aporte en log-odds) por préstamo
+# ➤ umbral_pd: solo se explican las filas con PD ≥ umbral
+# ➤ Solo motivos desfavorables (aporte > 0) por defecto
+# =============================================================
+def codigos_motivo(
+    modelo,
+    X,
+    k: int = 3,
+    variables_nominales: list = None,
+    umbral_pd: float = None,
+    solo_desfavorables: bool = True,
+    tamano_bloque: int = 100_000
+) -> pd.DataFrame:
+    """
+    Calcula los códigos de motivo (top-k variables que suben la PD) de un lote.
+
+    Args:
+        modelo: HistGradientBoostingClassifier (o Pipeline que lo contenga).
+        X (pd.DataFrame | np.ndarray): Solicitudes con las variables del modelo
+            (las columnas sobrantes, p. ej. de valorar_solicitudes, se ignoran).
+        k (int): Número de motivos por préstamo.
+        variables_nominales (list, opcional): Variables One-Hot a reagrupar
+            (solo sin Pipeline; con Pipeline se usa su codificador).
+        umbral_pd (float, opcional): Explicar solo filas con PD ≥ umbral
+            (p. ej. las denegadas).
+        solo_desfavorables (bool): Descartar motivos con aporte ≤ 0.
+        tamano_bloque (int): Filas por bloque (memoria ≈ bloque x columnas).
+
+    Returns:
+        pd.DataFrame: Con el índice de X: PD, motivo_1..k y aporte_1..k
+        (log-odds). Los huecos sin motivo desfavorable quedan vacíos.
+    """
+    if isinstance(X, pd.DataFrame):
+        X = X[list(getattr(modelo, "feature_names_in_", X.columns))]
+        indice = X.index
+    else:
+        X = np.asarray(X)
+        indice = pd.RangeIndex(len(X))
+
+    if umbral_pd is not None:
+        seleccion = modelo.predict_proba(X)[:, 1] >= umbral_pd
+        X = X[seleccion]
+        indice = indice[seleccion]
+
+    bloques = []
+    for inicio in range(0, len(indice), tamano_bloque):
+        bloque = slice(inicio, inicio + tamano_bloque)
+        X_bloque = X.iloc[bloque] if isinstance(X, pd.DataFrame) else X[bloque]
+        aportes, base, variables = contribuciones_por_variable(modelo, X_bloque, variables_nominales)
+
+        k_efectivo = min(k, aportes.shape[1])
+        posiciones = _top_k(aportes, k_efectivo)
+        top_aportes = np.take_along_axis(aportes, posiciones, axis=1)
+        top_motivos = np.asarray(variables, dtype=object)[posiciones]
+        if solo_desfavorables:
+            top_motivos[top_aportes <= 0] = None
+            top_aportes = np.where(top_aportes > 0, top_aportes, np.nan)
+
+        datos = {"PD": expit(base + aportes.sum(axis=1))}
+        for i in range(k_efectivo):
+            datos[f"motivo_{i + 1}"] = top_motivos[:, i]
+            datos[f"aporte_{i + 1}"] = top_aportes[:, i]
+        bloques.append(pd.DataFrame(datos, index=indice[bloque]))
+
+    if not bloques:
+        print("⚠️ Ninguna fila supera el umbral de PD: no hay préstamos que explicar.")
+        return pd.DataFrame(index=indice[:0])
+
+    resultado = pd.concat(bloques)
+    print(f"✅ Códigos de motivo calculados para {len(resultado):,} préstamos (top {k}).")
+    return resultado
+
+
+# =============================================================
+# 📊 Función: frecuencia_motivos
+# -------------------------------------------------------------
+# ➤ Cuántas veces aparece cada variable como motivo principal
+# =============================================================
+def frecuencia_motivos(codigos: pd.DataFrame, columna: str = "motivo_1") -> pd.DataFrame:
+    """
+    Resume los motivos de un lote: préstamos por motivo y aporte medio.
+
+    Args:
+        codigos (pd.DataFrame): Salida de codigos_motivo().
+        columna (str): Posición del motivo a resumir ('motivo_1' = principal).
+
+    Returns:
+        pd.DataFrame: motivo, n_prestamos, porcentaje y aporte_medio.
+    """
+    aporte = columna.replace("motivo_", "aporte_")
+    resumen = (
+        codigos.dropna(subset=[columna])
+        .groupby(columna)
+        .agg(n_prestamos=(aporte, "size"), aporte_medio=(aporte, "mean"))
+        .sort_values("n_prestamos", ascending=False)
+        .rename_axis("motivo")
+        .reset_index()
+    )
+    resumen["porcentaje"] = resumen["n_prestamos"] / len(codigos) * 100
+    return resumen[["motivo", "n_prestamos", "porcentaje", "aporte_medio"]]
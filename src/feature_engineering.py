@@ -1,7 +1,52 @@
 
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
+from perfilado import perfilar_etapa
+
+# -------------------------------------------------------------
+# 🎚️ Precisión de las variables del modelo
+# -------------------------------------------------------------
+# "float64": comportamiento original (8 bytes por celda).
+# "float32": continuas y ordinales en float32, indicadores (dummies y
+# target) en uint8. Al combinarse, pandas/numpy resuelven la matriz
+# a float32 sin pasar por float64.
+# -------------------------------------------------------------
+PRECISIONES = {
+    "float64": {"continua": np.float64, "indicador": np.float64, "objetivo": np.int64},
+    "float32": {"continua": np.float32, "indicador": np.uint8, "objetivo": np.uint8},
+}
+
+
+def tipos_precision(precision: str = "float64") -> dict:
+    """
+    Devuelve los dtypes (continua, indicador, objetivo) de un modo de precisión.
+    """
+    if precision not in PRECISIONES:
+        raise ValueError(f"❌ Precisión no soportada: '{precision}'. Usa {list(PRECISIONES)}.")
+    return PRECISIONES[precision]
+
+
+# Estados considerados impago (target = 1)
+VALORES_IMPAGO = [
+    "Charged Off",
+    "Does not meet the credit policy. Status:Charged Off",
+    "Default",
+]
+
+
+def marcar_impago(estado: pd.Series, precision: str = "float64") -> np.ndarray:
+    """
+    Núcleo sin salida por pantalla de crear_variable_objetivo: 1 si el estado es impago.
+
+    Args:
+        estado (pd.Series): Estado del préstamo.
+        precision (str): 'float64' (int64) o 'float32' (uint8).
+
+    Returns:
+        np.ndarray: Objetivo binario.
+    """
+    return estado.isin(VALORES_IMPAGO).to_numpy(dtype=tipos_precision(precision)["objetivo"])
+
 
 # =============================================================
 # 🎯 Función: crear_variable_objetivo
@@ -10,7 +55,8 @@ import matplotlib.pyplot as plt
 # ➤ Devuelve el DataFrame actualizado y la serie objetivo
 # ➤ Incluye explicación detallada de qué categorías se consideran impago
 # =============================================================
-def crear_variable_objetivo(df: pd.DataFrame, col_estado: str = "estado") -> tuple:
+@perfilar_etapa
+def crear_variable_objetivo(df: pd.DataFrame, col_estado: str = "estado", precision: str = "float64") -> tuple:
     """
     Crea una variable binaria 'target' a partir de la columna 'estado'.
 
@@ -21,6 +67,7 @@ def crear_variable_objetivo(df: pd.DataFrame, col_estado: str = "estado") -> tup
     Args:
         df (pd.DataFrame): DataFrame de entrada con la columna 'estado'
         col_estado (str): Nombre de la columna que contiene el estado del préstamo
+        precision (str): 'float64' (target int64) o 'float32' (target uint8)
 
     Returns:
         df_actualizado (pd.DataFrame): DataFrame sin la columna original y con 'target'
@@ -30,11 +77,7 @@ def crear_variable_objetivo(df: pd.DataFrame, col_estado: str = "estado") -> tup
     df = df.copy()
 
     # Valores considerados como impago
-    valores_impago = [
-        "Charged Off",
-        "Does not meet the credit policy. Status:Charged Off",
-        "Default"
-    ]
+    valores_impago = VALORES_IMPAGO
 
     # Mostrar resumen de categorías
     print("\n📊 Categorías únicas en columna de estado:")
@@ -48,7 +91,7 @@ def crear_variable_objetivo(df: pd.DataFrame, col_estado: str = "estado") -> tup
     print("➡ Todas las demás se consideran NO impago (target = 0)")
 
     # Crear columna target
-    df["target"] = np.where(df[col_estado].isin(valores_impago), 1, 0)
+    df["target"] = marcar_impago(df[col_estado], precision)
 
     # Verificación de resultados
     print("\n✅ Distribución de 'target':")
@@ -61,11 +104,34 @@ def crear_variable_objetivo(df: pd.DataFrame, col_estado: str = "estado") -> tup
 
     # Mostrar el DataFrame resultante si se indica
     print("\n📋 Vista previa del DataFrame actualizado (sin 'estado', con 'target'):")
+    from IPython.display import display
     display(df)
 
     return df, df["target"]
 
 
+# =============================================================
+# 🔎 Función: categorias_poco_frecuentes
+# -------------------------------------------------------------
+# ➤ Criterio común de agrupación de categorías raras
+# ➤ Lo usan agrupar_categorias, reagrupar_categorias_existente
+#   y el monitor de deriva (monitor_deriva.py)
+# =============================================================
+def categorias_poco_frecuentes(variable: pd.Series, criterio: float = 5.0) -> pd.Index:
+    """
+    Devuelve las categorías con frecuencia relativa menor que `criterio` (en %).
+
+    Args:
+        variable (pd.Series): Variable categórica.
+        criterio (float): Umbral en porcentaje (ej: 0.5 = 0.5%).
+
+    Returns:
+        pd.Index: Categorías poco frecuentes.
+    """
+    frecuencias = variable.value_counts(normalize=True)
+    return frecuencias[frecuencias < criterio / 100].index
+
+
 # =============================================================
 # 🎯 Función: agrupar_categorias
 # -------------------------------------------------------------
@@ -74,6 +140,7 @@ def crear_variable_objetivo(df: pd.DataFrame, col_estado: str = "estado") -> tup
 # ➤ Muestra gráfico de frecuencias absolutas y relativas
 # ➤ Permite usar 'criterio' en porcentaje, más intuitivo (ej: 0.5 = 0.5%)
 # =============================================================
+@perfilar_etapa
 def agrupar_categorias(variable: pd.Series, criterio: float = 5.0) -> pd.Series:
     """
     Agrupa las categorías poco frecuentes de una variable categórica bajo la etiqueta 'OTROS',
@@ -97,11 +164,7 @@ def agrupar_categorias(variable: pd.Series, criterio: float = 5.0) -> pd.Series:
     else:
         print("✅ Valores nulos: 0")
 
-    # Convertir criterio de porcentaje a proporción
-    criterio_proporcion = criterio / 100
-
-    frecuencias = variable.value_counts(normalize=True)
-    categorias_raras = frecuencias[frecuencias < criterio_proporcion].index
+    categorias_raras = categorias_poco_frecuentes(variable, criterio)
     variable_agrupada = np.where(variable.isin(categorias_raras), 'OTROS', variable)
     variable_agrupada = pd.Series(variable_agrupada, index=variable.index)
 
@@ -110,6 +173,8 @@ def agrupar_categorias(variable: pd.Series, criterio: float = 5.0) -> pd.Series:
     conteo_rel = variable_agrupada.value_counts(normalize=True) * 100
 
     # Gráfico
+    import matplotlib.pyplot as plt
+
     plt.figure(figsize=(10, 5))
     barras = plt.bar(conteo_abs.index, conteo_rel, alpha=0.7)
 
@@ -139,6 +204,7 @@ def agrupar_categorias(variable: pd.Series, criterio: float = 5.0) -> pd.Series:
 # ➤ Lanza error si la categoría destino no existe
 # ➤ Muestra gráfico de barras con frecuencias absolutas y relativas tras la reagrupación
 # =============================================================
+@perfilar_etapa
 def reagrupar_categorias_existente(variable: pd.Series, criterio: float, categoria_objetivo: str) -> pd.Series:
     """
     Reasigna las categorías con frecuencia menor a un umbral a una categoría ya existente.
@@ -167,12 +233,8 @@ def reagrupar_categorias_existente(variable: pd.Series, criterio: float, categor
     if categoria_objetivo not in variable.unique():
         raise ValueError(f"❌ La categoría objetivo '{categoria_objetivo}' no existe en la variable.")
 
-    # Convertir criterio de porcentaje a proporción
-    criterio_proporcion = criterio / 100
-
     # Identificar categorías poco frecuentes
-    frecuencias = variable.value_counts(normalize=True)
-    categorias_a_reagrupar = frecuencias[frecuencias < criterio_proporcion].index
+    categorias_a_reagrupar = categorias_poco_frecuentes(variable, criterio)
 
     # Reagrupar en la categoría objetivo
     variable_reagrupada = variable.apply(lambda x: categoria_objetivo if x in categorias_a_reagrupar else x)
@@ -183,6 +245,8 @@ def reagrupar_categorias_existente(variable: pd.Series, criterio: float, categor
     conteo_rel = variable_reagrupada.value_counts(normalize=True) * 100
 
     # Gráfico
+    import matplotlib.pyplot as plt
+
     plt.figure(figsize=(10, 5))
     barras = plt.bar(conteo_abs.index, conteo_rel, alpha=0.7)
 
@@ -212,15 +276,15 @@ def reagrupar_categorias_existente(variable: pd.Series, criterio: float, categor
 # ➤ handle_unknown='ignore' evita errores si aparecen nuevas categorías en producción
 # =============================================================
 
-from sklearn.preprocessing import OneHotEncoder
-
-def codificar_one_hot(cat: pd.DataFrame, variables: list) -> pd.DataFrame:
+@perfilar_etapa
+def codificar_one_hot(cat: pd.DataFrame, variables: list, precision: str = "float64") -> pd.DataFrame:
     """
     Aplica One-Hot Encoding a variables nominales sin eliminar columnas dummy.
 
     Args:
         cat (pd.DataFrame): DataFrame con variables categóricas y target.
         variables (list): Lista de columnas nominales a codificar.
+        precision (str): 'float64' o 'float32' (dummies en uint8).
 
     Returns:
         pd.DataFrame: DataFrame con variables codificadas y originales eliminadas.
@@ -228,7 +292,10 @@ def codificar_one_hot(cat: pd.DataFrame, variables: list) -> pd.DataFrame:
     cat = cat.copy()
 
     # Configurar codificador con scikit-learn
-    ohe = OneHotEncoder(drop=None, handle_unknown='ignore', sparse_output=False)
+    from sklearn.preprocessing import OneHotEncoder
+
+    ohe = OneHotEncoder(drop=None, handle_unknown='ignore', sparse_output=False,
+                        dtype=tipos_precision(precision)["indicador"])
 
     # Transformar y obtener nombres de columnas codificadas
     codificado = ohe.fit_transform(cat[variables])
@@ -253,9 +320,9 @@ def codificar_one_hot(cat: pd.DataFrame, variables: list) -> pd.DataFrame:
 # ➤ Elimina las columnas originales y añade las columnas codificadas
 # =============================================================
 
-from sklearn.preprocessing import OrdinalEncoder
-
-def codificar_ordinal(cat: pd.DataFrame, variables: list, categorias_ordenadas: list) -> pd.DataFrame:
+@perfilar_etapa
+def codificar_ordinal(cat: pd.DataFrame, variables: list, categorias_ordenadas: list,
+                      precision: str = "float64") -> pd.DataFrame:
     """
     Codifica múltiples variables ordinales en el DataFrame `cat` con orden explícito.
 
@@ -263,6 +330,7 @@ def codificar_ordinal(cat: pd.DataFrame, variables: list, categorias_ordenadas:
         cat (pd.DataFrame): DataFrame con variables categóricas y target.
         variables (list): Lista de columnas ordinales a codificar.
         categorias_ordenadas (list): Lista de listas con el orden por variable.
+        precision (str): 'float64' o 'float32'.
 
     Returns:
         pd.DataFrame: DataFrame actualizado con columnas ordinales codificadas.
@@ -274,7 +342,9 @@ def codificar_ordinal(cat: pd.DataFrame, variables: list, categorias_ordenadas:
         raise ValueError("❌ La cantidad de variables no coincide con la cantidad de listas de orden.")
 
     # Codificador ordinal con orden definido
-    oe = OrdinalEncoder(categories=categorias_ordenadas)
+    from sklearn.preprocessing import OrdinalEncoder
+
+    oe = OrdinalEncoder(categories=categorias_ordenadas, dtype=tipos_precision(precision)["continua"])
     codificado = oe.fit_transform(cat[variables])
 
     columnas_codificadas = [f"{var}_ord" for var in variables]
@@ -293,27 +363,36 @@ def codificar_ordinal(cat: pd.DataFrame, variables: list, categorias_ordenadas:
 # -------------------------------------------------------------
 # ➤ Aplica MinMaxScaler solo a las variables seleccionadas
 # ➤ Ignora las que no existan en el DataFrame
+# ➤ En modo 'float32' también convierte el resto de columnas
+#   numéricas (conteos, binarias...): así `num` entero es float32
 # ➤ Devuelve el DataFrame actualizado
 # =============================================================
 
-from sklearn.preprocessing import MinMaxScaler
-
-def escalar_variables_numericas(num: pd.DataFrame, variables_a_escalar: list) -> pd.DataFrame:
+@perfilar_etapa
+def escalar_variables_numericas(num: pd.DataFrame, variables_a_escalar: list, precision: str = "float64") -> pd.DataFrame:
     """
     Escala las variables numéricas seleccionadas usando MinMaxScaler.
 
     Args:
         num (pd.DataFrame): DataFrame numérico original
         variables_a_escalar (list): Lista de columnas a escalar
+        precision (str): 'float64' (las no escaladas conservan su tipo) o
+            'float32' (todas las numéricas en float32; MinMaxScaler lo conserva)
 
     Returns:
         pd.DataFrame: DataFrame con variables escaladas
     """
     num = num.copy()
+    from sklearn.preprocessing import MinMaxScaler
+
     scaler = MinMaxScaler()
 
     columnas_presentes = [col for col in variables_a_escalar if col in num.columns]
-    num[columnas_presentes] = scaler.fit_transform(num[columnas_presentes])
+    dtype = tipos_precision(precision)["continua"]
+    escaladas = scaler.fit_transform(num[columnas_presentes].to_numpy(dtype=dtype))
+    convertir = num.select_dtypes(include="number").columns if precision != "float64" else columnas_presentes
+    num = num.astype({col: dtype for col in convertir})
+    num[columnas_presentes] = escaladas
 
     return num
 
@@ -0,0 +1,314 @@
+# =============================================================
+# 📦 src/feature_store.py — Almacén local de variables por cliente
+# -------------------------------------------------------------
+# Guarda el vector final de variables (tras feature engineering) de
+# cada préstamo en SQLite, indexado por (id_cliente, id_prestamo):
+#   • tabla `variables` WITHOUT ROWID → la clave primaria es el propio
+#     B-tree: búsquedas por id en O(log n)
+#   • cada vector se guarda como BLOB en el tipo de la matriz de origen
+#     (float64 por defecto, float32 en modo precision='float32'), sin
+#     pérdida respecto a lo que vio el modelo al entrenar
+#   • tabla `esquema` con los nombres de columna y el tipo de cada versión
+#   • una conexión por store (y por hilo), reutilizada entre consultas
+#
+# Re-puntuar o re-preciar clientes existentes tras actualizar el
+# modelo lee directamente de aquí: sin limpieza ni codificación.
+# =============================================================
+
+import json
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from utils import get_file_path
+
+ARCHIVO_STORE = "feature_store.sqlite"
+SIN_PRESTAMO = -1   # id_prestamo viene vacío en prestamos.csv
+TIPOS_VECTOR = ("float32", "float64")
+
+_CONEXIONES = {}    # (ruta, hilo) → conexión abierta
+
+_ESQUEMA_SQL = """
+CREATE TABLE IF NOT EXISTS esquema (
+    version   INTEGER PRIMARY KEY,
+    columnas  TEXT NOT NULL,
+    fecha     TEXT NOT NULL,
+    tipo      TEXT NOT NULL DEFAULT 'float32'
+);
+CREATE TABLE IF NOT EXISTS variables (
+    id_cliente      INTEGER NOT NULL,
+    id_prestamo     INTEGER NOT NULL DEFAULT -1,
+    version_esquema INTEGER NOT NULL REFERENCES esquema(version),
+    vector          BLOB NOT NULL,
+    actualizado     TEXT NOT NULL,
+    PRIMARY KEY (id_cliente, id_prestamo)
+) WITHOUT ROWID;
+"""
+
+
+# -------------------------------------------------------------
+# 🔌 Conexión
+# -------------------------------------------------------------
+# WAL permite leer (scoring) mientras el pipeline escribe. La
+# conexión se abre (y el esquema se crea) una sola vez por store y
+# por hilo; las consultas siguientes la reutilizan.
+# -------------------------------------------------------------
+def conectar_store(ruta=None) -> sqlite3.Connection:
+    """
+    Devuelve la conexión al feature store (la abre y lo crea la primera vez).
+
+    Args:
+        ruta (Path | str, opcional): Archivo SQLite; por defecto data/cache/feature_store.sqlite.
+
+    Returns:
+        sqlite3.Connection
+    """
+    ruta = Path(ruta or get_file_path("cache", ARCHIVO_STORE)).resolve()
+    clave = (str(ruta), threading.get_ident())
+    con = _CONEXIONES.get(clave)
+    if con is not None:
+        return con
+
+    ruta.parent.mkdir(parents=True, exist_ok=True)
+    con = sqlite3.connect(ruta)
+    con.execute("PRAGMA journal_mode=WAL")
+    con.execute("PRAGMA synchronous=NORMAL")
+    con.executescript(_ESQUEMA_SQL)
+    # Stores anteriores sin columna 'tipo': sus vectores son float32
+    if "tipo" not in {c[1] for c in con.execute("PRAGMA table_info(esquema)")}:
+        with con:
+            con.execute("ALTER TABLE esquema ADD COLUMN tipo TEXT NOT NULL DEFAULT 'float32'")
+    _CONEXIONES[clave] = con
+    return con
+
+
+def cerrar_store(ruta=None):
+    """
+    Cierra las conexiones abiertas al feature store (todas si ruta es None).
+    """
+    ruta = None if ruta is None else str(Path(ruta).resolve())
+    for clave in [c for c in _CONEXIONES if ruta is None or c[0] == ruta]:
+        _CONEXIONES.pop(clave).close()
+
+
+def _version_esquema(con: sqlite3.Connection, columnas: list, tipo: str) -> int:
+    # Reutiliza la última versión si las columnas y el tipo no han cambiado
+    fila = con.execute("SELECT version, columnas, tipo FROM esquema ORDER BY version DESC LIMIT 1").fetchone()
+    if fila and json.loads(fila[1]) == list(columnas) and fila[2] == tipo:
+        return fila[0]
+    version = (fila[0] + 1) if fila else 1
+    con.execute("INSERT INTO esquema (version, columnas, fecha, tipo) VALUES (?, ?, ?, ?)",
+                (version, json.dumps(list(columnas)), datetime.now().isoformat(timespec="seconds"), tipo))
+    return version
+
+
+def _columnas_esquema(con: sqlite3.Connection) -> dict:
+    return {v: (json.loads(c), t) for v, c, t in con.execute("SELECT version, columnas, tipo FROM esquema")}
+
+
+# =============================================================
+# 💾 Función: guardar_variables
+# -------------------------------------------------------------
+# ➤ Upsert masivo (INSERT ... ON CONFLICT DO UPDATE) por lotes
+# ➤ Una sola transacción por lote
+# =============================================================
+def guardar_variables(
+    df: pd.DataFrame,
+    columnas: list = None,
+    col_cliente: str = "id_cliente",
+    col_prestamo: str = "id_prestamo",
+    ruta=None,
+    tamano_lote: int = 50_000,
+    dtype: str = None
+) -> int:
+    """
+    Inserta o actualiza los vectores de variables de cada préstamo.
+
+    Args:
+        df (pd.DataFrame): Variables finales con las columnas de id
+            (limpiar_variables_basicas(..., conservar_ids=True)).
+        columnas (list, opcional): Variables a guardar; por defecto todas las
+            numéricas salvo ids y 'target'.
+        col_cliente (str): Columna con el id de cliente.
+        col_prestamo (str): Columna con el id de préstamo (vacío → -1).
+        ruta (Path | str, opcional): Archivo SQLite.
+        tamano_lote (int): Filas por transacción.
+        dtype (str, opcional): 'float32' o 'float64'; por defecto float32 solo si
+            todas las variables caben sin pérdida (precision='float32'), si no float64.
+
+    Returns:
+        int: Número de filas escritas.
+    """
+    if col_cliente not in df.columns:
+        raise ValueError(f"❌ Falta la columna '{col_cliente}'. Usa limpiar_variables_basicas(..., conservar_ids=True).")
+
+    if columnas is None:
+        excluir = {col_cliente, col_prestamo, "target"}
+        columnas = [c for c in df.select_dtypes(include="number").columns if c not in excluir]
+
+    ids_cliente = df[col_cliente].to_numpy(dtype=np.int64)
+    ids_prestamo = (df[col_prestamo].fillna(SIN_PRESTAMO).to_numpy(dtype=np.int64)
+                    if col_prestamo in df.columns else np.full(len(df), SIN_PRESTAMO, dtype=np.int64))
+    if dtype is None:
+        # float32 solo si no pierde nada (float32, dummies uint8...); si no, float64
+        sin_perdida = all(isinstance(t, np.dtype) and np.can_cast(t, np.float32) for t in df[columnas].dtypes)
+        dtype = "float32" if sin_perdida else "float64"
+    if dtype not in TIPOS_VECTOR:
+        raise ValueError(f"❌ Tipo de vector no soportado: '{dtype}'. Usa {TIPOS_VECTOR}.")
+    X = np.ascontiguousarray(df[columnas].to_numpy(dtype=dtype))
+    ancho = X.shape[1] * X.itemsize
+
+    con = conectar_store(ruta)
+    with con:
+        version = _version_esquema(con, columnas, dtype)
+    ahora = datetime.now().isoformat(timespec="seconds")
+
+    for inicio in range(0, len(X), tamano_lote):
+        fin = min(inicio + tamano_lote, len(X))
+        bloque = X[inicio:fin].tobytes()
+        filas = (
+            (int(ids_cliente[i]), int(ids_prestamo[i]), version,
+             bloque[(i - inicio) * ancho:(i - inicio + 1) * ancho], ahora)
+            for i in range(inicio, fin)
+        )
+        with con:
+            con.executemany(
+                """INSERT INTO variables (id_cliente, id_prestamo, version_esquema, vector, actualizado)
+                   VALUES (?, ?, ?, ?, ?)
+                   ON CONFLICT (id_cliente, id_prestamo) DO UPDATE SET
+                       version_esquema = excluded.version_esquema,
+                       vector = excluded.vector,
+                       actualizado = excluded.actualizado""",
+                filas,
+            )
+
+    print(f"✅ {len(X):,} vectores guardados en el feature store "
+          f"({len(columnas)} variables {dtype}, esquema v{version})")
+    return len(X)
+
+
+# -------------------------------------------------------------
+# 🧩 Reconstruir DataFrame a partir de filas de la tabla
+# -------------------------------------------------------------
+# Las filas de una misma versión de esquema se decodifican juntas
+# con un único np.frombuffer, en el tipo registrado en el esquema.
+# -------------------------------------------------------------
+def _decodificar(filas: list, esquemas: dict) -> pd.DataFrame:
+    if not filas:
+        return pd.DataFrame()
+    partes = []
+    por_version = {}
+    for fila in filas:
+        por_version.setdefault(fila[2], []).append(fila)
+    for version, grupo in por_version.items():
+        columnas, tipo = esquemas[version]
+        X = np.frombuffer(b"".join(f[3] for f in grupo), dtype=tipo).reshape(len(grupo), len(columnas))
+        indice = pd.MultiIndex.from_tuples([(f[0], f[1]) for f in grupo], names=["id_cliente", "id_prestamo"])
+        partes.append(pd.DataFrame(X, columns=columnas, index=indice))
+    return pd.concat(partes) if len(partes) > 1 else partes[0]
+
+
+# =============================================================
+# 🔎 Función: obtener_variables
+# -------------------------------------------------------------
+# ➤ Búsqueda por clave primaria (O(log n) por id)
+# ➤ Muchos ids: tabla temporal + JOIN (una sola consulta)
+# =============================================================
+def obtener_variables(ids_cliente, id_prestamo: int = None, ruta=None) -> pd.DataFrame:
+    """
+    Recupera los vectores de variables de uno o varios clientes.
+
+    Args:
+        ids_cliente (int | list): Id(s) de cliente.
+        id_prestamo (int, opcional): Si se indica, solo ese préstamo.
+        ruta (Path | str, opcional): Archivo SQLite.
+
+    Returns:
+        pd.DataFrame: Índice (id_cliente, id_prestamo) y una columna por variable.
+            Los ids que no existen en el store no aparecen.
+    """
+    ids = [int(i) for i in np.atleast_1d(ids_cliente)]
+    con = conectar_store(ruta)
+    esquemas = _columnas_esquema(con)
+    consulta = """SELECT v.id_cliente, v.id_prestamo, v.version_esquema, v.vector
+                  FROM ids_consulta q JOIN variables v ON v.id_cliente = q.id"""
+    parametros = ()
+    if id_prestamo is not None:
+        consulta += " WHERE v.id_prestamo = ?"
+        parametros = (int(id_prestamo),)
+    # Tabla temporal de la conexión: la transacción se cierra al terminar
+    with con:
+        con.execute("CREATE TEMP TABLE IF NOT EXISTS ids_consulta (id INTEGER PRIMARY KEY)")
+        con.execute("DELETE FROM ids_consulta")
+        con.executemany("INSERT OR IGNORE INTO ids_consulta VALUES (?)", ((i,) for i in ids))
+        filas = con.execute(consulta, parametros).fetchall()
+
+    faltan = len(ids) - len({f[0] for f in filas})
+    if faltan:
+        print(f"⚠️ {faltan} clientes no están en el feature store.")
+    return _decodificar(filas, esquemas)
+
+
+def iterar_variables(tamano_lote: int = 100_000, ruta=None):
+    """
+    Recorre todo el feature store en lotes (generador de DataFrames), en orden de clave.
+    """
+    con = conectar_store(ruta)
+    esquemas = _columnas_esquema(con)
+    cursor = con.execute(
+        "SELECT id_cliente, id_prestamo, version_esquema, vector FROM variables ORDER BY id_cliente, id_prestamo"
+    )
+    try:
+        while filas := cursor.fetchmany(tamano_lote):
+            yield _decodificar(filas, esquemas)
+    finally:
+        cursor.close()
+
+
+def resumen_store(ruta=None) -> dict:
+    """
+    Devuelve número de vectores, versión de esquema actual, sus columnas y su tipo.
+    """
+    con = conectar_store(ruta)
+    n = con.execute("SELECT COUNT(*) FROM variables").fetchone()[0]
+    esquemas = _columnas_esquema(con)
+    version = max(esquemas, default=None)
+    columnas, tipo = esquemas.get(version, ([], None))
+    return {"n_vectores": n, "version_esquema": version, "columnas": columnas, "tipo": tipo}
+
+
+# =============================================================
+# 🔁 Función: repuntuar_desde_store
+# -------------------------------------------------------------
+# ➤ PD de clientes existentes (o de toda la cartera) con el modelo
+#   actual, leyendo los vectores ya calculados
+# ➤ Ordena las columnas según feature_names_in_ del modelo
+# =============================================================
+def repuntuar_desde_store(modelo, ids_cliente=None, ruta=None, tamano_lote: int = 100_000) -> pd.Series:
+    """
+    Calcula la PD desde el feature store, sin limpieza ni codificación.
+
+    Args:
+        modelo: Estimador con predict_proba.
+        ids_cliente (list, opcional): Clientes a puntuar; None = toda la cartera.
+        ruta (Path | str, opcional): Archivo SQLite.
+        tamano_lote (int): Filas por lote al recorrer la cartera completa.
+
+    Returns:
+        pd.Series: PD indexada por (id_cliente, id_prestamo).
+    """
+    lotes = [obtener_variables(ids_cliente, ruta=ruta)] if ids_cliente is not None \
+        else iterar_variables(tamano_lote, ruta)
+    columnas = list(getattr(modelo, "feature_names_in_", []))
+
+    resultados = []
+    for lote in lotes:
+        if lote.empty:
+            continue
+        X = lote[columnas] if columnas else lote
+        resultados.append(pd.Series(modelo.predict_proba(X)[:, 1], index=lote.index, name="pd"))
+    return pd.concat(resultados) if resultados else pd.Series(dtype=float, name="pd")
@@ -0,0 +1,498 @@
+# =============================================================
+# 📦 src/importancia_variables.py — Importancia de variables
+# -------------------------------------------------------------
+# Dos modos de cálculo, ambos con caché por huella del modelo:
+#   • 'permutacion': permutación agrupada (todas las dummies de una
+#     misma variable se permutan juntas), en paralelo y sobre una
+#     submuestra estratificada, con intervalos de confianza.
+#   • 'contribuciones': contribuciones por recorrido de árbol
+#     (HistGradientBoosting), sin volver a predecir por variable.
+# =============================================================
+
+import hashlib
+import io
+
+import joblib
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed
+import sklearn
+from sklearn.compose import ColumnTransformer
+from sklearn.metrics import roc_auc_score
+from sklearn.model_selection import train_test_split
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import OneHotEncoder
+
+from utils import get_file_path
+
+VARIABLES_NOMINALES = ["empleo", "ingresos_verificados", "vivienda", "finalidad"]
+
+# Versiones de scikit-learn verificadas (tests/test_explicaciones.py:
+# contribuciones = decision_function). contribuciones_arbol y
+# variables_origen usan atributos internos de HistGradientBoosting
+# (TreePredictor, _preprocess_X, _bin_mapper, _predictors...) y de
+# ColumnTransformer (_transformer_to_input_indices).
+VERSIONES_SKLEARN = ((1, 6), (1, 10))   # [mínima, máxima excluida)
+
+
+# -------------------------------------------------------------
+# 🛡️ Versión de scikit-learn
+# -------------------------------------------------------------
+def comprobar_version_sklearn():
+    """
+    Lanza ImportError si la versión instalada de scikit-learn no está verificada
+    para el cálculo de contribuciones por árbol.
+    """
+    version = tuple(int(p) for p in sklearn.__version__.split(".")[:2] if p.isdigit())
+    minima, maxima = VERSIONES_SKLEARN
+    if not minima <= version < maxima:
+        raise ImportError(
+            f"❌ scikit-learn {sklearn.__version__} no soportado para contribuciones por árbol: "
+            f"se usan atributos internos verificados en >= {minima[0]}.{minima[1]} y < {maxima[0]}.{maxima[1]}. "
+            f"Usa el modo 'permutacion' o valida la nueva versión con tests/test_explicaciones.py."
+        )
+
+
+# =============================================================
+# 🔑 Función: huella_modelo
+# -------------------------------------------------------------
+# ➤ Hash SHA-256 del artefacto serializado (o del archivo .pkl)
+# ➤ Se usa como clave de caché: un modelo nuevo invalida resultados
+# =============================================================
+def huella_modelo(modelo=None, ruta_modelo=None) -> str:
+    """
+    Calcula la huella (SHA-256) de un modelo en memoria o de su archivo.
+
+    Args:
+        modelo: Estimador entrenado (se serializa con joblib para el hash).
+        ruta_modelo (Path, opcional): Archivo del modelo; si se indica se
+            hashean sus bytes directamente (más rápido).
+
+    Returns:
+        str: Huella hexadecimal.
+    """
+    sha = hashlib.sha256()
+    if ruta_modelo is not None:
+        with open(ruta_modelo, "rb") as f:
+            for bloque in iter(lambda: f.read(1024 * 1024), b""):
+                sha.update(bloque)
+    else:
+        buffer = io.BytesIO()
+        joblib.dump(modelo, buffer)
+        sha.update(buffer.getvalue())
+    return sha.hexdigest()
+
+
+# -------------------------------------------------------------
+# 🧭 Variable de origen por paso de preprocesado
+# -------------------------------------------------------------
+# Recorre un preprocesado ajustado (Pipeline, ColumnTransformer,
+# OneHotEncoder...) propagando la variable de origen de cada columna:
+#   • OneHotEncoder: una salida por categoría (menos la eliminada con
+#     drop y agrupando las infrecuentes), todas con el mismo origen
+#   • ColumnTransformer: cada transformador sobre sus columnas de entrada
+#   • resto: si conserva el nº de columnas, conserva los orígenes
+# -------------------------------------------------------------
+def _salidas_one_hot(codificador) -> list:
+    eliminadas = getattr(codificador, "drop_idx_", None)
+    infrecuentes = getattr(codificador, "infrequent_categories_", None)
+    salidas = []
+    for i, categorias in enumerate(codificador.categories_):
+        n = len(categorias)
+        if infrecuentes is not None and infrecuentes[i] is not None:
+            n -= len(infrecuentes[i]) - 1
+        if eliminadas is not None and eliminadas[i] is not None:
+            n -= 1
+        salidas.append(n)
+    return salidas
+
+
+def _origenes_paso(paso, entrada: list) -> list:
+    if isinstance(paso, str):
+        return [] if paso == "drop" else list(entrada)
+    if isinstance(paso, Pipeline):
+        for subpaso in paso:
+            entrada = _origenes_paso(subpaso, entrada)
+        return entrada
+    if isinstance(paso, ColumnTransformer):
+        salida = []
+        for nombre, transformador, _ in paso.transformers_:
+            posiciones = paso._transformer_to_input_indices.get(nombre, [])
+            if len(posiciones):
+                salida += _origenes_paso(transformador, [entrada[p] for p in posiciones])
+        return salida
+    if isinstance(paso, OneHotEncoder):
+        return [origen for origen, n in zip(entrada, _salidas_one_hot(paso)) for _ in range(n)]
+    nombres = list(paso.get_feature_names_out())
+    return list(entrada) if len(nombres) == len(entrada) else [str(n) for n in nombres]
+
+
+# =============================================================
+# 🧭 Función: variables_origen
+# -------------------------------------------------------------
+# ➤ {columna transformada: variable de origen} de un preprocesado
+# ➤ 'cat__empleo_reducido_BASICO' → 'empleo_reducido',
+#   'num__rating_ord' → 'rating_ord'
+# =============================================================
+def variables_origen(preprocesado) -> dict:
+    """
+    Relaciona cada columna de salida de un preprocesado ajustado con su variable de entrada.
+
+    Args:
+        preprocesado: Pipeline, ColumnTransformer u OneHotEncoder ajustado
+            (o un Pipeline completo: se usan todos los pasos salvo el modelo).
+
+    Returns:
+        dict: {columna de salida: variable de entrada}.
+    """
+    comprobar_version_sklearn()
+    if isinstance(preprocesado, Pipeline) and hasattr(preprocesado[-1], "predict_proba"):
+        preprocesado = preprocesado[:-1]
+    entrada = getattr(preprocesado, "feature_names_in_", None)
+    if entrada is None:
+        entrada = [f"x{i}" for i in range(preprocesado.n_features_in_)]
+    salida = [str(c) for c in preprocesado.get_feature_names_out()]
+    origenes = _origenes_paso(preprocesado, [str(c) for c in entrada])
+    if len(origenes) != len(salida):
+        raise ValueError("❌ No se pudo reconstruir la variable de origen de cada columna del preprocesado.")
+    return dict(zip(salida, origenes))
+
+
+# =============================================================
+# 🧩 Función: agrupar_columnas_one_hot
+# -------------------------------------------------------------
+# ➤ Asocia cada columna codificada a su variable de origen
+# ➤ Con un Pipeline (notebook 05) se usan los nombres reales que
+#   genera su codificador: 'cat__empleo_reducido_BASICO' → 'empleo_reducido';
+#   las columnas de entrada del Pipeline son su propio grupo
+# ➤ Sin codificador (matriz del notebook 04): 'empleo_Teacher',
+#   'empleo_OTROS'... → 'empleo' para las variables nominales indicadas
+# ➤ Las columnas no codificadas forman su propio grupo
+# =============================================================
+def agrupar_columnas_one_hot(columnas, variables_nominales: list = None, modelo=None,
+                             origenes: dict = None) -> dict:
+    """
+    Agrupa las columnas One-Hot por variable de origen.
+
+    Args:
+        columnas (list | pd.Index): Nombres de columnas de la matriz del modelo.
+        variables_nominales (list): Variables codificadas con One-Hot en una
+            matriz sin codificador (por defecto las del notebook 04).
+        modelo (opcional): Pipeline con preprocesado; el origen de cada
+            columna sale de su codificador (variables_origen).
+        origenes (dict, opcional): {columna: variable de origen} explícito.
+
+    Returns:
+        dict: {variable_origen: [posiciones de columna]} en el orden de aparición.
+    """
+    if origenes is None and isinstance(modelo, Pipeline):
+        origenes = variables_origen(modelo)
+
+    if origenes is not None:
+        asignacion = [origenes.get(str(columna), columna) for columna in columnas]
+    else:
+        variables_nominales = sorted(variables_nominales or VARIABLES_NOMINALES, key=len, reverse=True)
+        asignacion = [
+            next((v for v in variables_nominales if str(columna).startswith(f"{v}_")), columna)
+            for columna in columnas
+        ]
+
+    grupos = {}
+    for posicion, origen in enumerate(asignacion):
+        grupos.setdefault(origen, []).append(posicion)
+    return grupos
+
+
+# -------------------------------------------------------------
+# 🎲 Submuestra estratificada
+# -------------------------------------------------------------
+def _submuestra_estratificada(X, y, tamano_muestra, random_state):
+    y = np.asarray(y)
+    if tamano_muestra is None or len(y) <= tamano_muestra:
+        return X, y
+    posiciones, _ = train_test_split(
+        np.arange(len(y)), train_size=tamano_muestra, stratify=y, random_state=random_state
+    )
+    X_muestra = X.iloc[posiciones] if isinstance(X, pd.DataFrame) else X[posiciones]
+    return X_muestra, y[posiciones]
+
+
+def _caida_auc(modelo, X, y, posiciones, semilla, auc_base):
+    # Misma permutación para todas las columnas del grupo
+    permutacion = np.random.default_rng(semilla).permutation(len(y))
+    X_perm = X.copy()
+    if isinstance(X, pd.DataFrame):
+        columnas = X.columns[posiciones]
+        X_perm[columnas] = X[columnas].iloc[permutacion].to_numpy()
+    else:
+        X_perm[:, posiciones] = X[permutacion][:, posiciones]
+    return auc_base - roc_auc_score(y, modelo.predict_proba(X_perm)[:, 1])
+
+
+# =============================================================
+# 🔀 Función: importancia_permutacion_agrupada
+# -------------------------------------------------------------
+# ➤ Permuta juntas las columnas de un mismo grupo (One-Hot)
+# ➤ Cada (grupo, repetición) es una tarea independiente → joblib
+# ➤ Usa una submuestra estratificada en lugar de todo X_test
+# ➤ Devuelve media, desviación e intervalo de confianza (t-Student)
+# =============================================================
+def importancia_permutacion_agrupada(
+    modelo,
+    X,
+    y,
+    grupos: dict = None,
+    n_repeticiones: int = 5,
+    tamano_muestra: int = 20_000,
+    n_jobs: int = -1,
+    nivel_confianza: float = 0.95,
+    random_state: int = 42
+) -> pd.DataFrame:
+    """
+    Calcula la importancia por permutación agrupada (caída de ROC AUC).
+
+    Args:
+        modelo: Clasificador entrenado con predict_proba.
+        X (pd.DataFrame | np.ndarray): Datos de evaluación.
+        y (array-like): Variable objetivo.
+        grupos (dict, opcional): {grupo: [posiciones]}; por defecto se agrupan
+            las dummies con agrupar_columnas_one_hot() (con un Pipeline, X son
+            sus columnas de entrada y cada una es su propio grupo).
+        n_repeticiones (int): Permutaciones por grupo.
+        tamano_muestra (int): Filas de la submuestra estratificada (None = todas).
+        n_jobs (int): Procesos en paralelo (-1 = todos los núcleos).
+        nivel_confianza (float): Nivel del intervalo de confianza.
+        random_state (int): Semilla para reproducibilidad.
+
+    Returns:
+        pd.DataFrame: variable, importancia, desviacion, ic_inferior, ic_superior
+                      ordenado de mayor a menor importancia.
+    """
+    from scipy import stats
+
+    if grupos is None:
+        columnas = X.columns if isinstance(X, pd.DataFrame) else range(X.shape[1])
+        grupos = agrupar_columnas_one_hot(columnas, modelo=modelo)
+
+    X_muestra, y_muestra = _submuestra_estratificada(X, y, tamano_muestra, random_state)
+    auc_base = roc_auc_score(y_muestra, modelo.predict_proba(X_muestra)[:, 1])
+
+    semillas = np.random.SeedSequence(random_state).generate_state(len(grupos) * n_repeticiones)
+    tareas = [
+        (grupo, posiciones, int(semillas[i * n_repeticiones + r]))
+        for i, (grupo, posiciones) in enumerate(grupos.items())
+        for r in range(n_repeticiones)
+    ]
+    caidas = Parallel(n_jobs=n_jobs)(
+        delayed(_caida_auc)(modelo, X_muestra, y_muestra, posiciones, semilla, auc_base)
+        for _, posiciones, semilla in tareas
+    )
+
+    resultados = pd.DataFrame({"variable": [t[0] for t in tareas], "caida": caidas})
+    resumen = resultados.groupby("variable", sort=False)["caida"].agg(["mean", "std", "count"])
+    t_critico = stats.t.ppf((1 + nivel_confianza) / 2, df=np.maximum(resumen["count"] - 1, 1))
+    margen = t_critico * resumen["std"].fillna(0) / np.sqrt(resumen["count"])
+
+    return pd.DataFrame({
+        "variable": resumen.index,
+        "importancia": resumen["mean"].to_numpy(),
+        "desviacion": resumen["std"].to_numpy(),
+        "ic_inferior": (resumen["mean"] - margen).to_numpy(),
+        "ic_superior": (resumen["mean"] + margen).to_numpy(),
+    }).sort_values("importancia", ascending=False, ignore_index=True)
+
+
+# -------------------------------------------------------------
+# 🌳 Valores esperados por nodo
+# -------------------------------------------------------------
+# En HistGradientBoosting solo las hojas tienen el valor final (con
+# shrinkage). El valor de cada nodo interno se recalcula como media
+# de sus hijos ponderada por nº de muestras, de abajo arriba (los
+# nodos están en preorden: los hijos siempre tienen índice mayor).
+# -------------------------------------------------------------
+def _valores_esperados(nodos):
+    valores = nodos["value"].astype(np.float64).copy()
+    conteos = nodos["count"].astype(np.float64)
+    for i in range(len(nodos) - 1, -1, -1):
+        if not nodos["is_leaf"][i]:
+            izq, der = nodos["left"][i], nodos["right"][i]
+            valores[i] = (conteos[izq] * valores[izq] + conteos[der] * valores[der]) / (conteos[izq] + conteos[der])
+    return valores
+
+
+# =============================================================
+# 🌳 Función: contribuciones_arbol
+# -------------------------------------------------------------
+# ➤ Contribuciones por recorrido de árbol (método de Saabas)
+# ➤ La hoja de cada fila sale del recorrido compilado de sklearn y el
+#   aporte de cada camino raíz → hoja se tabula una vez por árbol:
+#   el coste es similar al de predict_proba
+# ➤ base + suma de contribuciones = decision_function (log-odds)
+# ➤ Admite un Pipeline: se transforma X con los pasos previos
+# =============================================================
+def contribuciones_arbol(modelo, X) -> tuple:
+    """
+    Calcula la contribución de cada variable a la predicción (log-odds) de cada fila.
+
+    Args:
+        modelo (HistGradientBoostingClassifier | Pipeline): Modelo binario entrenado.
+        X (pd.DataFrame | np.ndarray): Datos a explicar.
+
+    Returns:
+        Tuple: contribuciones (np.ndarray n_filas x n_variables),
+               base (float, log-odds de partida),
+               columnas (list, nombres de las variables del modelo).
+    """
+    comprobar_version_sklearn()
+    from sklearn.ensemble._hist_gradient_boosting.predictor import TreePredictor
+    from sklearn.utils._openmp_helpers import _openmp_effective_n_threads
+
+    if isinstance(modelo, Pipeline):
+        preprocesado, modelo = modelo[:-1], modelo[-1]
+        X = preprocesado.transform(X)
+        columnas = list(preprocesado.get_feature_names_out())
+    else:
+        columnas = list(getattr(modelo, "feature_names_in_", range(X.shape[1])))
+
+    X_num = np.asarray(modelo._preprocess_X(X, reset=False), dtype=np.float64)
+    known_cat_bitsets, f_idx_map = modelo._bin_mapper.make_known_categories_bitsets()
+    n_threads = _openmp_effective_n_threads()
+
+    n_filas, n_variables = X_num.shape
+    # Traspuesta (variables x filas): cada variable se acumula en memoria contigua
+    contribuciones = np.zeros((n_variables, n_filas))
+    base = float(modelo._baseline_prediction.ravel()[0])
+
+    for iteracion in modelo._predictors:
+        predictor = iteracion[0]
+        nodos = predictor.nodes
+        valores = _valores_esperados(nodos)
+        base += valores[0]
+
+        # Hoja de cada fila con el recorrido compilado de scikit-learn:
+        # un árbol idéntico cuyo "valor" de hoja es su propio índice
+        marcado = nodos.copy()
+        marcado["value"] = np.arange(len(nodos))
+        hoja = TreePredictor(marcado, predictor.binned_left_cat_bitsets, predictor.raw_left_cat_bitsets) \
+            .predict(X_num, known_cat_bitsets, f_idx_map, n_threads).astype(np.intp)
+
+        # Tabla (variables usadas x nodos) con el aporte acumulado del camino
+        # raíz → nodo; los nodos están en preorden (padre antes que hijos)
+        internos = np.flatnonzero(nodos["is_leaf"] == 0)
+        usadas = np.unique(nodos["feature_idx"][internos])
+        fila_tabla = np.searchsorted(usadas, nodos["feature_idx"])
+        tabla = np.zeros((len(usadas), len(nodos)))
+        for nodo in internos:
+            for hijo in (nodos["left"][nodo], nodos["right"][nodo]):
+                tabla[:, hijo] = tabla[:, nodo]
+                tabla[fila_tabla[nodo], hijo] += valores[hijo] - valores[nodo]
+
+        for fila, variable in enumerate(usadas):
+            contribuciones[variable] += tabla[fila].take(hoja)
+
+    contribuciones = contribuciones.T
+
+    # Con variables categóricas nativas sklearn coloca primero las
+    # categóricas: se devuelve cada contribución a su columna original
+    if modelo._preprocessor is not None:
+        orden = np.r_[np.flatnonzero(modelo.is_categorical_), np.flatnonzero(~modelo.is_categorical_)]
+        reordenadas = np.empty_like(contribuciones)
+        reordenadas[:, orden] = contribuciones
+        contribuciones = reordenadas
+
+    return contribuciones, base, columnas
+
+
+# =============================================================
+# 📊 Función: importancia_contribuciones
+# -------------------------------------------------------------
+# ➤ Importancia global = media del |aporte| por variable de origen
+# ➤ Las dummies se suman por fila antes del valor absoluto
+# =============================================================
+def importancia_contribuciones(modelo, X, variables_nominales: list = None, tamano_muestra: int = None,
+                               random_state: int = 42) -> pd.DataFrame:
+    """
+    Calcula la importancia global a partir de las contribuciones por árbol.
+
+    Args:
+        modelo: HistGradientBoostingClassifier (o Pipeline que lo contenga).
+        X (pd.DataFrame | np.ndarray): Datos de evaluación.
+        variables_nominales (list, opcional): Variables One-Hot a reagrupar.
+        tamano_muestra (int, opcional): Submuestra aleatoria de filas.
+        random_state (int): Semilla de la submuestra.
+
+    Returns:
+        pd.DataFrame: variable, importancia, aporte_medio (ordenado de mayor a menor).
+    """
+    if tamano_muestra is not None and len(X) > tamano_muestra:
+        posiciones = np.random.default_rng(random_state).choice(len(X), tamano_muestra, replace=False)
+        X = X.iloc[posiciones] if isinstance(X, pd.DataFrame) else X[posiciones]
+
+    contribuciones, _, columnas = contribuciones_arbol(modelo, X)
+    grupos = agrupar_columnas_one_hot(columnas, variables_nominales, modelo=modelo)
+    por_grupo = np.column_stack([contribuciones[:, pos].sum(axis=1) for pos in grupos.values()])
+
+    return pd.DataFrame({
+        "variable": list(grupos),
+        "importancia": np.abs(por_grupo).mean(axis=0),
+        "aporte_medio": por_grupo.mean(axis=0),
+    }).sort_values("importancia", ascending=False, ignore_index=True)
+
+
+# =============================================================
+# 🚀 Función: calcular_importancia
+# -------------------------------------------------------------
+# ➤ Punto de entrada con caché en data/cache/importancia/
+# ➤ Clave = huella del modelo + modo + huella de datos y parámetros
+# =============================================================
+def calcular_importancia(
+    modelo,
+    X,
+    y=None,
+    modo: str = "permutacion",
+    ruta_modelo=None,
+    usar_cache: bool = True,
+    **parametros
+) -> pd.DataFrame:
+    """
+    Calcula (o recupera de caché) la importancia de variables.
+
+    Args:
+        modelo: Modelo entrenado.
+        X (pd.DataFrame | np.ndarray): Datos de evaluación.
+        y (array-like, opcional): Objetivo (obligatorio en modo 'permutacion').
+        modo (str): 'permutacion' o 'contribuciones'.
+        ruta_modelo (Path, opcional): Archivo del modelo para calcular la huella.
+        usar_cache (bool): Si False, recalcula siempre.
+        **parametros: Argumentos adicionales para la función del modo elegido.
+
+    Returns:
+        pd.DataFrame: Tabla de importancia ordenada.
+    """
+    if modo not in ("permutacion", "contribuciones"):
+        raise ValueError("❌ Modo no soportado. Usa 'permutacion' o 'contribuciones'.")
+
+    huella_datos = hashlib.sha256()
+    huella_datos.update(pd.util.hash_pandas_object(pd.DataFrame(X), index=False).to_numpy().tobytes())
+    if y is not None:
+        huella_datos.update(np.asarray(y).tobytes())
+    huella_datos.update(repr(sorted(parametros.items())).encode())
+
+    clave = f"{huella_modelo(modelo, ruta_modelo)[:16]}_{modo}_{huella_datos.hexdigest()[:16]}.pkl"
+    ruta_cache = get_file_path("cache", f"importancia/{clave}")
+
+    if usar_cache and ruta_cache.exists():
+        print(f"📦 Importancia recuperada de caché: {ruta_cache.name}")
+        return pd.read_pickle(ruta_cache)
+
+    if modo == "permutacion":
+        if y is None:
+            raise ValueError("❌ El modo 'permutacion' necesita la variable objetivo 'y'.")
+        resultado = importancia_permutacion_agrupada(modelo, X, y, **parametros)
+    else:
+        resultado = importancia_contribuciones(modelo, X, **parametros)
+
+    ruta_cache.parent.mkdir(parents=True, exist_ok=True)
+    pd.to_pickle(resultado, ruta_cache)
+    print(f"✅ Importancia guardada en caché: {ruta_cache.name}")
+    return resultado
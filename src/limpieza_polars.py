@@ -0,0 +1,216 @@
+# =============================================================
+# 📦 src/limpieza_polars.py — Limpieza con motor Polars (Arrow)
+# -------------------------------------------------------------
+# Misma semántica que data_cleaning.py, pero como una única consulta
+# perezosa (LazyFrame) que Polars ejecuta en paralelo con todos los
+# núcleos y sin copias intermedias:
+#   • nombres normalizados igual que janitor.clean_names
+#   • eliminación de ids / descripción
+#   • extracción de dígitos (antigüedad_empleo, num_cuotas)
+#   • eliminación de duplicados (conservando el primero)
+#   • imputación de nulos (mismas reglas que imputar_nulos_*)
+#   • detección de categorías poco frecuentes
+#
+# Polars es opcional (y pyarrow para devolver pandas): se importa al usarlo. El motor se elige en
+# config.yaml → limpieza.motor (ver data_cleaning.limpiar_prestamos).
+# verificar_conformidad() compara la salida con el camino pandas.
+# =============================================================
+
+import pandas as pd
+
+from utils import get_file_path
+
+
+def _importar_polars():
+    try:
+        import polars as pl
+    except ImportError as error:
+        raise ImportError("❌ polars no está instalado: pip install polars pyarrow") from error
+    return pl
+
+
+# -------------------------------------------------------------
+# 🧾 Reglas de limpieza (las mismas que data_cleaning.py)
+# -------------------------------------------------------------
+COLUMNAS_TEXTO_A_NUMERO = ["antiguedad_empleo", "num_cuotas"]
+IMPUTACION_MEDIANA = ["antiguedad_empleo", "dti"]
+IMPUTACION_CERO = [
+    "num_hipotecas", "porc_tarjetas_75p", "porc_uso_revolving",
+    "num_meses_desde_ult_retraso", "num_cancelaciones_12meses",
+    "num_lineas_credito", "num_derogatorios",
+]
+IMPUTACION_CATEGORICA = {"empleo": "OTROS"}
+
+
+def _nombres_limpios(columnas: list) -> dict:
+    # Se delega en janitor sobre un DataFrame vacío para que los nombres
+    # coincidan exactamente con los del camino pandas
+    from janitor import clean_names
+    return dict(zip(columnas, clean_names(pd.DataFrame(columns=columnas)).columns))
+
+
+# =============================================================
+# 🧹 Función: consulta_limpieza
+# -------------------------------------------------------------
+# ➤ Construye el plan perezoso completo (no lee nada todavía)
+# ➤ Origen: nombre de archivo CSV en `folder_key` o un DataFrame
+# =============================================================
+def consulta_limpieza(origen, folder_key: str = "raw", conservar_ids: bool = False):
+    """
+    Construye la consulta perezosa de limpieza.
+
+    Args:
+        origen (str | pd.DataFrame | pl.DataFrame): Archivo CSV dentro de
+            `folder_key` o tabla ya cargada.
+        folder_key (str): Carpeta de config.yaml si `origen` es un archivo.
+        conservar_ids (bool): Mantener 'id_cliente' e 'id_prestamo'.
+
+    Returns:
+        pl.LazyFrame: Plan de limpieza (ejecutar con .collect()).
+    """
+    pl = _importar_polars()
+
+    if isinstance(origen, str):
+        lf = pl.scan_csv(get_file_path(folder_key, origen), infer_schema_length=None)
+    elif isinstance(origen, pd.DataFrame):
+        lf = pl.from_pandas(origen).lazy()
+    else:
+        lf = origen.lazy()
+
+    # 1️⃣ Nombres y columnas irrelevantes
+    lf = lf.rename(_nombres_limpios(lf.collect_schema().names()))
+    eliminar = ["descripcion"] if conservar_ids else ["id_cliente", "id_prestamo", "descripcion"]
+    columnas = lf.collect_schema().names()
+    lf = lf.drop([c for c in eliminar if c in columnas])
+
+    # 2️⃣ Texto → número (primer grupo de dígitos)
+    lf = lf.with_columns([
+        pl.col(c).cast(pl.String).str.extract(r"(\d+)", 1).cast(pl.Float64)
+        for c in COLUMNAS_TEXTO_A_NUMERO if c in columnas
+    ])
+
+    # 3️⃣ Duplicados: filas completas, se conserva la primera aparición
+    lf = lf.unique(keep="first", maintain_order=True)
+
+    # 4️⃣ Imputación (la mediana se calcula tras eliminar duplicados,
+    #    igual que en el notebook 02)
+    imputaciones = [
+        pl.col(c).cast(pl.Float64).fill_null(pl.col(c).cast(pl.Float64).median())
+        for c in IMPUTACION_MEDIANA if c in columnas
+    ]
+    imputaciones += [pl.col(c).cast(pl.Float64).fill_null(0) for c in IMPUTACION_CERO if c in columnas]
+    imputaciones += [pl.col(c).fill_null(valor) for c, valor in IMPUTACION_CATEGORICA.items() if c in columnas]
+    return lf.with_columns(imputaciones)
+
+
+# =============================================================
+# 📉 Función: detectar_atipicos_polars
+# -------------------------------------------------------------
+# ➤ Equivalente a detectar_atipicos_categoricos()
+# ➤ Todas las columnas de texto se cuentan en paralelo (collect_all)
+# =============================================================
+def detectar_atipicos_polars(df, umbral: float = 0.03) -> dict:
+    """
+    Categorías con frecuencia relativa (sin contar nulos) menor al umbral.
+
+    Args:
+        df (pl.DataFrame | pl.LazyFrame): Tabla limpia.
+        umbral (float): Frecuencia relativa mínima.
+
+    Returns:
+        dict: {columna: [categorías poco frecuentes]} (de más a menos frecuente).
+    """
+    pl = _importar_polars()
+    lf = df.lazy()
+    esquema = lf.collect_schema()
+    columnas = [c for c, tipo in esquema.items() if tipo in (pl.String, pl.Categorical)]
+
+    consultas = [
+        lf.select(pl.col(c)).drop_nulls()
+        .group_by(c).len()
+        .with_columns(frecuencia=pl.col("len") / pl.col("len").sum())
+        .filter(pl.col("frecuencia") < umbral)
+        .sort(["len", c], descending=[True, False])
+        for c in columnas
+    ]
+    resultados = pl.collect_all(consultas)
+    return {c: r[c].to_list() for c, r in zip(columnas, resultados) if r.height}
+
+
+# =============================================================
+# 🚀 Función: limpiar_con_polars
+# -------------------------------------------------------------
+# ➤ Ejecuta la consulta y devuelve (tabla limpia, atípicos) en pandas
+# =============================================================
+def limpiar_con_polars(
+    origen,
+    folder_key: str = "raw",
+    conservar_ids: bool = False,
+    umbral_atipicos: float = 0.03
+) -> tuple:
+    """
+    Limpia los préstamos con Polars y devuelve el resultado como pandas.
+
+    Args:
+        origen (str | pd.DataFrame): Archivo CSV en `folder_key` o DataFrame crudo.
+        folder_key (str): Carpeta del archivo.
+        conservar_ids (bool): Mantener los identificadores.
+        umbral_atipicos (float): Umbral de detectar_atipicos_polars().
+
+    Returns:
+        tuple: (pd.DataFrame limpio, dict de categorías poco frecuentes)
+    """
+    pl = _importar_polars()
+    limpio = consulta_limpieza(origen, folder_key, conservar_ids).collect()
+    atipicos = detectar_atipicos_polars(limpio, umbral_atipicos)
+
+    print(f"✅ Limpieza con Polars ({pl.thread_pool_size()} hilos): "
+          f"{limpio.height:,} filas x {limpio.width} columnas")
+    return limpio.to_pandas(), atipicos
+
+
+# =============================================================
+# ⚖️ Función: verificar_conformidad
+# -------------------------------------------------------------
+# ➤ Ejecuta los dos motores sobre el mismo origen
+# ➤ Compara tabla (columnas, filas y valores) y categorías atípicas
+# ➤ Lanza AssertionError con el detalle si difieren
+# =============================================================
+def verificar_conformidad(origen, folder_key: str = "raw", conservar_ids: bool = False, umbral_atipicos: float = 0.03) -> bool:
+    """
+    Comprueba que el motor Polars produce la misma salida que el motor pandas.
+
+    Args:
+        origen (str | pd.DataFrame): Archivo CSV en `folder_key` o DataFrame crudo.
+        folder_key (str): Carpeta del archivo.
+        conservar_ids (bool): Mantener los identificadores.
+        umbral_atipicos (float): Umbral de categorías poco frecuentes.
+
+    Returns:
+        bool: True si ambas salidas coinciden.
+    """
+    from data_cleaning import limpiar_prestamos
+
+    # El motor Polars se llama directamente: sin polars debe fallar, no
+    # comparar pandas consigo mismo
+    df_pandas, atip_pandas = limpiar_prestamos(origen, folder_key, "pandas", conservar_ids, umbral_atipicos)
+    df_polars, atip_polars = limpiar_con_polars(origen, folder_key, conservar_ids, umbral_atipicos)
+
+    # Tipos: pandas guarda los enteros con nulos como float64 y el texto como
+    # str/object; se comparan valores, no representaciones
+    pd.testing.assert_frame_equal(
+        df_pandas.reset_index(drop=True),
+        df_polars.reset_index(drop=True),
+        check_dtype=False,
+        check_exact=False,
+        rtol=1e-12,
+    )
+    atip_pandas = {c: sorted(v) for c, v in atip_pandas.items()}
+    atip_polars = {c: sorted(v) for c, v in atip_polars.items()}
+    if atip_pandas != atip_polars:
+        diferentes = [c for c in set(atip_pandas) | set(atip_polars) if atip_pandas.get(c) != atip_polars.get(c)]
+        raise AssertionError(f"❌ Categorías poco frecuentes distintas en: {diferentes}")
+
+    print(f"✅ Conformidad pandas/Polars: {len(df_pandas):,} filas, "
+          f"{df_pandas.shape[1]} columnas y {len(atip_pandas)} variables con categorías poco frecuentes idénticas.")
+    return True
@@ -1,3 +1,168 @@
+# =============================================================
+# 📦 src/modeling.py — División de datos y utilidades de modelado
+# -------------------------------------------------------------
+# ➤ Las divisiones trabajan con índices de fila sobre una única
+#   matriz de variables: no se duplican X, X_temp, X_train...
+# =============================================================
+
+import numpy as np
+import pandas as pd
+from sklearn.model_selection import train_test_split, StratifiedKFold
+
+from perfilado import perfilar_etapa
+
+
+# =============================================================
+# 🧮 Función: indices_division_escalonada
+# -------------------------------------------------------------
+# ➤ Misma división escalonada que dividir_dataset_escalonado, pero
+#   devolviendo solo posiciones de fila (arrays de enteros)
+# ➤ No copia X: los subconjuntos se toman bajo demanda con tomar_filas()
+# ➤ Produce exactamente las mismas filas que la versión con DataFrames
+# =============================================================
+@perfilar_etapa
+def indices_division_escalonada(
+    y,
+    val_size: float = 0.2,
+    test_size: float = 0.2,
+    random_state: int = 42
+) -> dict:
+    """
+    Calcula índices estratificados de train, test y validación.
+
+    Args:
+        y (array-like): Variable objetivo (Serie, array o columna del DataFrame).
+        val_size (float): Proporción de validación (sobre el total).
+        test_size (float): Proporción de test (sobre el restante tras validación).
+        random_state (int): Semilla para reproducibilidad.
+
+    Returns:
+        dict: {'train': np.ndarray, 'test': np.ndarray, 'val': np.ndarray} con
+              posiciones de fila (válidas para .iloc o indexado numpy).
+    """
+    y = np.asarray(y)
+    posiciones = np.arange(len(y))
+
+    # 1. Separar validación
+    pos_temp, pos_val = train_test_split(
+        posiciones, test_size=val_size, random_state=random_state, stratify=y
+    )
+
+    # 2. Separar entrenamiento y test del resto
+    pos_train, pos_test = train_test_split(
+        pos_temp, test_size=test_size, random_state=random_state, stratify=y[pos_temp]
+    )
+
+    return {"train": pos_train, "test": pos_test, "val": pos_val}
+
+
+# =============================================================
+# 🔁 Función: indices_kfold_estratificado
+# -------------------------------------------------------------
+# ➤ Genera K particiones estratificadas como pares (train, test) de índices
+# ➤ Admite restringir el K-fold a un subconjunto (p. ej. solo 'train')
+# ➤ La lista resultante se puede pasar directamente como `cv=` a sklearn
+# =============================================================
+@perfilar_etapa
+def indices_kfold_estratificado(
+    y,
+    n_splits: int = 5,
+    indices=None,
+    random_state: int = 42
+) -> list:
+    """
+    Devuelve las particiones de un K-fold estratificado como índices de fila.
+
+    Args:
+        y (array-like): Variable objetivo completa.
+        n_splits (int): Número de folds.
+        indices (np.ndarray, opcional): Posiciones sobre las que hacer el K-fold.
+            Si es None se usa todo el dataset.
+        random_state (int): Semilla para reproducibilidad.
+
+    Returns:
+        list: Lista de tuplas (idx_train, idx_test) con posiciones sobre el dataset completo.
+    """
+    y = np.asarray(y)
+    if indices is None:
+        indices = np.arange(len(y))
+
+    skf = StratifiedKFold(n_splits=n_splits, shuffle=True, random_state=random_state)
+    return [
+        (indices[fold_train], indices[fold_test])
+        for fold_train, fold_test in skf.split(np.zeros(len(indices)), y[indices])
+    ]
+
+
+# =============================================================
+# 🧱 Función: matriz_caracteristicas
+# -------------------------------------------------------------
+# ➤ Separa X e y una sola vez sin pasar por df.drop()
+# ➤ X se devuelve como una única matriz numpy contigua
+# ➤ Es la matriz sobre la que se aplican todos los índices de división
+# =============================================================
+@perfilar_etapa
+def matriz_caracteristicas(df: pd.DataFrame, target: str, dtype=None) -> tuple:
+    """
+    Construye la matriz de variables explicativas y el vector objetivo.
+
+    Args:
+        df (pd.DataFrame): DataFrame con variables y objetivo.
+        target (str): Nombre de la variable objetivo.
+        dtype (opcional): Tipo de dato de la matriz (por defecto, el común de las columnas).
+
+    Returns:
+        Tuple: X (np.ndarray), y (np.ndarray), columnas (pd.Index)
+    """
+    posiciones = np.flatnonzero(df.columns != target)
+    columnas = df.columns[posiciones]
+    tipos = df.dtypes.iloc[posiciones]
+    if dtype is None and all(isinstance(t, np.dtype) for t in tipos):
+        dtype = np.result_type(*tipos)
+
+    if dtype is None:
+        # Tipos de extensión (category, Int64...): conversión de pandas
+        X = df.iloc[:, posiciones].to_numpy()
+    else:
+        # Una sola reserva: cada columna se copia directamente en su hueco
+        X = np.empty((len(df), len(posiciones)), dtype=dtype)
+        for j, p in enumerate(posiciones):
+            X[:, j] = df.iloc[:, p].to_numpy()
+    y = df[target].to_numpy()
+    return X, y, columnas
+
+
+# =============================================================
+# 🎯 Función: tomar_filas
+# -------------------------------------------------------------
+# ➤ Accesor bajo demanda: materializa solo el subconjunto pedido
+# ➤ Acepta DataFrame, Serie o array numpy
+# ➤ Con tamano_lote devuelve un generador de lotes (memoria acotada)
+# =============================================================
+def tomar_filas(datos, indices, tamano_lote: int = None):
+    """
+    Toma las filas indicadas por posición sin copiar el resto del dataset.
+
+    Args:
+        datos (pd.DataFrame | pd.Series | np.ndarray): Datos completos.
+        indices (np.ndarray): Posiciones de fila a extraer.
+        tamano_lote (int, opcional): Si se indica, devuelve un generador que
+            produce el subconjunto en lotes de ese tamaño.
+
+    Returns:
+        Subconjunto del mismo tipo que `datos` (o generador de lotes).
+    """
+    def _tomar(idx):
+        if isinstance(datos, (pd.DataFrame, pd.Series)):
+            return datos.iloc[idx]
+        return np.take(datos, idx, axis=0)
+
+    if tamano_lote is None:
+        return _tomar(indices)
+
+    return (_tomar(indices[i:i + tamano_lote]) for i in range(0, len(indices), tamano_lote))
+
+
 # =============================================================
 # 🎯 Función: dividir_dataset_escalonado
 # -------------------------------------------------------------
@@ -6,11 +171,10 @@
 # ➤ Del resto, se divide en train y test según proporción deseada
 # ➤ Mantiene la proporción de clases (stratify)
 # ➤ Devuelve los 6 subconjuntos: X_train, X_test, X_val, y_train, y_test, y_val
+# ➤ Internamente usa indices_division_escalonada: sin copias intermedias
+#   de X ni X_temp, cada subconjunto se materializa una sola vez
 # =============================================================
-
-import pandas as pd
-from sklearn.model_selection import train_test_split
-
+@perfilar_etapa
 def dividir_dataset_escalonado(
     df: pd.DataFrame,
     target: str,
@@ -31,17 +195,14 @@ def dividir_dataset_escalonado(
     Returns:
         Tuple: X_train, X_test, X_val, y_train, y_test, y_val
     """
-    X = df.drop(columns=target)
-    y = df[target]
-
-    # 1. Separar validación
-    X_temp, X_val, y_temp, y_val = train_test_split(
-        X, y, test_size=val_size, random_state=random_state, stratify=y
+    indices = indices_division_escalonada(
+        df[target], val_size=val_size, test_size=test_size, random_state=random_state
     )
+    # Posiciones de columna calculadas una vez: cada subconjunto es un solo
+    # iloc[filas, columnas], sin copiar antes el DataFrame completo
+    posiciones = np.flatnonzero(df.columns != target)
 
-    # 2. Separar entrenamiento y test del resto
-    X_train, X_test, y_train, y_test = train_test_split(
-        X_temp, y_temp, test_size=test_size, random_state=random_state, stratify=y_temp
-    )
+    X_train, X_test, X_val = (df.iloc[indices[k], posiciones] for k in ("train", "test", "val"))
+    y_train, y_test, y_val = (df[target].iloc[indices[k]] for k in ("train", "test", "val"))
 
     return X_train, X_test, X_val, y_train, y_test, y_val
@@ -0,0 +1,236 @@
+# =============================================================
+# 📦 src/monitor_deriva.py — Monitor de deriva (PSI / CSI)
+# -------------------------------------------------------------
+# Compara las solicitudes que llegan a scoring con los datos de
+# entrenamiento (`df_modelo`) sin volver a leerlos:
+#   • construir_referencia(): histogramas de referencia por variable
+#     (bins por cuantiles en numéricas, frecuencias en categóricas
+#     con el mismo agrupado en 'OTROS' que feature_engineering) y de
+#     la PD predicha.
+#   • actualizar_monitor(): acumula conteos por lote con
+#     searchsorted + bincount (coste O(n) por lote, sin copias).
+#   • informe_deriva(): CSI por variable y PSI de la PD.
+# =============================================================
+
+import json
+
+import numpy as np
+import pandas as pd
+
+from feature_engineering import categorias_poco_frecuentes
+from utils import get_file_path
+
+UMBRALES_PSI = (0.10, 0.25)   # < 0.10 estable · < 0.25 moderada · resto significativa
+CATEGORIA_OTROS = "OTROS"
+VARIABLE_PD = "__pd__"
+
+
+# -------------------------------------------------------------
+# 📏 Bordes de bins para una variable numérica
+# -------------------------------------------------------------
+# Variables discretas (dummies, ordinales) con pocos valores: un
+# bin por valor (bordes en los puntos medios). Continuas: cuantiles.
+# Los NaN van siempre a un bin adicional al final.
+# -------------------------------------------------------------
+def _bordes_numericos(valores: np.ndarray, n_bins: int) -> np.ndarray:
+    valores = valores[~np.isnan(valores)]
+    unicos = np.unique(valores)
+    if len(unicos) <= n_bins:
+        return (unicos[:-1] + unicos[1:]) / 2
+    return np.unique(np.quantile(valores, np.linspace(0, 1, n_bins + 1)[1:-1]))
+
+
+def _conteos_numericos(valores, bordes: np.ndarray) -> np.ndarray:
+    valores = np.asarray(valores, dtype=np.float64)
+    indices = np.searchsorted(bordes, valores, side="right")
+    indices[np.isnan(valores)] = len(bordes) + 1
+    return np.bincount(indices, minlength=len(bordes) + 2)
+
+
+def _conteos_categoricos(valores, categorias: list) -> np.ndarray:
+    # Las categorías no vistas (o agrupadas) caen en OTROS, que es la última
+    codigos = pd.Categorical(np.asarray(valores, dtype=object), categories=categorias[:-1]).codes.astype(np.int64)
+    codigos[codigos < 0] = len(categorias) - 1
+    return np.bincount(codigos, minlength=len(categorias))
+
+
+# =============================================================
+# 🏗️ Función: construir_referencia
+# -------------------------------------------------------------
+# ➤ Se ejecuta una vez al entrenar, sobre df_modelo (sin target)
+# ➤ Guarda bordes/categorías y proporciones de referencia
+# =============================================================
+def construir_referencia(
+    df: pd.DataFrame,
+    pd_referencia=None,
+    target: str = "target",
+    n_bins: int = 10,
+    criterio_categorias: float = 0.5
+) -> dict:
+    """
+    Construye los histogramas de referencia de cada variable del modelo.
+
+    Args:
+        df (pd.DataFrame): Datos de entrenamiento (p. ej. df_modelo).
+        pd_referencia (array-like, opcional): PD predicha sobre esos datos.
+        target (str): Columna objetivo a excluir si está presente.
+        n_bins (int): Bins por variable numérica.
+        criterio_categorias (float): Umbral (%) para agrupar categorías raras en 'OTROS'.
+
+    Returns:
+        dict: {variable: {'tipo', 'bordes' | 'categorias', 'proporciones'}}
+    """
+    referencia = {}
+    for columna in df.columns.drop(target, errors="ignore"):
+        serie = df[columna]
+        if pd.api.types.is_numeric_dtype(serie) and not pd.api.types.is_bool_dtype(serie):
+            bordes = _bordes_numericos(serie.to_numpy(dtype=np.float64), n_bins)
+            conteos = _conteos_numericos(serie, bordes)
+            referencia[columna] = {"tipo": "numerica", "bordes": bordes}
+        else:
+            raras = categorias_poco_frecuentes(serie.astype(str), criterio_categorias)
+            categorias = [c for c in serie.astype(str).unique() if c not in raras and c != CATEGORIA_OTROS]
+            categorias = sorted(categorias) + [CATEGORIA_OTROS]
+            conteos = _conteos_categoricos(serie.astype(str), categorias)
+            referencia[columna] = {"tipo": "categorica", "categorias": categorias}
+        referencia[columna]["proporciones"] = conteos / conteos.sum()
+
+    if pd_referencia is not None:
+        pd_referencia = np.asarray(pd_referencia, dtype=np.float64)
+        bordes = _bordes_numericos(pd_referencia, n_bins)
+        conteos = _conteos_numericos(pd_referencia, bordes)
+        referencia[VARIABLE_PD] = {"tipo": "numerica", "bordes": bordes, "proporciones": conteos / conteos.sum()}
+
+    print(f"✅ Referencia de deriva construida para {len(referencia)} variables")
+    return referencia
+
+
+# =============================================================
+# 🔄 Funciones: iniciar_monitor / actualizar_monitor
+# -------------------------------------------------------------
+# ➤ El estado solo contiene conteos enteros por variable
+# ➤ Cada lote de scoring suma sus conteos (sin guardar datos)
+# =============================================================
+def iniciar_monitor(referencia: dict) -> dict:
+    """
+    Crea el estado vacío del monitor a partir de la referencia.
+    """
+    return {
+        "referencia": referencia,
+        "n_observaciones": 0,
+        "conteos": {v: np.zeros(len(r["proporciones"]), dtype=np.int64) for v, r in referencia.items()},
+    }
+
+
+def actualizar_monitor(estado: dict, lote: pd.DataFrame, pd_lote=None) -> dict:
+    """
+    Acumula los conteos de un lote de solicitudes puntuadas.
+
+    Args:
+        estado (dict): Estado devuelto por iniciar_monitor().
+        lote (pd.DataFrame): Variables del lote (mismas columnas que en la referencia).
+        pd_lote (array-like, opcional): PD predicha para el lote.
+
+    Returns:
+        dict: El mismo estado, actualizado en sitio.
+    """
+    referencia = estado["referencia"]
+    for variable, ref in referencia.items():
+        if variable == VARIABLE_PD:
+            if pd_lote is not None:
+                estado["conteos"][variable] += _conteos_numericos(pd_lote, ref["bordes"])
+            continue
+        if variable not in lote.columns:
+            continue
+        if ref["tipo"] == "numerica":
+            estado["conteos"][variable] += _conteos_numericos(lote[variable], ref["bordes"])
+        else:
+            estado["conteos"][variable] += _conteos_categoricos(lote[variable].astype(str), ref["categorias"])
+    estado["n_observaciones"] += len(lote)
+    return estado
+
+
+# =============================================================
+# 📐 Función: calcular_psi
+# -------------------------------------------------------------
+# ➤ PSI = Σ (obs − esp) · ln(obs / esp)
+# ➤ epsilon evita log(0) en bins vacíos
+# =============================================================
+def calcular_psi(esperado, observado, epsilon: float = 1e-4) -> float:
+    """
+    Population Stability Index entre dos distribuciones (proporciones o conteos).
+    """
+    esperado = np.asarray(esperado, dtype=np.float64)
+    observado = np.asarray(observado, dtype=np.float64)
+    esperado = np.clip(esperado / esperado.sum(), epsilon, None)
+    observado = np.clip(observado / max(observado.sum(), 1), epsilon, None)
+    return float(np.sum((observado - esperado) * np.log(observado / esperado)))
+
+
+# =============================================================
+# 📋 Función: informe_deriva
+# =============================================================
+def informe_deriva(estado: dict, umbrales: tuple = UMBRALES_PSI) -> pd.DataFrame:
+    """
+    Calcula el CSI de cada variable y el PSI de la PD acumulados en el monitor.
+
+    Args:
+        estado (dict): Estado del monitor.
+        umbrales (tuple): Cortes (moderada, significativa) del índice.
+
+    Returns:
+        pd.DataFrame: variable, indice (PSI/CSI), valor, nivel; ordenado por valor.
+    """
+    filas = []
+    for variable, ref in estado["referencia"].items():
+        conteos = estado["conteos"][variable]
+        if conteos.sum() == 0:
+            continue
+        valor = calcular_psi(ref["proporciones"], conteos)
+        nivel = ("estable" if valor < umbrales[0]
+                 else "moderada" if valor < umbrales[1] else "significativa")
+        filas.append({
+            "variable": "pd" if variable == VARIABLE_PD else variable,
+            "indice": "PSI" if variable == VARIABLE_PD else "CSI",
+            "valor": valor,
+            "nivel": nivel,
+        })
+
+    informe = pd.DataFrame(filas, columns=["variable", "indice", "valor", "nivel"])
+    informe = informe.sort_values("valor", ascending=False, ignore_index=True)
+    n_alertas = (informe["nivel"] == "significativa").sum()
+    print(f"\n📊 Deriva sobre {estado['n_observaciones']:,} solicitudes: "
+          f"{n_alertas} variables con deriva significativa")
+    return informe
+
+
+# =============================================================
+# 💾 Guardado y carga de la referencia (outputs/metrics/)
+# =============================================================
+def guardar_referencia(referencia: dict, filename: str = "referencia_deriva.json"):
+    """
+    Guarda la referencia en JSON para que los procesos de scoring la reutilicen.
+    """
+    ruta = get_file_path("metrics", filename)
+    ruta.parent.mkdir(parents=True, exist_ok=True)
+    serializable = {
+        variable: {k: (v.tolist() if isinstance(v, np.ndarray) else v) for k, v in ref.items()}
+        for variable, ref in referencia.items()
+    }
+    ruta.write_text(json.dumps(serializable, default=str))
+    print(f"✅ Referencia de deriva guardada en: {ruta}")
+
+
+def cargar_referencia(filename: str = "referencia_deriva.json") -> dict:
+    """
+    Carga una referencia guardada con guardar_referencia().
+    """
+    ruta = get_file_path("metrics", filename)
+    if not ruta.exists():
+        raise FileNotFoundError(f"❌ No existe la referencia de deriva: {ruta}")
+    referencia = json.loads(ruta.read_text())
+    for ref in referencia.values():
+        for clave in ("bordes", "proporciones"):
+            if clave in ref:
+                ref[clave] = np.asarray(ref[clave], dtype=np.float64)
+    return referencia
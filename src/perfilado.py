@@ -0,0 +1,239 @@
+# =============================================================
+# 📦 src/perfilado.py — Instrumentación de tiempo y memoria
+# -------------------------------------------------------------
+# Mide cada llamada a las funciones del pipeline:
+#   • tiempo de reloj y de CPU
+#   • incremento del pico de RSS del proceso (ru_maxrss)
+#   • filas de entrada y de salida
+#
+# Uso:
+#   @perfilar_etapa                  → en funciones de src/
+#   with etapa("entrenamiento"): ... → bloques arbitrarios
+#
+# Desactivado por defecto: el decorador solo comprueba un flag y
+# llama a la función. Se activa con activar_perfilado() o con
+# `python main.py --profile`.
+# =============================================================
+
+import functools
+import json
+import os
+import resource
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+import pandas as pd
+
+_ACTIVO = False
+_TRAZA = []
+# Pila de etapas abiertas, una por hilo: cargar_multiples_dataframes
+# ejecuta load_data (decorado) en paralelo y las etapas de un hilo no
+# deben tomarse como padre de las de otro
+_LOCAL = threading.local()
+
+
+def _pila() -> list:
+    if not hasattr(_LOCAL, "pila"):
+        _LOCAL.pila = []
+    return _LOCAL.pila
+
+
+# -------------------------------------------------------------
+# 🧠 Memoria del proceso (MB)
+# -------------------------------------------------------------
+# rss_mb(): memoria residente actual. Usa psutil si está instalado;
+# si no, /proc/self/statm (Linux) y, como último recurso, el pico
+# de getrusage. _pico_rss_mb(): pico histórico (ru_maxrss).
+# -------------------------------------------------------------
+def _pico_rss_mb() -> float:
+    # ru_maxrss está en KB en Linux y en bytes en macOS
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return maxrss / 1024 ** 2 if os.uname().sysname == "Darwin" else maxrss / 1024
+
+
+def rss_mb() -> float:
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss / 1024 ** 2
+    except ImportError:
+        pass
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1024 ** 2
+    except (OSError, ValueError):
+        return _pico_rss_mb()
+
+
+def _contar_filas(obj):
+    # DataFrame, Series, arrays; en tuplas (X, y...) se usa el primer elemento
+    if isinstance(obj, tuple) and obj:
+        obj = obj[0]
+    forma = getattr(obj, "shape", None)
+    if forma:
+        return int(forma[0])
+    return None
+
+
+# =============================================================
+# ⚙️ Activación y estado de la traza
+# =============================================================
+def activar_perfilado(activo: bool = True):
+    """
+    Activa o desactiva la instrumentación global.
+    """
+    global _ACTIVO
+    _ACTIVO = activo
+
+
+def perfilado_activo() -> bool:
+    return _ACTIVO
+
+
+def reiniciar_traza():
+    """
+    Vacía la traza acumulada.
+    """
+    _TRAZA.clear()
+
+
+def obtener_traza() -> list:
+    """
+    Devuelve una copia de los registros de la traza.
+    """
+    return list(_TRAZA)
+
+
+# =============================================================
+# ⏱️ Context manager: etapa
+# -------------------------------------------------------------
+# ➤ Registra una entrada en la traza al salir del bloque
+# ➤ El bloque puede fijar registro["filas_salida"]
+# ➤ Las etapas anidadas guardan su padre y su profundidad
+# =============================================================
+@contextmanager
+def etapa(nombre: str, filas_entrada: int = None):
+    """
+    Mide un bloque de código como etapa del pipeline.
+
+    Args:
+        nombre (str): Nombre de la etapa.
+        filas_entrada (int, opcional): Filas de entrada del bloque.
+
+    Yields:
+        dict: Registro de la etapa (se puede completar con 'filas_salida').
+    """
+    registro = {"etapa": nombre, "filas_entrada": filas_entrada, "filas_salida": None}
+    if not _ACTIVO:
+        yield registro
+        return
+
+    pila = _pila()
+    registro["padre"] = pila[-1] if pila else None
+    registro["profundidad"] = len(pila)
+    pila.append(nombre)
+
+    pico_inicial = _pico_rss_mb()
+    rss_inicial = rss_mb()
+    cpu_inicial = time.process_time()
+    inicio = time.perf_counter()
+    registro["inicio"] = datetime.now().isoformat(timespec="milliseconds")
+    try:
+        yield registro
+    finally:
+        registro["tiempo_s"] = time.perf_counter() - inicio
+        registro["cpu_s"] = time.process_time() - cpu_inicial
+        registro["delta_pico_rss_mb"] = _pico_rss_mb() - pico_inicial
+        registro["delta_rss_mb"] = rss_mb() - rss_inicial
+        pila.pop()
+        _TRAZA.append(registro)
+
+
+# =============================================================
+# 🎯 Decorador: perfilar_etapa
+# -------------------------------------------------------------
+# ➤ Nombre de etapa: <módulo>.<función>
+# ➤ Filas de entrada: primer argumento con shape (DataFrame/array)
+# ➤ Filas de salida: resultado (o primer elemento si es tupla)
+# =============================================================
+def perfilar_etapa(funcion):
+    """
+    Decorador que registra tiempo, CPU, memoria y filas de cada llamada.
+    """
+    nombre = f"{funcion.__module__}.{funcion.__name__}"
+
+    @functools.wraps(funcion)
+    def envoltura(*args, **kwargs):
+        if not _ACTIVO:
+            return funcion(*args, **kwargs)
+
+        filas_entrada = next(
+            (n for n in map(_contar_filas, (*args, *kwargs.values())) if n is not None), None
+        )
+        with etapa(nombre, filas_entrada) as registro:
+            resultado = funcion(*args, **kwargs)
+            registro["filas_salida"] = _contar_filas(resultado)
+        return resultado
+
+    return envoltura
+
+
+# =============================================================
+# 📋 Función: resumen_perfilado
+# =============================================================
+def resumen_perfilado(mostrar: bool = True) -> pd.DataFrame:
+    """
+    Agrega la traza por etapa (llamadas, tiempos, CPU, memoria y filas).
+
+    Returns:
+        pd.DataFrame: Una fila por etapa, ordenada por tiempo total.
+    """
+    if not _TRAZA:
+        print("⚠️ La traza de perfilado está vacía.")
+        return pd.DataFrame()
+
+    traza = pd.DataFrame(_TRAZA)
+    resumen = (
+        traza.groupby("etapa", sort=False)
+        .agg(
+            llamadas=("etapa", "size"),
+            tiempo_total_s=("tiempo_s", "sum"),
+            cpu_total_s=("cpu_s", "sum"),
+            delta_pico_rss_mb=("delta_pico_rss_mb", "max"),
+            filas_entrada=("filas_entrada", "max"),
+            filas_salida=("filas_salida", "max"),
+        )
+        .sort_values("tiempo_total_s", ascending=False)
+        .reset_index()
+    )
+    if mostrar:
+        print("\n⏱️ Resumen de perfilado por etapa:")
+        print(resumen.round(3).to_string(index=False))
+    return resumen
+
+
+# =============================================================
+# 💾 Función: guardar_traza
+# -------------------------------------------------------------
+# ➤ JSON estructurado en outputs/metrics/perfil_<fecha>.json
+# =============================================================
+def guardar_traza(filename: str = None):
+    """
+    Guarda la traza completa en JSON (una entrada por llamada).
+
+    Args:
+        filename (str, opcional): Nombre del archivo; por defecto con marca de tiempo.
+
+    Returns:
+        Path: Ruta del archivo escrito.
+    """
+    from utils import get_file_path
+
+    filename = filename or f"perfil_{datetime.now():%Y%m%d_%H%M%S}.json"
+    ruta = get_file_path("metrics", filename)
+    ruta.parent.mkdir(parents=True, exist_ok=True)
+    contenido = {"pid": os.getpid(), "registros": _TRAZA}
+    ruta.write_text(json.dumps(contenido, indent=2, default=str))
+    print(f"✅ Traza de perfilado guardada en: {ruta}")
+    return ruta
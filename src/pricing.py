@@ -0,0 +1,169 @@
+# =============================================================
+# 📦 src/pricing.py — Pricing por riesgo y rejilla de sensibilidad
+# -------------------------------------------------------------
+# Fórmulas del notebook 05 en versión vectorizada (arrays numpy):
+#   • interés mínimo = tipo_base + coef_riesgo · PD
+#   • cuota mensual  = sistema francés (anualidad)
+#   • pérdida esperada = PD · LGD · principal
+# Parámetros en config.yaml → sección `pricing`.
+#
+# rejilla_sensibilidad() construye todas las combinaciones "qué pasa
+# si" de un solicitante (p. ej. 50 importes x 2 plazos) como un único
+# lote: una sola llamada a predict_proba para toda la superficie.
+#
+# Con `calibracion` (tabla de calibracion.py) la PD bruta del modelo se
+# calibra con un np.interp antes de precio y pérdida esperada.
+# =============================================================
+
+import numpy as np
+import pandas as pd
+
+from utils import load_config
+
+PARAMETROS_POR_DEFECTO = {"tipo_base": 0.05, "coef_riesgo": 0.10, "lgd": 0.45}
+
+
+def parametros_pricing() -> dict:
+    """
+    Devuelve los parámetros de pricing de config.yaml (con valores por defecto).
+    """
+    return {**PARAMETROS_POR_DEFECTO, **(load_config().get("pricing") or {})}
+
+
+# =============================================================
+# 💶 Fórmulas vectorizadas
+# =============================================================
+def calcular_interes_minimo(pd_impago, tipo_base: float = None, coef_riesgo: float = None):
+    """
+    Interés anual mínimo según riesgo: tipo_base + coef_riesgo · PD.
+
+    Args:
+        pd_impago (float | array-like): Probabilidad de impago.
+        tipo_base (float, opcional): Interés base (por defecto, config.yaml).
+        coef_riesgo (float, opcional): Margen por unidad de PD (por defecto, config.yaml).
+
+    Returns:
+        np.ndarray | float: Interés anual (en tanto por uno).
+    """
+    parametros = parametros_pricing()
+    tipo_base = parametros["tipo_base"] if tipo_base is None else tipo_base
+    coef_riesgo = parametros["coef_riesgo"] if coef_riesgo is None else coef_riesgo
+    return tipo_base + coef_riesgo * np.asarray(pd_impago, dtype=np.float64)
+
+
+def calcular_cuota_mensual(principal, interes_anual, num_cuotas):
+    """
+    Cuota mensual constante (sistema francés): P · r / (1 − (1 + r)^−n), r = interés/12.
+
+    Args:
+        principal (float | array-like): Importe del préstamo.
+        interes_anual (float | array-like): Interés anual (tanto por uno).
+        num_cuotas (int | array-like): Número de cuotas mensuales.
+
+    Returns:
+        np.ndarray | float: Cuota mensual (interés 0 → principal / n).
+    """
+    principal = np.asarray(principal, dtype=np.float64)
+    r = np.asarray(interes_anual, dtype=np.float64) / 12
+    n = np.asarray(num_cuotas, dtype=np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cuota = principal * r / -np.expm1(-n * np.log1p(r))
+    return np.where(r == 0, principal / n, cuota)
+
+
+def calcular_perdida_esperada(pd_impago, principal, lgd: float = None):
+    """
+    Pérdida esperada: PD · LGD · EAD (EAD = principal).
+    """
+    lgd = parametros_pricing()["lgd"] if lgd is None else lgd
+    return np.asarray(pd_impago, dtype=np.float64) * lgd * np.asarray(principal, dtype=np.float64)
+
+
+# =============================================================
+# 🧾 Función: valorar_solicitudes
+# -------------------------------------------------------------
+# ➤ PD, interés, cuota y pérdida esperada para un lote de solicitudes
+# ➤ Una sola llamada a predict_proba (+ np.interp si hay calibración)
+# =============================================================
+def valorar_solicitudes(
+    modelo,
+    X: pd.DataFrame,
+    col_principal: str = "principal",
+    col_cuotas: str = "num_cuotas",
+    calibracion: dict = None,
+    **parametros
+) -> pd.DataFrame:
+    """
+    Puntúa y precia un lote de solicitudes.
+
+    Args:
+        modelo: Estimador o Pipeline con predict_proba (p. ej. el modelo ligero).
+        X (pd.DataFrame): Solicitudes con las variables del modelo.
+        col_principal (str): Columna con el importe (sin escalar).
+        col_cuotas (str): Columna con el número de cuotas.
+        calibracion (dict, opcional): Tabla de calibración de la PD
+            (componente 'calibracion' del registro de modelos).
+        **parametros: tipo_base, coef_riesgo o lgd para sobrescribir config.yaml.
+
+    Returns:
+        pd.DataFrame: X con columnas PD, interes_minimo, cuota_mensual y perdida_esperada.
+    """
+    # Solo las columnas que espera el modelo, en su orden
+    columnas = list(getattr(modelo, "feature_names_in_", X.columns))
+    pd_impago = modelo.predict_proba(X[columnas])[:, 1]
+    if calibracion is not None:
+        from calibracion import aplicar_calibracion
+
+        pd_impago = aplicar_calibracion(calibracion, pd_impago)
+    interes = calcular_interes_minimo(pd_impago, parametros.get("tipo_base"), parametros.get("coef_riesgo"))
+
+    resultado = X.copy()
+    resultado["PD"] = pd_impago
+    resultado["interes_minimo"] = interes
+    resultado["cuota_mensual"] = calcular_cuota_mensual(X[col_principal], interes, X[col_cuotas])
+    resultado["perdida_esperada"] = calcular_perdida_esperada(pd_impago, X[col_principal], parametros.get("lgd"))
+    return resultado
+
+
+# =============================================================
+# 📈 Función: rejilla_sensibilidad
+# -------------------------------------------------------------
+# ➤ Solicitante base + rangos para una o dos variables
+# ➤ Construye la rejilla completa como un DataFrame (producto cartesiano)
+# ➤ Devuelve la superficie PD / interés / cuota en formato largo
+# =============================================================
+def rejilla_sensibilidad(modelo, solicitante, rangos: dict, **parametros) -> pd.DataFrame:
+    """
+    Calcula la superficie "qué pasa si" de un solicitante en un único lote.
+
+    Args:
+        modelo: Estimador o Pipeline con predict_proba.
+        solicitante (dict | pd.Series | pd.DataFrame de una fila): Perfil base.
+        rangos (dict): {variable: valores} para una o dos variables,
+            p. ej. {"principal": np.linspace(5_000, 40_000, 50), "num_cuotas": [36, 60]}.
+        **parametros: calibracion, tipo_base, coef_riesgo o lgd (ver valorar_solicitudes).
+
+    Returns:
+        pd.DataFrame: Una fila por combinación con las variables del solicitante,
+        PD, interes_minimo, cuota_mensual y perdida_esperada. Para graficar:
+        rejilla.pivot(index=<var1>, columns=<var2>, values="PD").
+    """
+    if isinstance(solicitante, pd.DataFrame):
+        solicitante = solicitante.iloc[0]
+    solicitante = pd.Series(solicitante)
+
+    if not 1 <= len(rangos) <= 2:
+        raise ValueError("❌ Indica rangos para una o dos variables.")
+    desconocidas = [v for v in rangos if v not in solicitante.index]
+    if desconocidas:
+        raise ValueError(f"❌ Variables no presentes en el solicitante: {desconocidas}")
+
+    mallas = np.meshgrid(*[np.asarray(v) for v in rangos.values()], indexing="ij")
+    n = mallas[0].size
+
+    # Rejilla: el perfil base repetido n veces con las variables del rango sustituidas
+    rejilla = pd.DataFrame({col: np.repeat(valor, n) for col, valor in solicitante.items()})
+    for variable, malla in zip(rangos, mallas):
+        rejilla[variable] = malla.ravel()
+
+    return valorar_solicitudes(modelo, rejilla, **parametros)
@@ -0,0 +1,357 @@
+# =============================================================
+# 📦 src/reentrenamiento.py — Reentrenamiento incremental mensual
+# -------------------------------------------------------------
+# En lugar de repetir el notebook 05 sobre todo df_modelo.csv:
+#   • HGB: se añaden iteraciones de boosting con warm_start
+#     entrenadas solo con los préstamos nuevos ya finalizados.
+#   • Lineal: actualización tipo partial_fit (SGD con pérdida
+#     logística) partiendo de los coeficientes actuales.
+#   • Pipeline (ColumnTransformer + HGB del notebook 05, registrado
+#     con importar_artefacto): el preprocesado se reutiliza solo con
+#     transform y se amplía únicamente el estimador final.
+# El pipeline/scaler registrado se reutiliza tal cual y la nueva
+# versión solo se promueve si su AUC en holdout no empeora frente
+# al reentrenamiento completo (o a su AUC de referencia).
+# =============================================================
+
+import copy
+import time
+
+import numpy as np
+import pandas as pd
+from sklearn.base import clone
+from sklearn.ensemble import HistGradientBoostingClassifier
+from sklearn.linear_model import LogisticRegression, SGDClassifier
+from sklearn.metrics import roc_auc_score
+from sklearn.pipeline import Pipeline
+
+from registro_modelos import cargar_modelo, registrar_modelo
+
+# Estados con resultado definitivo: el préstamo ya no cambiará de clase
+ESTADOS_FINALIZADOS = [
+    "Fully Paid",
+    "Charged Off",
+    "Default",
+    "Does not meet the credit policy. Status:Fully Paid",
+    "Does not meet the credit policy. Status:Charged Off",
+]
+
+
+# =============================================================
+# 📅 Función: filtrar_prestamos_finalizados
+# -------------------------------------------------------------
+# ➤ Se queda solo con préstamos cuyo resultado ya es definitivo
+# ➤ Opcionalmente excluye los ids ya usados en entrenamientos previos
+# =============================================================
+def filtrar_prestamos_finalizados(
+    df: pd.DataFrame,
+    col_estado: str = "estado",
+    ids_usados=None,
+    col_id: str = "id_cliente"
+) -> pd.DataFrame:
+    """
+    Filtra los préstamos con resultado definitivo (pagados o impagados).
+
+    Args:
+        df (pd.DataFrame): Préstamos nuevos (antes de crear 'target').
+        col_estado (str): Columna con el estado del préstamo.
+        ids_usados (array-like, opcional): Ids ya incluidos en entrenamientos anteriores.
+        col_id (str): Columna identificadora para excluir ids_usados.
+
+    Returns:
+        pd.DataFrame: Préstamos nuevos finalizados.
+    """
+    mascara = df[col_estado].isin(ESTADOS_FINALIZADOS)
+    if ids_usados is not None and col_id in df.columns:
+        mascara &= ~df[col_id].isin(ids_usados)
+    print(f"📅 Préstamos finalizados nuevos: {mascara.sum():,} de {len(df):,}")
+    return df[mascara]
+
+
+# =============================================================
+# 🌲 Función: reentrenar_incremental_hgb
+# -------------------------------------------------------------
+# ➤ Añade `iteraciones_nuevas` árboles con warm_start=True
+# ➤ Los árboles existentes no se modifican; solo se ajustan los
+#   nuevos sobre los residuos de los préstamos nuevos
+# ➤ Coste proporcional a los datos nuevos, no al histórico
+# ⚠️ scikit-learn recalcula los umbrales de binning con los datos
+#   del nuevo fit; por eso la promoción se condiciona siempre a la
+#   comparación de AUC en holdout (evaluar_promocion)
+# =============================================================
+def reentrenar_incremental_hgb(modelo, X_nuevo, y_nuevo, iteraciones_nuevas: int = 50):
+    """
+    Amplía un HistGradientBoostingClassifier con nuevas iteraciones de boosting.
+
+    Args:
+        modelo (HistGradientBoostingClassifier): Modelo entrenado (no se modifica).
+        X_nuevo (pd.DataFrame | np.ndarray): Variables de los préstamos nuevos.
+        y_nuevo (array-like): Objetivo de los préstamos nuevos.
+        iteraciones_nuevas (int): Número máximo de árboles a añadir.
+
+    Returns:
+        HistGradientBoostingClassifier: Copia del modelo con las iteraciones añadidas.
+    """
+    # deepcopy también convierte en arrays escribibles los memmap del registro
+    modelo = copy.deepcopy(modelo)
+    iteraciones_previas = modelo.n_iter_
+    modelo.set_params(warm_start=True, max_iter=iteraciones_previas + iteraciones_nuevas)
+    modelo.fit(X_nuevo, y_nuevo)
+    print(f"🌲 Iteraciones: {iteraciones_previas} → {modelo.n_iter_} con {len(y_nuevo):,} préstamos nuevos")
+    return modelo
+
+
+# =============================================================
+# 📈 Función: reentrenar_incremental_lineal
+# -------------------------------------------------------------
+# ➤ Si el modelo ya admite partial_fit (SGDClassifier), se usa
+# ➤ Si es una LogisticRegression, se convierte en un SGDClassifier
+#   con pérdida logística inicializado con sus coeficientes
+# ➤ El scaler NO se reajusta: los coeficientes están expresados en
+#   la escala del entrenamiento original
+# ➤ Regularización: el objetivo de LogisticRegression es
+#   C·Σ pérdida + ½‖w‖², que por muestra equivale a alpha = 1 / (C·n)
+#   con n = filas del entrenamiento original + nuevas (no solo el lote
+#   nuevo: con un lote pequeño se encogerían de más los coeficientes)
+# ➤ Parada: tasa 'adaptive' (eta se divide entre 5 cuando la pérdida
+#   no mejora `tol` en `n_iter_no_change` pasadas), como máximo `epocas`
+# =============================================================
+def reentrenar_incremental_lineal(
+    modelo,
+    X_nuevo,
+    y_nuevo,
+    scaler=None,
+    n_entrenamiento: int = None,
+    epocas: int = 5,
+    eta0: float = 0.01,
+    tol: float = 1e-4,
+    n_iter_no_change: int = 2
+):
+    """
+    Actualiza un modelo lineal con los préstamos nuevos (estilo partial_fit).
+
+    Args:
+        modelo (LogisticRegression | SGDClassifier): Modelo entrenado (no se modifica).
+        X_nuevo (pd.DataFrame | np.ndarray): Variables de los préstamos nuevos.
+        y_nuevo (array-like): Objetivo de los préstamos nuevos.
+        scaler (opcional): Scaler registrado; se aplica con transform().
+        n_entrenamiento (int): Filas con las que se entrenó el modelo original
+            (obligatorio al partir de una LogisticRegression).
+        epocas (int): Pasadas máximas sobre los datos nuevos.
+        eta0 (float): Tasa de aprendizaje inicial del SGD.
+        tol (float): Mejora mínima de la pérdida por pasada antes de reducir eta.
+        n_iter_no_change (int): Pasadas sin mejora antes de reducir eta.
+
+    Returns:
+        SGDClassifier: Modelo lineal actualizado.
+    """
+    X_nuevo = scaler.transform(X_nuevo) if scaler is not None else X_nuevo
+    y_nuevo = np.asarray(y_nuevo)
+
+    if hasattr(modelo, "partial_fit"):
+        # SGDClassifier ya registrado: conserva su alpha y su tasa de aprendizaje
+        modelo = copy.deepcopy(modelo)
+        for _ in range(epocas):
+            modelo.partial_fit(X_nuevo, y_nuevo, classes=np.array([0, 1]))
+        return modelo
+
+    if n_entrenamiento is None:
+        raise ValueError("❌ Indica n_entrenamiento (filas del entrenamiento original) para fijar la "
+                         "regularización equivalente a la de la LogisticRegression.")
+
+    alpha = 1.0 / (getattr(modelo, "C", 1.0) * (n_entrenamiento + len(y_nuevo)))
+    sgd = SGDClassifier(
+        loss="log_loss", penalty="l2", alpha=alpha,
+        learning_rate="adaptive", eta0=eta0,
+        max_iter=epocas, tol=tol, n_iter_no_change=n_iter_no_change, early_stopping=False,
+        random_state=42,
+    )
+    sgd.fit(X_nuevo, y_nuevo, coef_init=modelo.coef_.copy(), intercept_init=modelo.intercept_.copy())
+    return sgd
+
+
+# -------------------------------------------------------------
+# 🔀 Reentrenamiento según el tipo de estimador
+# -------------------------------------------------------------
+def _reentrenar_estimador(estimador, X_nuevo, y_nuevo, iteraciones_nuevas, scaler, n_entrenamiento):
+    if isinstance(estimador, HistGradientBoostingClassifier):
+        return reentrenar_incremental_hgb(estimador, X_nuevo, y_nuevo, iteraciones_nuevas)
+    if isinstance(estimador, (LogisticRegression, SGDClassifier)):
+        return reentrenar_incremental_lineal(estimador, X_nuevo, y_nuevo, scaler=scaler,
+                                             n_entrenamiento=n_entrenamiento)
+    raise ValueError(
+        f"❌ Reentrenamiento incremental no soportado para {type(estimador).__name__}. "
+        "Usa HistGradientBoostingClassifier, LogisticRegression o SGDClassifier "
+        "(solos o como último paso de un Pipeline)."
+    )
+
+
+# =============================================================
+# ⚖️ Función: evaluar_promocion
+# -------------------------------------------------------------
+# ➤ Compara el AUC en holdout del modelo incremental con:
+#     - el de un reentrenamiento completo (si se pasa el histórico), o
+#     - un AUC de referencia (p. ej. el del último reentrenamiento completo)
+# ➤ Promociona si no empeora más de `tolerancia_auc`
+# =============================================================
+def evaluar_promocion(
+    modelo_incremental,
+    X_holdout,
+    y_holdout,
+    estimador_completo=None,
+    X_completo=None,
+    y_completo=None,
+    auc_referencia: float = None,
+    tolerancia_auc: float = 0.005,
+    scaler=None
+) -> dict:
+    """
+    Decide si el modelo incremental puede sustituir al modelo actual.
+
+    Args:
+        modelo_incremental: Modelo resultante del reentrenamiento incremental.
+        X_holdout, y_holdout: Conjunto de validación común a ambos modelos.
+        estimador_completo (opcional): Estimador sin entrenar para el reentrenamiento completo.
+        X_completo, y_completo (opcional): Histórico + nuevos para el reentrenamiento completo.
+        auc_referencia (float, opcional): AUC de referencia si no se reentrena completo.
+        tolerancia_auc (float): Pérdida máxima de AUC admitida.
+        scaler (opcional): Scaler a aplicar antes de predecir (modelos lineales).
+
+    Returns:
+        dict: auc_incremental, auc_referencia, tiempo_completo_s, promover.
+    """
+    X_eval = scaler.transform(X_holdout) if scaler is not None else X_holdout
+    auc_incremental = roc_auc_score(y_holdout, modelo_incremental.predict_proba(X_eval)[:, 1])
+
+    tiempo_completo = None
+    if estimador_completo is not None:
+        inicio = time.perf_counter()
+        X_fit = scaler.transform(X_completo) if scaler is not None else X_completo
+        completo = clone(estimador_completo).fit(X_fit, y_completo)
+        tiempo_completo = time.perf_counter() - inicio
+        auc_referencia = roc_auc_score(y_holdout, completo.predict_proba(X_eval)[:, 1])
+    elif auc_referencia is None:
+        raise ValueError("❌ Indica un estimador para el reentrenamiento completo o un auc_referencia.")
+
+    promover = auc_incremental >= auc_referencia - tolerancia_auc
+
+    print("\n⚖️ Evaluación para promoción:")
+    print(f"   ➤ AUC incremental: {auc_incremental:.4f}")
+    print(f"   ➤ AUC referencia:  {auc_referencia:.4f}")
+    if tiempo_completo is not None:
+        print(f"   ➤ Tiempo reentrenamiento completo: {tiempo_completo:.1f} s")
+    print("✅ Se promociona la nueva versión." if promover else "⚠️ No se promociona: el AUC empeora.")
+
+    return {
+        "auc_incremental": auc_incremental,
+        "auc_referencia": auc_referencia,
+        "tiempo_completo_s": tiempo_completo,
+        "promover": promover,
+    }
+
+
+# =============================================================
+# 🔄 Función: actualizacion_mensual
+# -------------------------------------------------------------
+# ➤ Flujo completo sobre el registro de modelos:
+#     1. Carga la versión ACTUAL (y su pipeline/scaler)
+#     2. Transforma los préstamos nuevos con el pipeline registrado
+#        (o con los pasos previos si el modelo es un Pipeline)
+#     3. Reentrena de forma incremental (HGB o lineal) y, si el
+#        modelo es un Pipeline, lo reconstruye con el nuevo estimador
+#     4. Evalúa en holdout y registra la nueva versión
+#     5. La promueve solo si supera la evaluación
+# =============================================================
+def actualizacion_mensual(
+    nombre: str,
+    df_nuevo: pd.DataFrame,
+    X_holdout,
+    y_holdout,
+    target: str = "target",
+    iteraciones_nuevas: int = 50,
+    df_historico: pd.DataFrame = None,
+    tolerancia_auc: float = 0.005
+) -> dict:
+    """
+    Ejecuta el refresco mensual incremental de un modelo registrado.
+
+    Args:
+        nombre (str): Nombre del modelo en el registro.
+        df_nuevo (pd.DataFrame): Préstamos nuevos finalizados con la columna objetivo.
+        X_holdout, y_holdout: Conjunto de validación fijo para comparar versiones
+            (sin transformar: el preprocesado registrado se aplica aquí).
+        target (str): Nombre de la variable objetivo.
+        iteraciones_nuevas (int): Árboles a añadir (solo HGB).
+        df_historico (pd.DataFrame, opcional): Si se pasa, se compara contra un
+            reentrenamiento completo sobre histórico + nuevos; si no, contra el
+            AUC de holdout guardado en los metadatos de la versión actual.
+        Los modelos lineales necesitan 'n_filas_entrenamiento' en los metadatos
+        de la versión actual (filas con las que se entrenó).
+        tolerancia_auc (float): Pérdida máxima de AUC admitida.
+
+    Returns:
+        dict: Resultado de la evaluación y versión registrada.
+    """
+    # mmap_mode=None: el modelo se va a ampliar, necesita arrays escribibles
+    actual = cargar_modelo(nombre, mmap_mode=None, registrar_metricas=False)
+    modelo, scaler, pipeline = actual["modelo"], actual.get("scaler"), actual.get("pipeline")
+
+    # Pipeline completo: los pasos previos solo se aplican con transform
+    # y se amplía el estimador final; el Pipeline evalúa sobre datos crudos
+    es_pipeline = isinstance(modelo, Pipeline)
+    preprocesado = modelo[:-1] if es_pipeline else pipeline
+    estimador = modelo[-1] if es_pipeline else modelo
+
+    def _preparar(df):
+        X = df.drop(columns=target)
+        return preprocesado.transform(X) if preprocesado is not None else X
+
+    X_nuevo, y_nuevo = _preparar(df_nuevo), df_nuevo[target]
+    # Filas acumuladas de entrenamiento (metadatos 'n_filas_entrenamiento' de la versión)
+    n_entrenamiento = actual["metadata"].get("n_filas_entrenamiento")
+
+    inicio = time.perf_counter()
+    incremental = _reentrenar_estimador(estimador, X_nuevo, y_nuevo, iteraciones_nuevas,
+                                        scaler, n_entrenamiento)
+    tiempo_incremental = time.perf_counter() - inicio
+
+    if es_pipeline:
+        incremental = Pipeline(modelo.steps[:-1] + [(modelo.steps[-1][0], incremental)])
+        X_hold, scaler_eval = X_holdout, None
+    else:
+        X_hold = pipeline.transform(X_holdout) if pipeline is not None else X_holdout
+        scaler_eval = None if isinstance(estimador, HistGradientBoostingClassifier) else scaler
+
+    if df_historico is not None:
+        df_completo = pd.concat([df_historico, df_nuevo], ignore_index=True)
+        estimador_completo = clone(modelo)
+        clave_warm_start = f"{modelo.steps[-1][0]}__warm_start" if es_pipeline else "warm_start"
+        if clave_warm_start in estimador_completo.get_params():
+            estimador_completo.set_params(**{clave_warm_start: False})
+        comparacion = dict(
+            estimador_completo=estimador_completo,
+            # El Pipeline completo se reajusta entero sobre los datos crudos
+            X_completo=df_completo.drop(columns=target) if es_pipeline else _preparar(df_completo),
+            y_completo=df_completo[target],
+        )
+    else:
+        comparacion = dict(auc_referencia=actual["metadata"].get("metricas", {}).get("auc_holdout"))
+
+    evaluacion = evaluar_promocion(
+        incremental, X_hold, y_holdout, tolerancia_auc=tolerancia_auc, scaler=scaler_eval, **comparacion
+    )
+
+    version = registrar_modelo(
+        nombre, incremental, scaler=scaler, pipeline=pipeline,
+        metadatos={
+            "tipo_entrenamiento": "incremental",
+            "version_base": actual["version"],
+            "n_filas_nuevas": int(len(y_nuevo)),
+            "n_filas_entrenamiento": None if n_entrenamiento is None else int(n_entrenamiento + len(y_nuevo)),
+            "tiempo_entrenamiento_s": round(tiempo_incremental, 3),
+            "metricas": {"auc_holdout": evaluacion["auc_incremental"]},
+            "auc_referencia": evaluacion["auc_referencia"],
+        },
+        promover=evaluacion["promover"],
+    )
+    return {**evaluacion, "version": version, "tiempo_incremental_s": tiempo_incremental}
@@ -0,0 +1,241 @@
+# =============================================================
+# 📦 src/registro_modelos.py — Registro versionado de modelos
+# -------------------------------------------------------------
+# Estructura en outputs/models/:
+#
+#   <nombre>/
+#   ├── ACTUAL                  → versión promovida (texto)
+#   └── v0001/
+#       ├── modelo.joblib       → estimador (joblib sin comprimir)
+#       ├── scaler.joblib       → (opcional)
+#       ├── pipeline.joblib     → (opcional) pipeline de variables
+#       ├── metadata.json       → entrenamiento, variables, métricas
+#       └── metricas_carga.jsonl → una línea por carga (tiempo, RSS)
+#
+# Los .joblib se guardan sin compresión para poder cargarlos con
+# mmap_mode='r': los arrays grandes se mapean desde disco y varios
+# procesos de scoring en la misma máquina comparten las páginas.
+# =============================================================
+
+import json
+import os
+import time
+from datetime import datetime
+
+import joblib
+import pandas as pd
+
+from perfilado import rss_mb
+from utils import get_file_path
+
+COMPONENTES = ("modelo", "scaler", "pipeline", "calibracion")
+
+
+def _carpeta_modelo(nombre: str):
+    return get_file_path("models", nombre)
+
+
+def _formato_version(numero: int) -> str:
+    return f"v{numero:04d}"
+
+
+# =============================================================
+# 📋 Función: listar_versiones
+# =============================================================
+def listar_versiones(nombre: str) -> pd.DataFrame:
+    """
+    Lista las versiones registradas de un modelo con sus metadatos principales.
+
+    Args:
+        nombre (str): Nombre del modelo en el registro.
+
+    Returns:
+        pd.DataFrame: Una fila por versión (version, fecha, componentes, actual, métricas).
+    """
+    carpeta = _carpeta_modelo(nombre)
+    actual = version_actual(nombre)
+    filas = []
+    for ruta_version in sorted(carpeta.glob("v[0-9]*")):
+        metadata = json.loads((ruta_version / "metadata.json").read_text())
+        filas.append({
+            "version": ruta_version.name,
+            "fecha": metadata.get("fecha"),
+            "componentes": ", ".join(metadata.get("componentes", [])),
+            "actual": ruta_version.name == actual,
+            **{f"metrica_{k}": v for k, v in metadata.get("metricas", {}).items()},
+        })
+    return pd.DataFrame(filas)
+
+
+def version_actual(nombre: str):
+    """
+    Devuelve la versión promovida de un modelo (o None si no hay ninguna).
+    """
+    ruta = _carpeta_modelo(nombre) / "ACTUAL"
+    return ruta.read_text().strip() if ruta.exists() else None
+
+
+def promover_version(nombre: str, version: str):
+    """
+    Marca una versión como la que deben cargar los procesos de scoring.
+    """
+    carpeta = _carpeta_modelo(nombre)
+    if not (carpeta / version).is_dir():
+        raise ValueError(f"❌ La versión '{version}' no existe para el modelo '{nombre}'.")
+    # Escritura atómica: los procesos que leen ACTUAL nunca ven un archivo a medias
+    temporal = carpeta / "ACTUAL.tmp"
+    temporal.write_text(version)
+    os.replace(temporal, carpeta / "ACTUAL")
+    print(f"✅ Modelo '{nombre}' promovido a {version}")
+
+
+# =============================================================
+# 💾 Función: registrar_modelo
+# -------------------------------------------------------------
+# ➤ Crea una nueva versión con modelo, scaler, pipeline y calibración opcionales
+# ➤ Guarda metadatos de entrenamiento en metadata.json
+# ➤ Por defecto la nueva versión pasa a ser la ACTUAL
+# =============================================================
+def registrar_modelo(
+    nombre: str,
+    modelo,
+    scaler=None,
+    pipeline=None,
+    calibracion: dict = None,
+    metadatos: dict = None,
+    promover: bool = True
+) -> str:
+    """
+    Registra una nueva versión de un modelo y sus artefactos asociados.
+
+    Args:
+        nombre (str): Nombre del modelo (p. ej. 'hist_gradient_boosting').
+        modelo: Estimador entrenado.
+        scaler (opcional): Escalador usado en entrenamiento.
+        pipeline (opcional): Pipeline de variables (preprocesado).
+        calibracion (dict, opcional): Tabla de calibración de la PD
+            (calibracion.ajustar_calibracion).
+        metadatos (dict, opcional): Información de entrenamiento (variables,
+            métricas, parámetros, datos usados...). Las métricas se leen de
+            la clave 'metricas'.
+        promover (bool): Si True, la nueva versión pasa a ser la ACTUAL.
+
+    Returns:
+        str: Versión creada (p. ej. 'v0003').
+    """
+    carpeta = _carpeta_modelo(nombre)
+    carpeta.mkdir(parents=True, exist_ok=True)
+
+    existentes = [int(p.name[1:]) for p in carpeta.glob("v[0-9]*") if p.name[1:].isdigit()]
+    version = _formato_version(max(existentes, default=0) + 1)
+    ruta_version = carpeta / version
+    ruta_version.mkdir()
+
+    artefactos = {"modelo": modelo, "scaler": scaler, "pipeline": pipeline, "calibracion": calibracion}
+    componentes = []
+    for componente, objeto in artefactos.items():
+        if objeto is not None:
+            # Sin compresión: requisito para poder usar mmap_mode al cargar
+            joblib.dump(objeto, ruta_version / f"{componente}.joblib")
+            componentes.append(componente)
+
+    metadata = {
+        "nombre": nombre,
+        "version": version,
+        "fecha": datetime.now().isoformat(timespec="seconds"),
+        "componentes": componentes,
+        "clase_modelo": type(modelo).__name__,
+        "variables": list(getattr(modelo, "feature_names_in_", [])),
+        **(metadatos or {}),
+    }
+    (ruta_version / "metadata.json").write_text(json.dumps(metadata, indent=2, default=str))
+    print(f"✅ Modelo '{nombre}' registrado como {version} en: {ruta_version}")
+
+    if promover:
+        promover_version(nombre, version)
+    return version
+
+
+def importar_artefacto(nombre: str, ruta_pkl, metadatos: dict = None, promover: bool = True) -> str:
+    """
+    Registra un modelo ya serializado con joblib.dump (p. ej. los .pkl de
+    notebooks/ u outputs/models/) como nueva versión del registro.
+    """
+    metadatos = {"origen": str(ruta_pkl), **(metadatos or {})}
+    return registrar_modelo(nombre, joblib.load(ruta_pkl), metadatos=metadatos, promover=promover)
+
+
+# =============================================================
+# 📥 Función: cargar_modelo
+# -------------------------------------------------------------
+# ➤ Carga la versión indicada (o la ACTUAL) con mmap_mode='r'
+# ➤ Registra tiempo de carga y memoria residente añadida en
+#   metricas_carga.jsonl de esa versión
+# =============================================================
+def cargar_modelo(
+    nombre: str,
+    version: str = None,
+    componentes: tuple = COMPONENTES,
+    mmap_mode: str = "r",
+    registrar_metricas: bool = True
+) -> dict:
+    """
+    Carga los artefactos de una versión del registro.
+
+    Args:
+        nombre (str): Nombre del modelo.
+        version (str, opcional): Versión a cargar; por defecto la ACTUAL.
+        componentes (tuple): Artefactos a cargar ('modelo', 'scaler', 'pipeline', 'calibracion').
+            Los que no existan en la versión se ignoran.
+        mmap_mode (str | None): Modo de mapeo de joblib ('r' comparte páginas
+            entre procesos; None carga una copia completa en memoria).
+        registrar_metricas (bool): Si True, anota tiempo y RSS de la carga.
+
+    Returns:
+        dict: {'version', 'metadata', <componente>: objeto, ...}
+    """
+    version = version or version_actual(nombre)
+    if version is None:
+        raise FileNotFoundError(f"❌ No hay ninguna versión promovida del modelo '{nombre}'.")
+    ruta_version = _carpeta_modelo(nombre) / version
+
+    rss_inicial = rss_mb()
+    inicio = time.perf_counter()
+
+    resultado = {
+        "version": version,
+        "metadata": json.loads((ruta_version / "metadata.json").read_text()),
+    }
+    for componente in componentes:
+        ruta = ruta_version / f"{componente}.joblib"
+        if ruta.exists():
+            resultado[componente] = joblib.load(ruta, mmap_mode=mmap_mode)
+
+    tiempo = time.perf_counter() - inicio
+    incremento_rss = rss_mb() - rss_inicial
+
+    if registrar_metricas:
+        registro = {
+            "fecha": datetime.now().isoformat(timespec="seconds"),
+            "pid": os.getpid(),
+            "mmap_mode": mmap_mode,
+            "componentes": [c for c in componentes if c in resultado],
+            "tiempo_carga_s": round(tiempo, 4),
+            "incremento_rss_mb": round(incremento_rss, 2),
+        }
+        with open(ruta_version / "metricas_carga.jsonl", "a") as f:
+            f.write(json.dumps(registro) + "\n")
+
+    print(f"📦 Modelo '{nombre}' {version} cargado en {tiempo:.3f} s (+{incremento_rss:.1f} MB RSS)")
+    return resultado
+
+
+def metricas_carga(nombre: str, version: str = None) -> pd.DataFrame:
+    """
+    Devuelve el historial de cargas (tiempo y RSS) de una versión del modelo.
+    """
+    version = version or version_actual(nombre)
+    ruta = _carpeta_modelo(nombre) / version / "metricas_carga.jsonl"
+    if not ruta.exists():
+        return pd.DataFrame()
+    return pd.read_json(ruta, lines=True)
@@ -0,0 +1,377 @@
+# =============================================================
+# 📦 src/scorecard.py — Scorecard clásico (WOE + regresión logística)
+# -------------------------------------------------------------
+# Alternativa ligera a los modelos de árboles del notebook 05:
+#   • tramificación monótona óptima de cada variable (tramos finos
+#     por cuantiles + pool-adjacent-violators + tamaño mínimo)
+#   • codificación Weight of Evidence (WOE) e Information Value (IV)
+#   • regresión logística sobre los WOE convertida a puntos enteros
+#     (puntos_base a odds_base, +pdo puntos = odds x2)
+#
+# El scoring es solo np.searchsorted sobre los cortes de cada variable
+# y una suma de enteros: la tarjeta cabe en un JSON de pocos KB que se
+# puede embeber en sistemas externos (guardar_scorecard()).
+# Usar las variables sin escalar (importe real, ingresos reales...).
+# =============================================================
+
+import json
+import time
+
+import numpy as np
+import pandas as pd
+from sklearn.linear_model import LogisticRegression
+from sklearn.metrics import roc_auc_score
+
+from utils import get_file_path, load_config
+
+VARIABLES_SCORECARD = ["ingresos", "principal", "dti", "antiguedad_empleo", "rating_ord"]
+PARAMETROS_POR_DEFECTO = {"puntos_base": 600, "odds_base": 50, "pdo": 20}
+
+
+def parametros_scorecard() -> dict:
+    """
+    Devuelve la escala de puntos de config.yaml (con valores por defecto).
+    """
+    return {**PARAMETROS_POR_DEFECTO, **(load_config().get("scorecard") or {})}
+
+
+# -------------------------------------------------------------
+# 📉 Pool-adjacent-violators
+# -------------------------------------------------------------
+# Fusiona tramos adyacentes hasta que la tasa de impago sea monótona
+# (creciente o decreciente). Devuelve, para cada tramo fino, el
+# índice del tramo fusionado al que pertenece.
+# -------------------------------------------------------------
+def _pava(malos: np.ndarray, totales: np.ndarray, creciente: bool) -> np.ndarray:
+    signo = 1 if creciente else -1
+    bloques = []  # [malos, total, primer tramo]
+    for i, (m, t) in enumerate(zip(malos, totales)):
+        bloques.append([m, t, i])
+        while len(bloques) > 1 and signo * (bloques[-2][0] / bloques[-2][1] - bloques[-1][0] / bloques[-1][1]) > 0:
+            m_ult, t_ult, _ = bloques.pop()
+            bloques[-1][0] += m_ult
+            bloques[-1][1] += t_ult
+    inicios = [b[2] for b in bloques]
+    return np.searchsorted(inicios, np.arange(len(malos)), side="right") - 1
+
+
+def _fusionar_pequenos(malos, totales, grupo, minimo):
+    # Fusiona el tramo más pequeño por debajo del mínimo con el vecino de
+    # tasa más parecida (conserva la monotonía)
+    while True:
+        m = np.bincount(grupo, weights=malos)
+        t = np.bincount(grupo, weights=totales)
+        if len(t) <= 1 or t.min() >= minimo:
+            return grupo
+        j = int(np.argmin(t))
+        tasa = m / t
+        if j == 0:
+            destino = 1
+        elif j == len(t) - 1:
+            destino = j - 1
+        else:
+            destino = j - 1 if abs(tasa[j] - tasa[j - 1]) <= abs(tasa[j] - tasa[j + 1]) else j + 1
+        grupo = np.where(grupo == j, destino, grupo)
+        grupo = np.unique(grupo, return_inverse=True)[1]
+
+
+def _woe(malos, totales, malos_total, buenos_total, suavizado=0.5):
+    buenos = totales - malos
+    dist_buenos = (buenos + suavizado) / (buenos_total + suavizado)
+    dist_malos = (malos + suavizado) / (malos_total + suavizado)
+    woe = np.log(dist_buenos / dist_malos)
+    return woe, (dist_buenos - dist_malos) * woe
+
+
+# =============================================================
+# 🧮 Función: tramificar_variable
+# -------------------------------------------------------------
+# ➤ Tramos finos por cuantiles → monotonía (PAVA) en el sentido de
+#   mayor IV → fusión de tramos con menos de min_proporcion filas
+# ➤ Los nulos forman su propio tramo (WOE 0 si no hay en train)
+# =============================================================
+def tramificar_variable(x, y, n_tramos_inicial: int = 20, min_proporcion: float = 0.05) -> dict:
+    """
+    Tramificación monótona óptima de una variable numérica.
+
+    Args:
+        x (array-like): Valores de la variable (sin escalar).
+        y (array-like): Objetivo binario (1 = impago).
+        n_tramos_inicial (int): Tramos finos por cuantiles antes de fusionar.
+        min_proporcion (float): Proporción mínima de filas por tramo.
+
+    Returns:
+        dict: cortes (límites interiores; tramo i = [corte_{i-1}, corte_i)),
+        woe por tramo, woe_nulo, iv, sentido ('creciente'/'decreciente')
+        y tabla resumen.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    nulos = np.isnan(x)
+    xv, yv = x[~nulos], y[~nulos]
+    malos_total, buenos_total = y.sum(), len(y) - y.sum()
+
+    # Cortes = valores observados (method='lower'): ningún tramo fino queda vacío
+    cortes_finos = np.unique(np.quantile(xv, np.linspace(0, 1, n_tramos_inicial + 1)[1:-1], method="lower"))
+    cortes_finos = cortes_finos[cortes_finos > xv.min()]
+    fino = np.searchsorted(cortes_finos, xv, side="right")
+    malos = np.bincount(fino, weights=yv, minlength=len(cortes_finos) + 1)
+    totales = np.bincount(fino, minlength=len(cortes_finos) + 1).astype(np.float64)
+
+    # Sentido de la monotonía: el que conserva más IV
+    mejor = None
+    for creciente in (True, False):
+        grupo = _fusionar_pequenos(malos, totales, _pava(malos, totales, creciente), min_proporcion * len(y))
+        m = np.bincount(grupo, weights=malos)
+        t = np.bincount(grupo, weights=totales)
+        woe, iv_tramo = _woe(m, t, malos_total, buenos_total)
+        if mejor is None or iv_tramo.sum() > mejor["iv"]:
+            # Corte entre tramos fusionados: el límite fino donde cambia el grupo
+            cambios = np.flatnonzero(np.diff(grupo)) + 1
+            mejor = {"grupo": grupo, "malos": m, "totales": t, "woe": woe, "iv_tramo": iv_tramo,
+                     "iv": iv_tramo.sum(), "cortes": cortes_finos[cambios - 1],
+                     "sentido": "creciente" if creciente else "decreciente"}
+
+    woe_nulo, iv_nulo = 0.0, 0.0
+    if nulos.any():
+        woe_n, iv_n = _woe(np.array([y[nulos].sum()]), np.array([float(nulos.sum())]), malos_total, buenos_total)
+        woe_nulo, iv_nulo = float(woe_n[0]), float(iv_n[0])
+
+    limites = np.r_[-np.inf, mejor["cortes"], np.inf]
+    tabla = pd.DataFrame({
+        "desde": limites[:-1],
+        "hasta": limites[1:],
+        "n": mejor["totales"].astype(np.int64),
+        "tasa_impago": mejor["malos"] / mejor["totales"],
+        "woe": mejor["woe"],
+        "iv": mejor["iv_tramo"],
+    })
+    if nulos.any():
+        tabla.loc[len(tabla)] = [np.nan, np.nan, int(nulos.sum()), y[nulos].mean(), woe_nulo, iv_nulo]
+
+    return {
+        "cortes": mejor["cortes"],
+        "woe": mejor["woe"],
+        "woe_nulo": woe_nulo,
+        "iv": float(mejor["iv"] + iv_nulo),
+        "sentido": mejor["sentido"],
+        "tabla": tabla,
+    }
+
+
+def _indices_tramo(cortes: np.ndarray, x) -> np.ndarray:
+    # Tramo de cada valor; los nulos van al último hueco de la tabla
+    x = np.asarray(x, dtype=np.float64)
+    return np.where(np.isnan(x), len(cortes) + 1, np.searchsorted(cortes, x, side="right"))
+
+
+# =============================================================
+# 🏗️ Función: ajustar_scorecard
+# -------------------------------------------------------------
+# ➤ Tramifica, codifica en WOE y ajusta la regresión logística
+# ➤ Convierte coeficientes a puntos enteros por tramo:
+#     factor = pdo / ln 2 ; offset = puntos_base − factor · ln(odds_base)
+#     puntos = −(β·WOE + α/n) · factor + offset/n   (redondeado)
+# =============================================================
+def ajustar_scorecard(
+    X: pd.DataFrame,
+    y,
+    variables: list = None,
+    n_tramos_inicial: int = 20,
+    min_proporcion: float = 0.05,
+    C: float = 1.0,
+    **parametros
+) -> dict:
+    """
+    Ajusta un scorecard de puntos enteros.
+
+    Args:
+        X (pd.DataFrame): Variables sin escalar (al menos las de `variables`).
+        y (array-like): Objetivo binario (1 = impago).
+        variables (list, opcional): Variables del scorecard (por defecto VARIABLES_SCORECARD).
+        n_tramos_inicial (int): Tramos finos antes de fusionar.
+        min_proporcion (float): Proporción mínima de filas por tramo.
+        C (float): Inversa de la regularización de la regresión logística.
+        **parametros: puntos_base, odds_base o pdo para sobrescribir config.yaml.
+
+    Returns:
+        dict: Scorecard con cortes y puntos (int32) por variable, escala y tabla.
+    """
+    variables = list(variables or VARIABLES_SCORECARD)
+    faltan = [v for v in variables if v not in X.columns]
+    if faltan:
+        raise ValueError(f"❌ Faltan variables del scorecard: {faltan}")
+    escala = {**parametros_scorecard(), **parametros}
+    y = np.asarray(y)
+
+    tramos = {v: tramificar_variable(X[v], y, n_tramos_inicial, min_proporcion) for v in variables}
+    woe = np.column_stack([
+        np.r_[t["woe"], t["woe_nulo"]][_indices_tramo(t["cortes"], X[v])] for v, t in tramos.items()
+    ])
+
+    lr = LogisticRegression(C=C, max_iter=1000).fit(woe, y)
+    beta, alfa = lr.coef_.ravel(), float(lr.intercept_[0])
+
+    factor = escala["pdo"] / np.log(2)
+    offset = escala["puntos_base"] - factor * np.log(escala["odds_base"])
+    n = len(variables)
+
+    puntos, tablas = {}, []
+    for j, (v, t) in enumerate(tramos.items()):
+        woe_v = np.r_[t["woe"], t["woe_nulo"]]
+        puntos[v] = np.round(-(beta[j] * woe_v + alfa / n) * factor + offset / n).astype(np.int32)
+        tabla = t["tabla"].assign(variable=v, puntos=puntos[v][:len(t["tabla"])])
+        tablas.append(tabla)
+
+    tabla = pd.concat(tablas, ignore_index=True)[
+        ["variable", "desde", "hasta", "n", "tasa_impago", "woe", "iv", "puntos"]
+    ]
+    iv = pd.Series({v: t["iv"] for v, t in tramos.items()}, name="iv").sort_values(ascending=False)
+    print("✅ Scorecard ajustado. Information Value por variable:")
+    print(iv.round(4).to_string())
+
+    return {
+        "variables": variables,
+        "cortes": {v: t["cortes"] for v, t in tramos.items()},
+        "puntos": puntos,
+        "escala": {**escala, "factor": factor, "offset": offset},
+        "coeficientes": dict(zip(variables, beta)),
+        "intercepto": alfa,
+        "iv": iv.to_dict(),
+        "tabla": tabla,
+    }
+
+
+# =============================================================
+# ⚡ Función: puntuar_scorecard
+# -------------------------------------------------------------
+# ➤ searchsorted por variable + suma de enteros
+# ➤ Puntos altos = menor riesgo
+# =============================================================
+def puntuar_scorecard(scorecard: dict, X) -> np.ndarray:
+    """
+    Puntúa con el scorecard (solo búsquedas en tablas y sumas enteras).
+
+    Args:
+        scorecard (dict): Salida de ajustar_scorecard() o cargar_scorecard().
+        X (pd.DataFrame | dict): Columnas con las variables del scorecard.
+
+    Returns:
+        np.ndarray: Puntuación total (int32) por fila.
+    """
+    total = None
+    for v in scorecard["variables"]:
+        puntos = scorecard["puntos"][v][_indices_tramo(scorecard["cortes"][v], X[v])]
+        total = puntos if total is None else total + puntos
+    return total
+
+
+def pd_desde_puntos(scorecard: dict, puntos) -> np.ndarray:
+    """
+    PD implícita en una puntuación: odds(buenos:malos) = exp((puntos − offset) / factor).
+    """
+    escala = scorecard["escala"]
+    return 1.0 / (1.0 + np.exp((np.asarray(puntos, dtype=np.float64) - escala["offset"]) / escala["factor"]))
+
+
+# =============================================================
+# ⚖️ Función: comparar_con_hgb
+# -------------------------------------------------------------
+# ➤ Misma división (índices train/test) para scorecard y HGB
+# ➤ AUC en test, velocidad de scoring y tamaño del artefacto
+# =============================================================
+def comparar_con_hgb(
+    X: pd.DataFrame,
+    y,
+    indices: dict,
+    modelo_hgb=None,
+    columnas_hgb: list = None,
+    variables: list = None,
+    **kwargs
+) -> tuple:
+    """
+    Ajusta el scorecard en train y compara su AUC en test con HistGradientBoosting.
+
+    Args:
+        X (pd.DataFrame): Variables (las del scorecard sin escalar y las del HGB).
+        y (array-like): Objetivo binario.
+        indices (dict): Salida de modeling.indices_division_escalonada().
+        modelo_hgb (opcional): HGB ya entrenado en indices['train']; si no se
+            indica se entrena uno con `columnas_hgb`.
+        columnas_hgb (list, opcional): Variables del HGB (por defecto, todas).
+        variables (list, opcional): Variables del scorecard.
+        **kwargs: Parámetros adicionales de ajustar_scorecard().
+
+    Returns:
+        tuple: (scorecard, pd.DataFrame comparativo por modelo)
+    """
+    import io
+
+    import joblib
+    from sklearn.ensemble import HistGradientBoostingClassifier
+
+    y = np.asarray(y)
+    train, test = indices["train"], indices["test"]
+    X_train, X_test = X.iloc[train], X.iloc[test]
+
+    scorecard = ajustar_scorecard(X_train, y[train], variables, **kwargs)
+    inicio = time.perf_counter()
+    puntos = puntuar_scorecard(scorecard, X_test)
+    tiempo_sc = time.perf_counter() - inicio
+
+    columnas_hgb = list(getattr(modelo_hgb, "feature_names_in_", columnas_hgb or X.columns))
+    if modelo_hgb is None:
+        modelo_hgb = HistGradientBoostingClassifier(random_state=42).fit(X_train[columnas_hgb], y[train])
+    inicio = time.perf_counter()
+    pd_hgb = modelo_hgb.predict_proba(X_test[columnas_hgb])[:, 1]
+    tiempo_hgb = time.perf_counter() - inicio
+
+    buffer = io.BytesIO()
+    joblib.dump(modelo_hgb, buffer)
+    comparacion = pd.DataFrame({
+        "modelo": ["scorecard", "hist_gradient_boosting"],
+        "n_variables": [len(scorecard["variables"]), len(columnas_hgb)],
+        # Más puntos = menos riesgo: el AUC se calcula sobre −puntos
+        "auc_test": [roc_auc_score(y[test], -puntos), roc_auc_score(y[test], pd_hgb)],
+        "filas_por_s": [len(test) / tiempo_sc, len(test) / tiempo_hgb],
+        "tamano_kb": [len(_a_json(scorecard)) / 1024, buffer.getbuffer().nbytes / 1024],
+    })
+    print("\n⚖️ Scorecard frente a HGB (mismo test):")
+    print(comparacion.round(4).to_string(index=False))
+    return scorecard, comparacion
+
+
+# =============================================================
+# 💾 Persistencia (JSON portable en outputs/models/)
+# =============================================================
+def _a_json(scorecard: dict) -> str:
+    return json.dumps({
+        "variables": scorecard["variables"],
+        "cortes": {v: c.tolist() for v, c in scorecard["cortes"].items()},
+        "puntos": {v: p.tolist() for v, p in scorecard["puntos"].items()},
+        "escala": scorecard["escala"],
+    })
+
+
+def guardar_scorecard(scorecard: dict, filename: str = "scorecard.json"):
+    """
+    Guarda cortes, puntos y escala en JSON (el último punto de cada
+    variable corresponde a los nulos).
+    """
+    ruta = get_file_path("models", filename)
+    ruta.parent.mkdir(parents=True, exist_ok=True)
+    ruta.write_text(_a_json(scorecard))
+    print(f"✅ Scorecard guardado en: {ruta} ({ruta.stat().st_size / 1024:.1f} KB)")
+
+
+def cargar_scorecard(filename: str = "scorecard.json") -> dict:
+    """
+    Carga un scorecard guardado con guardar_scorecard().
+    """
+    ruta = get_file_path("models", filename)
+    if not ruta.exists():
+        raise FileNotFoundError(f"❌ No existe el scorecard: {ruta}")
+    datos = json.loads(ruta.read_text())
+    datos["cortes"] = {v: np.asarray(c, dtype=np.float64) for v, c in datos["cortes"].items()}
+    datos["puntos"] = {v: np.asarray(p, dtype=np.int32) for v, p in datos["puntos"].items()}
+    return datos
@@ -0,0 +1,242 @@
+# =============================================================
+# 📦 src/simulacion_cartera.py — Simulación Monte Carlo de pérdidas
+# -------------------------------------------------------------
+# Distribución de pérdidas de la cartera (VaR / ES) a partir de las
+# PD del modelo, exposiciones y LGD:
+#   • Modelo de un factor (Vasicek): cada escenario sortea un factor
+#     sistémico Z y los impagos son Bernoulli con PD condicionada.
+#   • Escenarios en bloques repartidos en un pool de procesos, con
+#     semillas independientes derivadas de una SeedSequence.
+#   • Los cuantiles se estiman en streaming con un histograma fijo
+#     de pérdidas: nunca se guardan todos los escenarios.
+#   • Para carteras de millones de préstamos, `n_grupos_pd` agrupa
+#     por tramos de PD y sortea el número de impagos de cada tramo
+#     con una binomial (coste escenarios x tramos, no x préstamos).
+# =============================================================
+
+from concurrent.futures import ProcessPoolExecutor
+import os
+
+import numpy as np
+import pandas as pd
+from scipy.special import ndtr, ndtri
+
+
+# -------------------------------------------------------------
+# 🎲 Bloque de escenarios (se ejecuta en cada proceso)
+# -------------------------------------------------------------
+# Los préstamos se recorren también por bloques para acotar la
+# matriz de sorteos (escenarios x préstamos) a `max_celdas`.
+# -------------------------------------------------------------
+def _simular_bloque(args):
+    (semilla, n_escenarios, umbral_pd, perdida_si_impago, n_por_grupo, rho,
+     bordes, max_celdas) = args
+
+    rng = np.random.default_rng(semilla)
+    n_prestamos = len(umbral_pd)
+
+    z = rng.standard_normal(n_escenarios).astype(np.float32)
+    perdidas = np.zeros(n_escenarios)
+
+    # PD condicionada: Φ((Φ⁻¹(PD) − √ρ·Z) / √(1−ρ))
+    escala = np.float32(1 / np.sqrt(1 - rho))
+    factor = (np.float32(np.sqrt(rho)) * z * escala)[:, None]
+
+    tamano = max(1, max_celdas // max(n_escenarios, 1))
+    for inicio in range(0, n_prestamos, tamano):
+        fin = min(inicio + tamano, n_prestamos)
+        pd_condicionada = ndtr(umbral_pd[inicio:fin] * escala - factor)
+        if n_por_grupo is None:
+            impagos = rng.random(pd_condicionada.shape, dtype=np.float32) < pd_condicionada
+        else:
+            # Tramos de PD: impagos ~ Binomial(n_tramo, PD condicionada)
+            impagos = rng.binomial(n_por_grupo[inicio:fin], pd_condicionada)
+        perdidas += impagos @ perdida_si_impago[inicio:fin]
+
+    histograma, _ = np.histogram(perdidas, bins=bordes)
+    return histograma, perdidas.sum(), (perdidas ** 2).sum(), perdidas.max()
+
+
+# =============================================================
+# 📉 Función: simular_perdidas_cartera
+# -------------------------------------------------------------
+# ➤ 100k escenarios sobre toda la cartera en paralelo
+# ➤ Devuelve VaR y ES a los niveles pedidos y la pérdida esperada
+# ➤ Reproducible: mismo resultado con la misma semilla y bloques
+# =============================================================
+def simular_perdidas_cartera(
+    pd_prestamos,
+    exposicion,
+    lgd=0.45,
+    rho: float = 0.12,
+    n_escenarios: int = 100_000,
+    niveles: tuple = (0.95, 0.99, 0.999),
+    escenarios_por_bloque: int = 2_000,
+    n_procesos: int = None,
+    n_bins: int = 20_000,
+    n_grupos_pd: int = None,
+    max_celdas: int = 20_000_000,
+    semilla: int = 42,
+    calibracion: dict = None
+) -> dict:
+    """
+    Simula la distribución de pérdidas de la cartera con un modelo de un factor.
+
+    Args:
+        pd_prestamos (array-like): PD de cada préstamo (salida de predict_proba).
+        exposicion (array-like): Exposición en caso de impago (EAD) por préstamo.
+        lgd (float | array-like): Pérdida en caso de impago (escalar o por préstamo).
+        rho (float): Correlación de activos con el factor sistémico (0 = independientes).
+        n_escenarios (int): Número total de escenarios.
+        niveles (tuple): Niveles de confianza para VaR y ES.
+        escenarios_por_bloque (int): Escenarios por tarea del pool.
+        n_procesos (int, opcional): Procesos del pool (por defecto, todos los núcleos).
+        n_bins (int): Resolución del histograma de pérdidas (precisión de cuantiles).
+        n_grupos_pd (int, opcional): Si se indica, agrupa los préstamos en ese número
+            de tramos de PD (cuantiles) y usa la pérdida media por impago del tramo.
+            Aproximación válida para carteras granulares; None = préstamo a préstamo.
+        max_celdas (int): Máximo de sorteos (escenarios x préstamos) en memoria por bloque.
+        semilla (int): Semilla base.
+        calibracion (dict, opcional): Tabla de calibración; si se indica, las PD
+            brutas se calibran (np.interp) antes de simular.
+
+    Returns:
+        dict: perdida_esperada, desviacion, VaR_<nivel>, ES_<nivel>, n_escenarios
+              y el histograma ('bordes', 'frecuencias').
+    """
+    if calibracion is not None:
+        from calibracion import aplicar_calibracion
+
+        pd_prestamos = aplicar_calibracion(calibracion, pd_prestamos)
+    pd_prestamos = np.clip(np.asarray(pd_prestamos, dtype=np.float64), 1e-8, 1 - 1e-8)
+    perdida_si_impago = (np.asarray(exposicion, dtype=np.float64)
+                         * np.broadcast_to(np.asarray(lgd, dtype=np.float64), pd_prestamos.shape)).astype(np.float32)
+    n_prestamos = len(pd_prestamos)
+    perdida_maxima = float(perdida_si_impago.sum(dtype=np.float64))
+
+    n_por_grupo = None
+    if n_grupos_pd:
+        pd_prestamos, perdida_si_impago, n_por_grupo = agrupar_por_tramos_pd(
+            pd_prestamos, perdida_si_impago, n_grupos_pd
+        )
+    umbral_pd = ndtri(pd_prestamos).astype(np.float32)
+
+    # Histograma fijo entre 0 y la pérdida máxima posible
+    bordes = np.linspace(0, perdida_maxima * (1 + 1e-9), n_bins + 1)
+
+    tamanos = [escenarios_por_bloque] * (n_escenarios // escenarios_por_bloque)
+    if n_escenarios % escenarios_por_bloque:
+        tamanos.append(n_escenarios % escenarios_por_bloque)
+    semillas = np.random.SeedSequence(semilla).spawn(len(tamanos))
+    tareas = [(s, t, umbral_pd, perdida_si_impago, n_por_grupo, rho, bordes, max_celdas)
+              for s, t in zip(semillas, tamanos)]
+
+    n_procesos = n_procesos or os.cpu_count()
+    frecuencias = np.zeros(n_bins, dtype=np.int64)
+    suma = suma_cuadrados = 0.0
+    maximo = 0.0
+
+    print(f"🎲 Simulando {n_escenarios:,} escenarios sobre {n_prestamos:,} préstamos "
+          f"({len(tareas)} bloques, {n_procesos} procesos)...")
+    with ProcessPoolExecutor(max_workers=n_procesos) as pool:
+        for histograma, s, s2, m in pool.map(_simular_bloque, tareas):
+            frecuencias += histograma
+            suma += s
+            suma_cuadrados += s2
+            maximo = max(maximo, m)
+
+    media = suma / n_escenarios
+    resultado = {
+        "n_escenarios": n_escenarios,
+        "perdida_esperada": media,
+        "desviacion": np.sqrt(max(suma_cuadrados / n_escenarios - media ** 2, 0.0)),
+        "perdida_maxima_simulada": maximo,
+        "bordes": bordes,
+        "frecuencias": frecuencias,
+    }
+    resultado.update(cuantiles_desde_histograma(bordes, frecuencias, niveles))
+    return resultado
+
+
+# =============================================================
+# 🧮 Función: agrupar_por_tramos_pd
+# -------------------------------------------------------------
+# ➤ Tramos por cuantiles de PD
+# ➤ Por tramo: PD media, pérdida media por impago y nº de préstamos
+# =============================================================
+def agrupar_por_tramos_pd(pd_prestamos, perdida_si_impago, n_grupos: int = 200):
+    """
+    Agrupa los préstamos en tramos de PD para la simulación binomial.
+
+    Args:
+        pd_prestamos (np.ndarray): PD por préstamo.
+        perdida_si_impago (np.ndarray): EAD x LGD por préstamo.
+        n_grupos (int): Número máximo de tramos.
+
+    Returns:
+        tuple: (pd_tramo, perdida_media_tramo, n_prestamos_tramo)
+    """
+    cortes = np.unique(np.quantile(pd_prestamos, np.linspace(0, 1, n_grupos + 1)[1:-1]))
+    tramo = np.searchsorted(cortes, pd_prestamos, side="right")
+    n = np.bincount(tramo, minlength=len(cortes) + 1)
+    presentes = n > 0
+    n = n[presentes]
+
+    pd_tramo = np.bincount(tramo, weights=pd_prestamos)[presentes] / n
+    perdida_media = np.bincount(tramo, weights=perdida_si_impago)[presentes] / n
+    return pd_tramo, perdida_media.astype(np.float32), n
+
+
+# =============================================================
+# 📐 Función: cuantiles_desde_histograma
+# -------------------------------------------------------------
+# ➤ VaR: cuantil interpolado linealmente dentro del bin
+# ➤ ES: media de la cola a partir del VaR (centros de bin)
+# =============================================================
+def cuantiles_desde_histograma(bordes, frecuencias, niveles=(0.95, 0.99, 0.999)) -> dict:
+    """
+    Calcula VaR y Expected Shortfall a partir de un histograma de pérdidas.
+
+    Args:
+        bordes (np.ndarray): Bordes de los bins (n_bins + 1).
+        frecuencias (np.ndarray): Escenarios por bin.
+        niveles (tuple): Niveles de confianza.
+
+    Returns:
+        dict: {'VaR_0.99': ..., 'ES_0.99': ..., ...}
+    """
+    total = frecuencias.sum()
+    acumulada = np.cumsum(frecuencias) / total
+    centros = (bordes[:-1] + bordes[1:]) / 2
+    resultado = {}
+
+    for nivel in niveles:
+        i = int(np.searchsorted(acumulada, nivel))
+        previa = acumulada[i - 1] if i > 0 else 0.0
+        fraccion = (nivel - previa) / max(acumulada[i] - previa, 1e-12)
+        var = bordes[i] + fraccion * (bordes[i + 1] - bordes[i])
+
+        # Cola: parte restante del bin del VaR + bins superiores
+        peso_bin = (acumulada[i] - nivel) * total
+        cola = frecuencias[i + 1:]
+        peso_cola = peso_bin + cola.sum()
+        es = ((peso_bin * (var + bordes[i + 1]) / 2 + (cola * centros[i + 1:]).sum()) / peso_cola
+              if peso_cola > 0 else var)
+
+        resultado[f"VaR_{nivel}"] = var
+        resultado[f"ES_{nivel}"] = es
+    return resultado
+
+
+# =============================================================
+# 📋 Función: resumen_simulacion
+# =============================================================
+def resumen_simulacion(resultado: dict) -> pd.DataFrame:
+    """
+    Muestra y devuelve una tabla con las métricas de riesgo de la simulación.
+    """
+    metricas = {k: v for k, v in resultado.items() if k not in ("bordes", "frecuencias")}
+    tabla = pd.DataFrame({"metrica": list(metricas), "valor": list(metricas.values())})
+    print("\n📉 Distribución de pérdidas de la cartera:")
+    print(tabla.to_string(index=False, float_format=lambda v: f"{v:,.2f}"))
+    return tabla
@@ -3,18 +3,22 @@
 # Autor: Vicente Rueda
 # =============================================================
 
+from functools import lru_cache
 from pathlib import Path
 import joblib
 import yaml
 import pandas as pd
 import sys
+from perfilado import perfilar_etapa
 
 # -------------------------------------------------------------
 # 📁 Obtener la raíz del proyecto
 # -------------------------------------------------------------
 # Detecta la raíz del proyecto buscando el archivo config/config.yaml
 # desde cualquier notebook o script, útil para construir rutas absolutas.
+# El resultado se memoriza: la búsqueda se hace una vez por proceso.
 # -------------------------------------------------------------
+@lru_cache(maxsize=None)
 def get_project_root():
     try:
         current = Path(__file__).resolve()
@@ -43,7 +47,11 @@ def configurar_entorno():
 # 📄 Cargar archivo de configuración
 # -------------------------------------------------------------
 # Carga el archivo config.yaml con rutas y parámetros del proyecto.
+# Se lee una sola vez por proceso (get_file_path lo llama en cada
+# ruta); el dict devuelto es compartido y no debe modificarse.
+# Tras editar config.yaml en una sesión: load_config.cache_clear().
 # -------------------------------------------------------------
+@lru_cache(maxsize=None)
 def load_config():
     config_path = get_project_root() / "config" / "config.yaml"
     with open(config_path, "r") as f:
@@ -66,6 +74,7 @@ def get_file_path(folder_key, filename):
 # -------------------------------------------------------------
 # Carga archivos CSV, Excel, JSON, Parquet, Feather según extensión desde la ruta construida.
 # -------------------------------------------------------------
+@perfilar_etapa
 def load_data(folder_key, filename):
     file_path = get_file_path(folder_key, filename)
     ext = file_path.suffix.lower()
@@ -92,9 +101,12 @@ def load_data(folder_key, filename):
 # 📊 Verificar si hay riesgo de sobreajuste por dimensionalidad
 # -------------------------------------------------------------
 # Evalúa si la relación registros/variables es adecuada para evitar sobreajuste.
+# Acepta un DataFrame o directamente su forma (n_registros, n_variables),
+# p. ej. la que calcula data_loading.perfilar_archivo_crudo sin cargar el CSV.
 # -------------------------------------------------------------
+@perfilar_etapa
 def verificar_dimensionalidad(df, umbral=100):
-    n_registros, n_variables = df.shape
+    n_registros, n_variables = df if isinstance(df, tuple) else df.shape
     print("\n📊 Verificación de la dimensionalidad:")
     if n_registros >= n_variables * umbral:
         print(f"✅ Adecuado: {n_registros} registros ≥ {n_variables} variables x {umbral}")
@@ -107,6 +119,7 @@ def verificar_dimensionalidad(df, umbral=100):
 # -------------------------------------------------------------
 # 💾 Guardar archivo individual (PKL, CSV, JOBLIB)
 # -------------------------------------------------------------
+@perfilar_etapa
 def guardar_archivo(obj, folder_key, filename, format="pkl"):
     """
     Guarda un archivo en la carpeta indicada y formato especificado.
@@ -127,23 +140,34 @@ def guardar_archivo(obj, folder_key, filename, format="pkl"):
     else:
         raise ValueError("❌ Formato no soportado. Usa 'pkl', 'joblib' o 'csv'.")
 
-    print(f"✅ Archivo guardado en: {path.relative_to(Path.cwd().resolve().parents[0])}")
+    # Rutas fuera del proyecto (p. ej. carpetas temporales en config) se muestran completas
+    ruta = path.relative_to(get_project_root()) if path.is_relative_to(get_project_root()) else path
+    print(f"✅ Archivo guardado en: {ruta}")
 
 
 
 # -----------------------------------------------------------------
 # 💾 Guardar múltiples DataFrames en pkl y csv de forma profesional
 # -----------------------------------------------------------------
-def guardar_multiples_archivos(dataframes: dict):
+# El .pkl se registra como caché del .csv (cache.py): guarda la huella
+# del CSV y de las fuentes indicadas, de modo que eda.cargar_dataframes
+# solo lo sirve mientras siga al día.
+# -----------------------------------------------------------------
+@perfilar_etapa
+def guardar_multiples_archivos(dataframes: dict, fuentes: list = (), version: str = None):
     """
     Guarda múltiples DataFrames en formato .pkl y .csv en carpetas
     'data/cache' y 'data/processed' respectivamente.
     - dataframes: dict con estructura {'nombre': df}
+    - fuentes: archivos de origen adicionales (p. ej. el CSV raw)
+    - version: versión del proceso que genera los datos
     """
+    from cache import guardar_en_cache
+
     for nombre_df, df_obj in dataframes.items():
-        for formato, carpeta in zip(['pkl', 'csv'], ['cache', 'processed']):
-            nombre_archivo = f"{nombre_df}.{formato}"
-            guardar_archivo(df_obj, carpeta, nombre_archivo, format=formato)
+        guardar_archivo(df_obj, "processed", f"{nombre_df}.csv", format="csv")
+        ruta_csv = get_file_path("processed", f"{nombre_df}.csv")
+        guardar_en_cache(df_obj, f"{nombre_df}.pkl", [ruta_csv, *fuentes], version)
 
 
 
@@ -171,6 +195,7 @@ def guardar_multiples_archivos(dataframes: dict):
 # 📌 Aquí define que hace la función:
 # Guarda un objeto Python en la carpeta cache con formato .pkl o .joblib
 # -------------------------------------------------------------
+@perfilar_etapa
 def save_object(obj, filename, format="pkl"):
     from pathlib import Path
 
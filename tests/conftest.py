@@ -0,0 +1,13 @@
+# =============================================================
+# 🧪 tests/conftest.py — Configuración común de pytest
+# -------------------------------------------------------------
+# Los módulos de src/ se importan como módulos de primer nivel
+# (`from utils import ...`), igual que desde los notebooks.
+# =============================================================
+
+import sys
+from pathlib import Path
+
+RUTA_SRC = str(Path(__file__).resolve().parents[1] / "src")
+if RUTA_SRC not in sys.path:
+    sys.path.insert(0, RUTA_SRC)
@@ -0,0 +1,79 @@
+# =============================================================
+# 🧪 tests/test_explicaciones.py — Códigos de motivo
+# -------------------------------------------------------------
+# Con el modelo desplegado (Pipeline ColumnTransformer + HGB del
+# notebook 05) los motivos deben ser variables de origen, no columnas
+# transformadas, y la PD debe coincidir con predict_proba.
+# =============================================================
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.compose import ColumnTransformer
+from sklearn.ensemble import HistGradientBoostingClassifier
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import OneHotEncoder, StandardScaler
+
+from explicaciones import codigos_motivo, contribuciones_por_variable
+from importancia_variables import importancia_contribuciones
+
+VARIABLES_NUMERICAS = ["ingresos", "principal", "num_cuotas", "antiguedad_empleo", "rating_ord", "dti"]
+VARIABLES_CATEGORICAS = ["empleo_reducido", "finalidad_reducida"]
+
+
+@pytest.fixture(scope="module")
+def pipeline_y_datos():
+    rng = np.random.default_rng(0)
+    n = 4_000
+    X = pd.DataFrame({
+        "ingresos": rng.lognormal(11, 0.5, n),
+        "principal": rng.uniform(1_000, 40_000, n),
+        "num_cuotas": rng.choice([36, 60], n),
+        "antiguedad_empleo": rng.integers(0, 11, n),
+        "rating_ord": rng.integers(0, 7, n),
+        "dti": rng.gamma(3, 6, n),
+        "empleo_reducido": rng.choice(["BASICO", "PROFESIONAL", "AUTONOMO", "OTRO"], n),
+        "finalidad_reducida": rng.choice(["consolidacion", "credito", "hogar", "negocio", "otros"], n),
+    })
+    logit = -2.5 + 0.4 * X["rating_ord"] + 0.03 * X["dti"] + 0.8 * (X["empleo_reducido"] == "BASICO")
+    y = (rng.random(n) < 1 / (1 + np.exp(-logit))).astype(int)
+
+    # Misma estructura que el modelo ligero del notebook 05
+    preprocesado = ColumnTransformer([
+        ("num", StandardScaler(), VARIABLES_NUMERICAS),
+        ("cat", OneHotEncoder(drop="first"), VARIABLES_CATEGORICAS),
+    ])
+    pipe = Pipeline([
+        ("prep", preprocesado),
+        ("model", HistGradientBoostingClassifier(max_iter=40, random_state=42)),
+    ]).fit(X, y)
+    return pipe, X
+
+
+def test_contribuciones_agrupadas_por_variable_de_origen(pipeline_y_datos):
+    pipe, X = pipeline_y_datos
+    aportes, base, variables = contribuciones_por_variable(pipe, X.head(500))
+
+    assert sorted(variables) == sorted(VARIABLES_NUMERICAS + VARIABLES_CATEGORICAS)
+    np.testing.assert_allclose(
+        base + aportes.sum(axis=1), pipe.decision_function(X.head(500)), rtol=1e-9, atol=1e-9
+    )
+
+
+def test_codigos_motivo_con_pipeline(pipeline_y_datos):
+    pipe, X = pipeline_y_datos
+    codigos = codigos_motivo(pipe, X, k=3)
+
+    origen = set(VARIABLES_NUMERICAS + VARIABLES_CATEGORICAS)
+    for i in range(1, 4):
+        motivos = set(codigos[f"motivo_{i}"].dropna())
+        assert motivos <= origen, motivos - origen
+    assert "empleo_reducido" in set(codigos["motivo_1"])
+    np.testing.assert_allclose(codigos["PD"], pipe.predict_proba(X)[:, 1], rtol=1e-9)
+
+
+def test_importancia_contribuciones_con_pipeline(pipeline_y_datos):
+    pipe, X = pipeline_y_datos
+    importancia = importancia_contribuciones(pipe, X)
+
+    assert set(importancia["variable"]) == set(VARIABLES_NUMERICAS + VARIABLES_CATEGORICAS)
@@ -0,0 +1,82 @@
+# =============================================================
+# 🧪 tests/test_limpieza_polars.py — Conformidad pandas / Polars
+# -------------------------------------------------------------
+# Los dos motores de limpieza deben producir la misma tabla y las
+# mismas categorías poco frecuentes, tanto desde un DataFrame como
+# desde el CSV (inferencia de tipos de cada lector), con duplicados
+# exactos y nulos en variables numéricas y categóricas.
+# =============================================================
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("polars")
+pytest.importorskip("pyarrow")
+pytest.importorskip("janitor")
+
+import utils
+from data_cleaning import limpiar_prestamos
+from datos_sinteticos import generar_prestamos_sinteticos
+
+
+@pytest.fixture(scope="module")
+def prestamos_crudos():
+    df = generar_prestamos_sinteticos(3_000, semilla=7)
+    rng = np.random.default_rng(7)
+
+    # Nulos adicionales en columnas numéricas y de texto
+    for columna in ["ingresos", "dti", "num_hipotecas", "empleo", "vivienda", "antigüedad_empleo"]:
+        nulo = np.nan if pd.api.types.is_numeric_dtype(df[columna]) else None
+        df.loc[rng.random(len(df)) < 0.05, columna] = nulo
+
+    # Duplicados exactos repartidos por la tabla
+    duplicados = df.sample(150, random_state=7)
+    return pd.concat([df, duplicados]).sample(frac=1, random_state=7).reset_index(drop=True)
+
+
+@pytest.fixture
+def carpeta_raw(tmp_path, monkeypatch):
+    # data/raw apunta a un directorio temporal: el test no escribe en el proyecto
+    config = utils.load_config()
+    config["paths"] = {**config["paths"], "raw": str(tmp_path)}
+    monkeypatch.setattr(utils, "load_config", lambda: config)
+    return tmp_path
+
+
+def _limpiar_ambos(origen, conservar_ids):
+    df_pandas, atip_pandas = limpiar_prestamos(origen, "raw", "pandas", conservar_ids)
+    df_polars, atip_polars = limpiar_prestamos(origen, "raw", "polars", conservar_ids)
+    return df_pandas, df_polars, atip_pandas, atip_polars
+
+
+def _comprobar_iguales(df_pandas, df_polars, atip_pandas, atip_polars):
+    # Se comparan valores: los enteros con nulos de pandas son float64
+    pd.testing.assert_frame_equal(
+        df_pandas.reset_index(drop=True),
+        df_polars.reset_index(drop=True),
+        check_dtype=False,
+        check_exact=False,
+        rtol=1e-12,
+    )
+    assert {c: sorted(v) for c, v in atip_pandas.items()} == {c: sorted(v) for c, v in atip_polars.items()}
+
+
+@pytest.mark.parametrize("conservar_ids", [False, True])
+def test_conformidad_desde_dataframe(prestamos_crudos, conservar_ids):
+    df_pandas, df_polars, atip_pandas, atip_polars = _limpiar_ambos(prestamos_crudos.copy(), conservar_ids)
+
+    assert len(df_pandas) == len(prestamos_crudos.drop_duplicates())    # duplicados eliminados
+    _comprobar_iguales(df_pandas, df_polars, atip_pandas, atip_polars)
+
+
+@pytest.mark.parametrize("conservar_ids", [False, True])
+def test_conformidad_desde_csv(prestamos_crudos, carpeta_raw, conservar_ids):
+    prestamos_crudos.to_csv(carpeta_raw / "prestamos.csv", index=False)
+
+    _comprobar_iguales(*_limpiar_ambos("prestamos.csv", conservar_ids))
+
+
+def test_motor_desconocido(prestamos_crudos):
+    with pytest.raises(ValueError):
+        limpiar_prestamos(prestamos_crudos, motor="spark")
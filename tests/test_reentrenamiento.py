@@ -0,0 +1,85 @@
+# =============================================================
+# 🧪 tests/test_reentrenamiento.py — Refresco mensual incremental
+# -------------------------------------------------------------
+# El modelo desplegado es el Pipeline del notebook 05 importado con
+# importar_artefacto: actualizacion_mensual debe reutilizar su
+# preprocesado sin reajustarlo, ampliar solo el HGB final y registrar
+# de nuevo un Pipeline completo.
+# =============================================================
+
+import joblib
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.compose import ColumnTransformer
+from sklearn.ensemble import HistGradientBoostingClassifier, RandomForestClassifier
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import OneHotEncoder, StandardScaler
+
+import utils
+from registro_modelos import cargar_modelo, importar_artefacto, version_actual
+from reentrenamiento import actualizacion_mensual
+
+VARIABLES_NUMERICAS = ["ingresos", "rating_ord", "dti"]
+VARIABLES_CATEGORICAS = ["empleo_reducido"]
+
+
+def _prestamos(n, semilla):
+    rng = np.random.default_rng(semilla)
+    df = pd.DataFrame({
+        "ingresos": rng.lognormal(11, 0.5, n),
+        "rating_ord": rng.integers(0, 7, n),
+        "dti": rng.gamma(3, 6, n),
+        "empleo_reducido": rng.choice(["BASICO", "PROFESIONAL", "AUTONOMO"], n),
+    })
+    logit = -2.5 + 0.4 * df["rating_ord"] + 0.03 * df["dti"] + 0.8 * (df["empleo_reducido"] == "BASICO")
+    df["target"] = (rng.random(n) < 1 / (1 + np.exp(-logit))).astype(int)
+    return df
+
+
+@pytest.fixture
+def carpeta_modelos(tmp_path, monkeypatch):
+    # outputs/models apunta a un directorio temporal: el test no escribe en el proyecto
+    config = utils.load_config()
+    config["paths"] = {**config["paths"], "models": str(tmp_path / "models")}
+    monkeypatch.setattr(utils, "load_config", lambda: config)
+    return tmp_path
+
+
+def _importar(carpeta, estimador, historico):
+    pipe = Pipeline([
+        ("prep", ColumnTransformer([
+            ("num", StandardScaler(), VARIABLES_NUMERICAS),
+            ("cat", OneHotEncoder(drop="first"), VARIABLES_CATEGORICAS),
+        ])),
+        ("model", estimador),
+    ]).fit(historico.drop(columns="target"), historico["target"])
+    ruta_pkl = carpeta / "modelo.pkl"
+    joblib.dump(pipe, ruta_pkl)
+    importar_artefacto("pd_test", ruta_pkl, metadatos={"metricas": {"auc_holdout": 0.5}})
+    return pipe
+
+
+def test_actualizacion_mensual_con_pipeline(carpeta_modelos):
+    historico, nuevos, holdout = _prestamos(3_000, 0), _prestamos(1_000, 1), _prestamos(1_000, 2)
+    pipe = _importar(carpeta_modelos, HistGradientBoostingClassifier(max_iter=30, random_state=42), historico)
+
+    resultado = actualizacion_mensual(
+        "pd_test", nuevos, holdout.drop(columns="target"), holdout["target"], iteraciones_nuevas=10
+    )
+
+    assert resultado["promover"] and version_actual("pd_test") == resultado["version"]
+    nuevo = cargar_modelo("pd_test", mmap_mode=None, registrar_metricas=False)["modelo"]
+    assert isinstance(nuevo, Pipeline)
+    assert nuevo[-1].n_iter_ > pipe[-1].n_iter_
+    # El preprocesado no se reajusta con los préstamos nuevos
+    X = holdout.drop(columns="target")
+    np.testing.assert_array_equal(nuevo[:-1].transform(X), pipe[:-1].transform(X))
+
+
+def test_actualizacion_mensual_estimador_no_soportado(carpeta_modelos):
+    historico, nuevos = _prestamos(500, 0), _prestamos(200, 1)
+    _importar(carpeta_modelos, RandomForestClassifier(n_estimators=5, random_state=42), historico)
+
+    with pytest.raises(ValueError, match="RandomForestClassifier"):
+        actualizacion_mensual("pd_test", nuevos, nuevos.drop(columns="target"), nuevos["target"])